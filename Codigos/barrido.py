@@ -0,0 +1,92 @@
+"""
+Barrido de parámetros: compara algoritmos y valores de quantum sobre las
+mismas cargas de trabajo repartiendo cada combinación (algoritmo, quantum,
+carga) entre varios procesos del sistema operativo.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import os
+
+from core import ALGORITMOS, ALGORITMOS_CON_QUANTUM, Planificador, TablaProcesos
+from cache import CacheResultados
+from cargas import leer_carga
+
+COLUMNAS_BARRIDO = ["carga", "algoritmo", "quantum", "procesos", "T_promedio", "Te_promedio", "I_promedio"]
+
+
+def combinaciones(cargas, algoritmos=ALGORITMOS, quantums=(2,)):
+    """
+    Genera las combinaciones (carga, algoritmo, quantum) a simular. El quantum
+    solo afecta a los algoritmos de 'ALGORITMOS_CON_QUANTUM' (Round Robin y
+    MLFQ), así que el resto se ejecuta una única vez por carga (con quantum None).
+    """
+    for carga in cargas:
+        for algoritmo in algoritmos:
+            if algoritmo in ALGORITMOS_CON_QUANTUM:
+                for quantum in quantums:
+                    yield carga, algoritmo, quantum
+            else:
+                yield carga, algoritmo, None
+
+
+@lru_cache(maxsize=16)
+def _leer_carga_en_trabajador(ruta):
+    # Cada proceso del pool lee una carga una sola vez aunque le toquen varias combinaciones
+    return leer_carga(ruta)
+
+
+@lru_cache(maxsize=4)
+def _cache_en_trabajador(directorio):
+    # Una caché por proceso del pool; comparten el directorio en disco
+    return CacheResultados(directorio=directorio)
+
+
+def resumir(estadisticas, agregados):
+    """Promedios de retorno (T), espera (Te) e índice de servicio (I) de una ejecución."""
+    return {
+        "procesos": len(estadisticas),
+        "T_promedio": round(agregados["T_promedio"], 4),
+        "Te_promedio": round(agregados["Te_promedio"], 4),
+        "I_promedio": round(agregados["I_promedio"], 4),
+    }
+
+
+def simular_combinacion(carga, algoritmo, quantum, limite_tiempo=None, directorio_cache=None):
+    """
+    Ejecuta una combinación y devuelve su fila de la tabla comparativa. Con
+    'directorio_cache' los resultados se reutilizan entre barridos.
+    """
+    tabla = carga if isinstance(carga, TablaProcesos) else _leer_carga_en_trabajador(carga)
+    planificador = Planificador(tabla, algoritmo, quantum or 1, limite_tiempo)
+    if directorio_cache:
+        # El barrido solo usa los agregados: se guarda sin cronograma
+        resultado = _cache_en_trabajador(directorio_cache).simular(planificador, con_cronograma=False)
+        estadisticas, agregados = resultado.estadisticas, resultado.agregados
+    else:
+        estadisticas = planificador.ejecutar_completa(columnar=True)
+        agregados = estadisticas.agregados
+    nombre = carga if isinstance(carga, str) else ""
+    return {"carga": nombre, "algoritmo": algoritmo, "quantum": quantum, **resumir(estadisticas, agregados)}
+
+
+def ejecutar_barrido(cargas, algoritmos=ALGORITMOS, quantums=(2,), limite_tiempo=None, procesos=None,
+                     directorio_cache=None):
+    """
+    Simula todas las combinaciones en un pool de 'procesos' trabajadores (por
+    defecto, uno por núcleo) y devuelve la tabla comparativa como lista de
+    filas, en el mismo orden en que se generan las combinaciones.
+
+    'cargas' puede contener rutas de archivo (cada trabajador las lee) o
+    'TablaProcesos' ya construidas. Con 'directorio_cache' cada combinación
+    ya simulada (misma carga y parámetros) se recupera de disco.
+    """
+    trabajos = list(combinaciones(cargas, algoritmos, quantums))
+    if not trabajos:
+        return []
+    procesos = min(procesos or os.cpu_count() or 1, len(trabajos))
+    if procesos == 1:
+        return [simular_combinacion(c, a, q, limite_tiempo, directorio_cache) for c, a, q in trabajos]
+
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = [pool.submit(simular_combinacion, c, a, q, limite_tiempo, directorio_cache) for c, a, q in trabajos]
+        return [futuro.result() for futuro in futuros]
@@ -0,0 +1,240 @@
+"""
+Banco de pruebas de rendimiento del motor de planificación (sin GUI).
+
+Para cada algoritmo, tamaño y forma de carga mide:
+  - setup_s: construcción del 'Planificador' a partir de objetos 'Proceso'
+  - ticks_por_s: pasos por segundo de 'ejecutar_simulacion' (modo delta)
+  - eventos_por_s: eventos por segundo del motor por eventos
+  - memoria_pico_mb: memoria máxima reservada (tracemalloc) al construir y simular
+
+Los resultados se escriben en JSON y se pueden comparar con una línea base
+guardada para detectar regresiones. 'benchmark_base.json', junto a este
+archivo, es la línea base del repositorio y se usa si '--baseline' no lleva
+ruta:
+
+    python Codigos/benchmark.py --guardar-baseline base.json
+    python Codigos/benchmark.py --baseline base.json --tolerancia 0.25
+    python Codigos/benchmark.py --tamanos 1000 --baseline
+
+Una métrica solo cuenta como regresión si empeora más que la tolerancia
+relativa y además más que una diferencia mínima absoluta (milisegundos o
+megabytes), y si se repite al volver a medir el caso con más repeticiones.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from core import ALGORITMOS, MotorEventos, Planificador, Proceso
+from generador import generar_procesos
+
+# Formas de carga: parámetros de 'generar_procesos' (utilización cercana al 85 %)
+FORMAS = {
+    "exponencial": {"rafagas": "exponencial", "rafaga_media": 8.0},
+    "bimodal": {"rafagas": "bimodal", "rafaga_corta": 2.0, "rafaga_larga": 40.0, "proporcion_cortas": 0.85},
+    "pareto": {"rafagas": "pareto", "rafaga_media": 8.0, "alfa": 1.8},
+    "rafagas": {"rafagas": "exponencial", "rafaga_media": 8.0, "fases": [(200, 4.0), (600, 0.1)]},
+}
+TASA_LLEGADA = 0.1
+QUANTUM = 4
+METRICAS_MAYOR_ES_MEJOR = ("ticks_por_s", "eventos_por_s")
+METRICAS_MENOR_ES_MEJOR = ("setup_s", "memoria_pico_mb")
+# Por debajo de estas diferencias el cambio es ruido de medida, no regresión
+DIFERENCIA_MINIMA_S = 0.005
+DIFERENCIA_MINIMA_MB = 0.5
+# Cada medida se repite hasta sumar al menos este tiempo
+TIEMPO_MINIMO_S = 0.2
+# Al confirmar una regresión, el caso se vuelve a medir con N veces más repeticiones
+FACTOR_CONFIRMACION = 3
+LINEA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_base.json")
+
+
+def _procesos(tamano, forma, semilla):
+    return [Proceso(pid, f"Proceso {pid}", rafaga, llegada)
+            for pid, _, rafaga, llegada in generar_procesos(tamano, semilla, tasa_llegada=TASA_LLEGADA, **FORMAS[forma])]
+
+
+def _cronometrar(funcion, repeticiones):
+    """
+    Mejor tiempo de al menos 'repeticiones' llamadas y el valor devuelto por
+    la última. Las medidas cortas se repiten hasta sumar TIEMPO_MINIMO_S para
+    que una racha de ruido del sistema no decida el resultado.
+    """
+    mejor = float("inf")
+    total = 0.0
+    hechas = 0
+    while hechas < repeticiones or total < TIEMPO_MINIMO_S:
+        inicio = time.perf_counter()
+        valor = funcion()
+        duracion = time.perf_counter() - inicio
+        mejor = min(mejor, duracion)
+        total += duracion
+        hechas += 1
+    return mejor, valor
+
+
+def _contar_ticks(planificador):
+    ticks = 0
+    for _ in planificador.ejecutar_simulacion(modo_delta=True):
+        ticks += 1
+    return ticks
+
+
+def _contar_eventos(planificador):
+    motor = MotorEventos(planificador.tabla, planificador.algoritmo, planificador.quantum, planificador.limite_tiempo)
+    eventos = 0
+    while not motor.terminado():
+        motor.avanzar()
+        eventos += 1
+    return eventos
+
+
+def medir(algoritmo, tamano, forma, repeticiones=3, semilla=1, medir_ticks=True):
+    """Mide un caso y devuelve su fila de resultados."""
+    procesos = _procesos(tamano, forma, semilla)
+    setup_s, planificador = _cronometrar(lambda: Planificador(procesos, algoritmo, QUANTUM, None), repeticiones)
+    eventos_s, eventos = _cronometrar(lambda: _contar_eventos(planificador), repeticiones)
+    fila = {
+        "algoritmo": algoritmo, "tamano": tamano, "forma": forma,
+        "setup_s": setup_s,
+        "eventos": eventos, "eventos_por_s": eventos / eventos_s if eventos_s > 0 else 0.0,
+    }
+    if medir_ticks:
+        ticks_s, ticks = _cronometrar(lambda: _contar_ticks(planificador), repeticiones)
+        fila["ticks"] = ticks
+        fila["ticks_por_s"] = ticks / ticks_s if ticks_s > 0 else 0.0
+
+    # La memoria se mide aparte: tracemalloc ralentiza y falsearía los tiempos
+    tracemalloc.start()
+    try:
+        _contar_eventos(Planificador(procesos, algoritmo, QUANTUM, None))
+        fila["memoria_pico_mb"] = tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+    return fila
+
+
+def ejecutar_banco(algoritmos, tamanos, formas, repeticiones=3, max_ticks_tamano=None, progreso=None):
+    """Ejecuta todos los casos. Los ticks solo se miden hasta 'max_ticks_tamano' procesos."""
+    resultados = []
+    for tamano in tamanos:
+        for forma in formas:
+            for algoritmo in algoritmos:
+                medir_ticks = max_ticks_tamano is None or tamano <= max_ticks_tamano
+                fila = medir(algoritmo, tamano, forma, repeticiones, medir_ticks=medir_ticks)
+                resultados.append(fila)
+                if progreso:
+                    progreso(fila)
+    return {
+        "entorno": {"python": platform.python_version(), "implementacion": platform.python_implementation(),
+                    "sistema": platform.platform(), "procesador": platform.processor()},
+        "resultados": resultados,
+    }
+
+
+def _diferencia_absoluta(metrica, fila, previa):
+    """
+    Empeoramiento absoluto de 'metrica': megabytes para la memoria y segundos
+    para el resto (las velocidades se pasan a la duración de la medida).
+    """
+    if metrica in METRICAS_MAYOR_ES_MEJOR:
+        cantidad = fila["ticks" if metrica == "ticks_por_s" else "eventos"]
+        duracion = lambda f: cantidad / f[metrica] if f[metrica] > 0 else float("inf")
+        return duracion(fila) - duracion(previa)
+    return fila[metrica] - previa[metrica]
+
+
+def comparar(actual, base, tolerancia, minimo_s=DIFERENCIA_MINIMA_S, minimo_mb=DIFERENCIA_MINIMA_MB):
+    """
+    Compara dos informes y devuelve la lista de regresiones: métricas de
+    velocidad que caen, o de tiempo/memoria que suben, más de 'tolerancia'
+    (fracción) respecto a la línea base y a la vez más de 'minimo_s'
+    segundos (o 'minimo_mb' megabytes en la memoria).
+    """
+    clave = lambda f: (f["algoritmo"], f["tamano"], f["forma"])
+    referencia = {clave(f): f for f in base["resultados"]}
+    regresiones = []
+    for fila in actual["resultados"]:
+        previa = referencia.get(clave(fila))
+        if previa is None:
+            continue
+        for metrica in METRICAS_MAYOR_ES_MEJOR + METRICAS_MENOR_ES_MEJOR:
+            if metrica not in fila or not previa.get(metrica):
+                continue
+            cambio = (fila[metrica] - previa[metrica]) / previa[metrica]
+            peor = -cambio if metrica in METRICAS_MAYOR_ES_MEJOR else cambio
+            minimo = minimo_mb if metrica == "memoria_pico_mb" else minimo_s
+            if peor > tolerancia and _diferencia_absoluta(metrica, fila, previa) > minimo:
+                regresiones.append({"caso": clave(fila), "metrica": metrica, "base": previa[metrica],
+                                    "actual": fila[metrica], "cambio": round(cambio, 4)})
+    return regresiones
+
+
+def confirmar(regresiones, base, tolerancia, repeticiones, minimo_s=DIFERENCIA_MINIMA_S, minimo_mb=DIFERENCIA_MINIMA_MB):
+    """
+    Vuelve a medir los casos con regresiones usando FACTOR_CONFIRMACION
+    veces más repeticiones y devuelve solo las que se mantienen.
+    """
+    casos = sorted({r["caso"] for r in regresiones})
+    filas = []
+    for algoritmo, tamano, forma in casos:
+        medir_ticks = any(r["caso"] == (algoritmo, tamano, forma) and r["metrica"] == "ticks_por_s" for r in regresiones)
+        filas.append(medir(algoritmo, tamano, forma, repeticiones * FACTOR_CONFIRMACION, medir_ticks=medir_ticks))
+    pendientes = {(r["caso"], r["metrica"]) for r in regresiones}
+    return [r for r in comparar({"resultados": filas}, base, tolerancia, minimo_s, minimo_mb)
+            if (r["caso"], r["metrica"]) in pendientes]
+
+
+def _describir(fila):
+    ticks = f"{fila['ticks_por_s']:>12,.0f} ticks/s" if "ticks_por_s" in fila else f"{'-':>12} ticks/s"
+    return (f"{fila['algoritmo']:<12} n={fila['tamano']:<8} {fila['forma']:<12} setup {fila['setup_s'] * 1000:8.1f} ms"
+            f"  {ticks}  {fila['eventos_por_s']:>12,.0f} eventos/s  {fila['memoria_pico_mb']:7.1f} MB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banco de pruebas del motor de planificación.")
+    parser.add_argument("--algoritmos", nargs="+", choices=ALGORITMOS, default=list(ALGORITMOS))
+    parser.add_argument("--tamanos", nargs="+", type=int, default=[1000, 10000], help="Número de procesos por carga.")
+    parser.add_argument("--formas", nargs="+", choices=sorted(FORMAS), default=sorted(FORMAS))
+    parser.add_argument("--repeticiones", type=int, default=3, help="Se toma el mejor tiempo de N repeticiones.")
+    parser.add_argument("--max-ticks-tamano", type=int, default=10000,
+                        help="Tamaño máximo para medir el motor por ticks (es mucho más lento).")
+    parser.add_argument("--salida", "-o", default=None, help="Escribe los resultados en este archivo JSON.")
+    parser.add_argument("--guardar-baseline", metavar="ARCHIVO", default=None, help="Guarda los resultados como línea base.")
+    parser.add_argument("--baseline", metavar="ARCHIVO", nargs="?", const=LINEA_BASE, default=None,
+                        help="Compara contra esta línea base (sin ruta, la del repositorio).")
+    parser.add_argument("--tolerancia", type=float, default=0.2, help="Empeoramiento relativo admitido (por defecto 0.2).")
+    parser.add_argument("--minimo-ms", type=float, default=DIFERENCIA_MINIMA_S * 1000,
+                        help="Diferencia absoluta mínima, en milisegundos, para contar una regresión de tiempo.")
+    parser.add_argument("--minimo-mb", type=float, default=DIFERENCIA_MINIMA_MB,
+                        help="Diferencia absoluta mínima, en MB, para contar una regresión de memoria.")
+    args = parser.parse_args(argv)
+
+    informe = ejecutar_banco(args.algoritmos, args.tamanos, args.formas, args.repeticiones, args.max_ticks_tamano,
+                             progreso=lambda fila: print(_describir(fila), file=sys.stderr))
+    for ruta in (args.salida, args.guardar_baseline):
+        if ruta:
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                json.dump(informe, archivo, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        minimos = (args.minimo_ms / 1000, args.minimo_mb)
+        regresiones = comparar(informe, base, args.tolerancia, *minimos)
+        if regresiones:
+            print(f"Confirmando {len(regresiones)} posibles regresiones...", file=sys.stderr)
+            regresiones = confirmar(regresiones, base, args.tolerancia, args.repeticiones, *minimos)
+        for r in regresiones:
+            print(f"REGRESIÓN {r['caso']} {r['metrica']}: {r['base']:.4g} -> {r['actual']:.4g} ({r['cambio']:+.1%})", file=sys.stderr)
+        if regresiones:
+            return 1
+        print("Sin regresiones respecto a la línea base.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Caché de resultados de simulación. Cada resultado (estadísticas, agregados
+y cronograma por tramos) se guarda bajo una huella SHA-256 del contenido de
+la carga y de los parámetros que afectan al resultado ('algoritmo',
+'quantum' y 'limite_tiempo'). La caché en memoria es un LRU acotado y,
+opcionalmente, se respalda en un directorio en disco para reutilizar
+resultados entre ejecuciones del programa.
+"""
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from core import ALGORITMOS_CON_QUANTUM
+from cronograma import AlmacenCronograma, ErrorCronograma
+
+VERSION_CACHE = 2
+
+
+def huella(planificador):
+    """Huella del resultado de 'planificador': igual contenido y parámetros producen la misma huella."""
+    tabla = planificador.tabla
+    quantum = planificador.quantum if planificador.algoritmo in ALGORITMOS_CON_QUANTUM else None
+    h = hashlib.sha256()
+    parametros = [VERSION_CACHE, planificador.algoritmo, quantum, planificador.limite_tiempo, len(tabla)]
+    h.update(json.dumps(parametros).encode("utf-8"))
+    for columna in (tabla.pids, tabla.llegadas, tabla.rafagas, tabla.prioridades):
+        h.update(columna.tobytes())
+    for nombre in tabla.nombres:
+        # None (nombre por defecto) se distingue de cualquier texto
+        h.update(b"\x01" if nombre is None else nombre.encode("utf-8") + b"\x00")
+    return h.hexdigest()
+
+
+def clave_estadisticas(clave):
+    """Clave con la que se guarda un resultado sin cronograma de la huella 'clave'."""
+    return f"{clave}.estadisticas"
+
+
+class ResultadoSimulacion:
+    """
+    Resultado de una ejecución: estadísticas por pid, agregados y cronograma
+    (None si se calculó sin él).
+    """
+    def __init__(self, estadisticas, agregados, cronograma):
+        self.estadisticas = estadisticas
+        self.agregados = agregados
+        self.cronograma = cronograma
+
+    @classmethod
+    def calcular(cls, planificador, con_cronograma=True):
+        """
+        Simula por eventos y reúne el resultado. Sin cronograma es mucho más
+        barato: con colas largas, registrar la posición de cada proceso en la
+        cola cuesta más que la simulación.
+        """
+        if not con_cronograma:
+            estadisticas = planificador.ejecutar_completa(columnar=True)
+            return cls(estadisticas.como_dict(), estadisticas.agregados, None)
+        cronograma, estadisticas = planificador.ejecutar_cronograma()
+        return cls(estadisticas, planificador.estadisticas_columnares().agregados, cronograma)
+
+    def a_dict(self):
+        return {
+            "estadisticas": [[pid, datos] for pid, datos in self.estadisticas.items()],
+            "agregados": self.agregados,
+            "cronograma": self.cronograma.a_dict() if self.cronograma is not None else None,
+        }
+
+    @classmethod
+    def desde_dict(cls, datos):
+        estadisticas = {pid: valores for pid, valores in datos["estadisticas"]}
+        cronograma = datos["cronograma"]
+        return cls(estadisticas, datos["agregados"],
+                   AlmacenCronograma.desde_dict(cronograma) if cronograma is not None else None)
+
+
+class CacheResultados:
+    """
+    Caché LRU de 'ResultadoSimulacion' con hasta 'capacidad' entradas en
+    memoria. Si se indica 'directorio', cada resultado se guarda también en
+    '<directorio>/<huella>.json' y se recupera de ahí cuando no está en
+    memoria. Los resultados devueltos se comparten: no deben modificarse.
+    """
+    def __init__(self, capacidad=128, directorio=None):
+        self.capacidad = capacidad
+        self.directorio = directorio
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()
+        self._candado = threading.Lock()
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, f"{clave}.json")
+
+    def obtener(self, clave):
+        """Devuelve el resultado guardado bajo 'clave' o None."""
+        with self._candado:
+            resultado = self._entradas.get(clave)
+            if resultado is not None:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return resultado
+        resultado = self._leer_disco(clave)
+        with self._candado:
+            if resultado is None:
+                self.fallos += 1
+            else:
+                self.aciertos += 1
+                self._insertar(clave, resultado)
+        return resultado
+
+    def guardar(self, clave, resultado):
+        """Guarda el resultado en memoria y, si hay directorio, en disco."""
+        with self._candado:
+            self._insertar(clave, resultado)
+        if self.directorio:
+            self._escribir_disco(clave, resultado)
+
+    def simular(self, planificador, con_cronograma=True):
+        """
+        Devuelve el resultado de 'planificador', simulando solo si no está en
+        la caché. Con 'con_cronograma=False' basta con las estadísticas: sirve
+        un resultado completo ya guardado y, si no lo hay, se calcula y guarda
+        solo las estadísticas (bajo otra clave, ver 'clave_estadisticas').
+        """
+        clave = huella(planificador)
+        resultado = self.obtener(clave)
+        if resultado is None and not con_cronograma:
+            resultado = self.obtener(clave_estadisticas(clave))
+            if resultado is None:
+                resultado = ResultadoSimulacion.calcular(planificador, con_cronograma=False)
+                self.guardar(clave_estadisticas(clave), resultado)
+        elif resultado is None:
+            resultado = ResultadoSimulacion.calcular(planificador)
+            self.guardar(clave, resultado)
+        return resultado
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def _insertar(self, clave, resultado):
+        self._entradas[clave] = resultado
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.capacidad:
+            self._entradas.popitem(last=False)
+
+    def _leer_disco(self, clave):
+        if not self.directorio:
+            return None
+        try:
+            with open(self._ruta(clave), encoding="utf-8") as archivo:
+                return ResultadoSimulacion.desde_dict(json.load(archivo))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, ErrorCronograma):
+            # Una entrada dañada se trata como ausente y se recalcula
+            return None
+
+    def _escribir_disco(self, clave, resultado):
+        # Escritura atómica: otro proceso nunca ve un archivo a medio escribir
+        descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as archivo:
+                # 'dumps' usa el codificador en C; 'dump' codifica por fragmentos en Python y es varias veces más lento
+                archivo.write(json.dumps(resultado.a_dict(), ensure_ascii=False, separators=(",", ":")))
+            os.replace(temporal, self._ruta(clave))
+        except BaseException:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            raise
@@ -0,0 +1,153 @@
+"""
+Lectura de cargas de trabajo (listas de procesos) desde archivos CSV,
+JSON Lines (.jsonl) o JSON (.json, una lista de objetos). Solo depende de 'core', así que puede usarse sin interfaz gráfica.
+
+Cada proceso tiene los campos 'llegada' y 'tiempo_cpu'; 'pid', 'nombre' y
+'prioridad' son opcionales (si falta el pid se numera de forma consecutiva,
+si falta el nombre se usa "Proceso <pid>" y la prioridad por defecto es 0).
+"""
+import csv
+import json
+import os
+
+from core import TablaProcesos
+
+
+# Mayor valor que cabe en las columnas de 'TablaProcesos' (enteros de 64 bits)
+MAXIMO_ENTERO = 2**63 - 1
+
+
+class ErrorCarga(ValueError):
+    """Error de formato al leer una carga de trabajo."""
+
+
+def convertir_entero(valor, campo, ubicacion, minimo):
+    """
+    Convierte 'valor' (texto de CSV o número de JSON) en un entero entre
+    'minimo' y MAXIMO_ENTERO. Los booleanos y los números con decimales no
+    se aceptan, igual que en CSV "1.5" no es un entero.
+    """
+    if isinstance(valor, bool) or (isinstance(valor, float) and not valor.is_integer()):
+        raise ErrorCarga(f"{ubicacion}: el campo '{campo}' debe ser un número entero (recibido {valor!r}).")
+    try:
+        numero = int(valor)
+    except (TypeError, ValueError):
+        raise ErrorCarga(f"{ubicacion}: el campo '{campo}' debe ser un número entero (recibido {valor!r}).") from None
+    if numero < minimo:
+        raise ErrorCarga(f"{ubicacion}: el campo '{campo}' debe ser mayor o igual que {minimo}.")
+    if numero > MAXIMO_ENTERO:
+        raise ErrorCarga(f"{ubicacion}: el campo '{campo}' no puede superar {MAXIMO_ENTERO}.")
+    return numero
+
+
+def comprobar_horizonte(ubicacion, llegada_maxima, trabajo_total):
+    """
+    Rechaza una carga cuyo último instante posible (la última llegada más
+    todo el trabajo de CPU) no cabe en las columnas de 64 bits del motor.
+    """
+    if llegada_maxima + trabajo_total > MAXIMO_ENTERO:
+        raise ErrorCarga(f"{ubicacion}: la carga terminaría después del instante {MAXIMO_ENTERO} "
+                         "(la última llegada más la suma de los tiempos de CPU).")
+
+
+def _validar_filas(filas):
+    """
+    Deja pasar las filas (ubicación, tupla) y rechaza un pid que ya apareció
+    o una carga que no cabe en enteros de 64 bits ('comprobar_horizonte').
+    """
+    vistos = set()
+    llegada_maxima = trabajo_total = 0
+    for ubicacion, fila in filas:
+        pid, _, tiempo_cpu, llegada, _ = fila
+        if pid in vistos:
+            raise ErrorCarga(f"{ubicacion}: el pid {pid} está repetido.")
+        vistos.add(pid)
+        llegada_maxima = max(llegada_maxima, llegada)
+        trabajo_total += tiempo_cpu
+        comprobar_horizonte(ubicacion, llegada_maxima, trabajo_total)
+        yield fila
+
+
+def _registro_a_fila(registro, numero, ubicacion):
+    """Convierte un registro (dict) en la tupla (pid, nombre, tiempo_cpu, llegada, prioridad)."""
+    pid = registro.get("pid")
+    pid = numero if pid in (None, "") else convertir_entero(pid, "pid", ubicacion, 0)
+    nombre = registro.get("nombre")
+    if nombre in (None, ""):
+        nombre = None
+    elif not isinstance(nombre, str):
+        raise ErrorCarga(f"{ubicacion}: el campo 'nombre' debe ser un texto (recibido {nombre!r}).")
+    tiempo_cpu = convertir_entero(registro.get("tiempo_cpu"), "tiempo_cpu", ubicacion, 1)
+    llegada = convertir_entero(registro.get("llegada"), "llegada", ubicacion, 0)
+    prioridad = registro.get("prioridad")
+    prioridad = 0 if prioridad in (None, "") else convertir_entero(prioridad, "prioridad", ubicacion, 0)
+    return pid, nombre, tiempo_cpu, llegada, prioridad
+
+
+def filas_desde_registros(registros, origen):
+    """
+    Valida una lista de procesos ya decodificada (objetos JSON) y genera sus
+    tuplas (pid, nombre, tiempo_cpu, llegada, prioridad). 'origen' aparece en
+    los mensajes de error.
+    """
+    return _validar_filas(_filas_de_lista(registros, origen))
+
+
+def _filas_de_lista(registros, origen):
+    if not isinstance(registros, list) or not all(isinstance(r, dict) for r in registros):
+        raise ErrorCarga(f"{origen}: se esperaba una lista de objetos JSON.")
+    for numero, registro in enumerate(registros, 1):
+        ubicacion = f"{origen}[{numero - 1}]"
+        yield ubicacion, _registro_a_fila(registro, numero, ubicacion)
+
+
+def leer_registros(ruta):
+    """
+    Genera, uno a uno, los procesos del archivo como tuplas (pid, nombre,
+    tiempo_cpu, llegada, prioridad). Un pid repetido es un 'ErrorCarga'.
+    """
+    return _validar_filas(_leer_filas(ruta))
+
+
+def _leer_filas(ruta):
+    """Genera las filas del archivo como (ubicación, tupla)."""
+    try:
+        yield from _leer_filas_texto(ruta)
+    except UnicodeDecodeError as e:
+        raise ErrorCarga(f"{ruta}: el archivo no está codificado en UTF-8 (byte {e.start}: {e.reason}).") from None
+    except csv.Error as e:
+        raise ErrorCarga(f"{ruta}: CSV inválido ({e}).") from None
+
+
+def _leer_filas_texto(ruta):
+    extension = os.path.splitext(ruta)[1].lower()
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        if extension == ".json":
+            # Un único documento JSON con una lista de procesos
+            try:
+                registros = json.load(archivo)
+            except json.JSONDecodeError as e:
+                raise ErrorCarga(f"{ruta}: JSON inválido ({e.msg}).") from None
+            yield from _filas_de_lista(registros, ruta)
+        elif extension in (".jsonl", ".ndjson"):
+            numero = 0
+            for linea_num, linea in enumerate(archivo, 1):
+                if not linea.strip():
+                    continue
+                ubicacion = f"{ruta}:{linea_num}"
+                try:
+                    registro = json.loads(linea)
+                except json.JSONDecodeError as e:
+                    raise ErrorCarga(f"{ubicacion}: JSON inválido ({e.msg}).") from None
+                if not isinstance(registro, dict):
+                    raise ErrorCarga(f"{ubicacion}: se esperaba un objeto JSON por línea.")
+                numero += 1
+                yield ubicacion, _registro_a_fila(registro, numero, ubicacion)
+        else:
+            for numero, registro in enumerate(csv.DictReader(archivo), 1):
+                yield f"{ruta}:{numero + 1}", _registro_a_fila(registro, numero, f"{ruta}:{numero + 1}")
+
+
+def leer_carga(ruta):
+    """Lee un archivo de carga completo y lo devuelve como 'TablaProcesos'."""
+    return TablaProcesos.desde_procesos(leer_registros(ruta))
@@ -0,0 +1,282 @@
+"""
+Ejecución por lotes del simulador desde la línea de comandos, sin interfaz
+gráfica. Solo importa 'core' (no necesita PySide6), así que sirve para CI y
+servidores sin pantalla.
+
+Ejemplo:
+    python Codigos/cli.py ejecutar cargas/*.csv --algoritmo SRTF --salida resultados.csv
+    python Codigos/cli.py ejecutar cargas/*.csv --algoritmo SRTF --nucleos 8
+    python Codigos/cli.py barrido cargas/*.csv --quantums 1 2 4 8 --procesos 8
+    python Codigos/cli.py generar 1000000 --semilla 7 --rafagas pareto --salida grande.csv
+    python Codigos/cli.py reproducir traza.trz --algoritmos FCFS SRTF MLFQ
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+from core import ALGORITMOS, Planificador
+from cargas import ErrorCarga, leer_carga
+from barrido import COLUMNAS_BARRIDO, ejecutar_barrido
+from cache import CacheResultados
+from multinucleo import PlanificadorMultinucleo
+from generador import DISTRIBUCIONES_LLEGADA, DISTRIBUCIONES_RAFAGA, generar_procesos
+from trazas import VENTANA_REORDEN, LectorTraza, escribir_traza_binaria, reproducir_traza
+
+COLUMNAS_ESTADISTICAS = ["carga", "pid", "proceso", "ti", "t", "tf", "T", "Te", "I"]
+COLUMNAS_REPRODUCCION = ["traza", "algoritmo", "quantum", "procesos", "T_promedio", "Te_promedio", "I_promedio",
+                         "throughput", "utilizacion_cpu", "segundos", "procesos_por_segundo"]
+
+
+class EscritorResultados:
+    """Escribe filas de resultados en CSV o JSON Lines a medida que se producen."""
+    def __init__(self, archivo, formato, columnas):
+        self.archivo = archivo
+        self.formato = formato
+        self.columnas = columnas
+        if formato == "csv":
+            self._csv = csv.DictWriter(archivo, fieldnames=columnas, lineterminator="\n")
+            self._csv.writeheader()
+
+    def escribir(self, fila):
+        if self.formato == "csv":
+            self._csv.writerow(fila)
+        else:
+            self.archivo.write(json.dumps(fila, ensure_ascii=False) + "\n")
+
+    def vaciar(self):
+        self.archivo.flush()
+
+
+def _abrir_salida(ruta):
+    if ruta in (None, "-"):
+        return sys.stdout
+    return open(ruta, "w", newline="", encoding="utf-8")
+
+
+def comando_ejecutar(args):
+    """Simula cada carga con el algoritmo elegido y emite las estadísticas por proceso."""
+    salida = _abrir_salida(args.salida)
+    errores = 0
+    cache = CacheResultados(directorio=args.cache) if args.cache else None
+    try:
+        escritor = EscritorResultados(salida, args.formato, COLUMNAS_ESTADISTICAS)
+        for ruta in args.cargas:
+            try:
+                tabla = leer_carga(ruta)
+            except (OSError, ErrorCarga) as e:
+                print(f"Error: {e}", file=sys.stderr)
+                errores += 1
+                continue
+            if args.nucleos > 1:
+                planificador = PlanificadorMultinucleo(tabla, args.algoritmo, args.quantum, args.limite, args.nucleos)
+            else:
+                planificador = Planificador(tabla, args.algoritmo, args.quantum, args.limite)
+            if args.nucleos > 1:
+                cronograma, filas = None, planificador.ejecutar_completa(columnar=True).filas()
+                _resumir_nucleos(ruta, planificador.estadisticas_nucleos)
+            elif cache is not None:
+                resultado = cache.simular(planificador, con_cronograma=bool(args.cronogramas))
+                cronograma, filas = resultado.cronograma, resultado.estadisticas.items()
+            elif args.cronogramas:
+                cronograma, _ = planificador.ejecutar_cronograma()
+                filas = planificador.estadisticas_columnares().filas()
+            else:
+                cronograma, filas = None, planificador.ejecutar_completa(columnar=True).filas()
+            if args.cronogramas:
+                # Guardamos también el cronograma por tramos para poder reabrirlo en la GUI
+                nombre = os.path.splitext(os.path.basename(ruta))[0] + ".crono"
+                cronograma.guardar(os.path.join(args.cronogramas, nombre))
+            for pid, datos in filas:
+                escritor.escribir({"carga": ruta, "pid": pid, **datos})
+            escritor.vaciar()
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    return 1 if errores else 0
+
+
+def _resumir_nucleos(ruta, nucleos):
+    """Muestra en la salida de errores la utilización y las migraciones de cada núcleo."""
+    print(f"{ruta}: núcleo, utilización, despachos, migraciones (entrantes/salientes), terminados", file=sys.stderr)
+    for n in nucleos:
+        print(f"  {n['nucleo']:>4} {n['utilizacion']:7.1%} {n['despachos']:>8} "
+              f"{n['migraciones_entrantes']:>6}/{n['migraciones_salientes']:<6} {n['terminados']:>8}", file=sys.stderr)
+
+
+def comando_barrido(args):
+    """Compara algoritmos y quantums sobre las cargas y emite una tabla con los promedios."""
+    try:
+        for ruta in args.cargas:
+            leer_carga(ruta)  # Validamos antes de repartir el trabajo
+    except (OSError, ErrorCarga) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    filas = ejecutar_barrido(args.cargas, args.algoritmos, args.quantums, args.limite, args.procesos, args.cache)
+    salida = _abrir_salida(args.salida)
+    try:
+        escritor = EscritorResultados(salida, args.formato, COLUMNAS_BARRIDO)
+        for fila in filas:
+            escritor.escribir(fila)
+        escritor.vaciar()
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    return 0
+
+
+def comando_reproducir(args):
+    """Reproduce cada traza con cada algoritmo sin cargarla en memoria y emite una fila de agregados por ejecución."""
+    salida = _abrir_salida(args.salida)
+    try:
+        escritor = EscritorResultados(salida, args.formato, COLUMNAS_REPRODUCCION)
+        for ruta in args.trazas:
+            for algoritmo in args.algoritmos:
+                try:
+                    lector = LectorTraza(ruta, args.ventana)
+                    agregados, procesos, segundos = reproducir_traza(lector, algoritmo, args.quantum, args.limite)
+                except (OSError, ErrorCarga) as e:
+                    print(f"Error: {e}", file=sys.stderr)
+                    return 1
+                escritor.escribir({
+                    "traza": ruta, "algoritmo": algoritmo, "quantum": args.quantum, "procesos": procesos,
+                    **{clave: round(agregados[clave], 4) for clave in COLUMNAS_REPRODUCCION[4:9]},
+                    "segundos": round(segundos, 3),
+                    "procesos_por_segundo": round(procesos / segundos if segundos > 0 else 0.0),
+                })
+                escritor.vaciar()
+                print(f"{algoritmo}: {lector.ingesta.resumen()}", file=sys.stderr)
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    return 0
+
+
+def _fase(texto):
+    """Convierte 'duracion:factor' en una tupla para '--fase'."""
+    try:
+        duracion, factor = texto.split(":")
+        return float(duracion), float(factor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"fase inválida {texto!r}; se espera 'duracion:factor'.") from None
+
+
+def comando_generar(args):
+    """Escribe una carga sintética en CSV o JSON Lines sin tenerla entera en memoria."""
+    try:
+        procesos = generar_procesos(
+            args.cantidad, args.semilla, args.llegadas, args.tasa, args.rafagas, args.rafaga_media,
+            args.rafaga_corta, args.rafaga_larga, args.proporcion_cortas, args.alfa, args.fase)
+        if args.formato == "trz":
+            # Traza binaria para 'reproducir' (ver 'trazas.py'); la prioridad queda en 0
+            escribir_traza_binaria(args.salida, ((pid, llegada, tiempo_cpu, 0) for pid, _, tiempo_cpu, llegada in procesos))
+            return 0
+        salida = _abrir_salida(args.salida)
+        try:
+            escritor = EscritorResultados(salida, args.formato, ["pid", "llegada", "tiempo_cpu"])
+            for pid, _, tiempo_cpu, llegada in procesos:
+                escritor.escribir({"pid": pid, "llegada": llegada, "tiempo_cpu": tiempo_cpu})
+            escritor.vaciar()
+        finally:
+            if salida is not sys.stdout:
+                salida.close()
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+def _agregar_opciones_simulacion(parser):
+    parser.add_argument("--limite", type=int, default=None,
+                        help="Último instante a simular (por defecto, sin límite).")
+    parser.add_argument("--salida", "-o", default="-", help="Archivo de resultados ('-' para la salida estándar).")
+    parser.add_argument("--formato", choices=["csv", "jsonl"], default="csv", help="Formato de los resultados.")
+    parser.add_argument("--cache", metavar="DIRECTORIO", default=None,
+                        help="Reutiliza resultados ya calculados guardados en este directorio.")
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Simulador de planificación de CPU sin interfaz gráfica.")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    ejecutar = subparsers.add_parser("ejecutar", help="Simula una o más cargas con un algoritmo.")
+    ejecutar.add_argument("cargas", nargs="+", help="Archivos de carga (.csv o .jsonl).")
+    ejecutar.add_argument("--algoritmo", "-a", choices=ALGORITMOS, default="FCFS", help="Algoritmo de planificación.")
+    ejecutar.add_argument("--quantum", "-q", type=int, default=2, help="Quantum de Round Robin y del primer nivel de MLFQ (por defecto 2).")
+    ejecutar.add_argument("--cronogramas", metavar="DIRECTORIO", default=None,
+                          help="Guarda además el cronograma de cada carga (<nombre>.crono) en este directorio.")
+    ejecutar.add_argument("--nucleos", "-n", type=int, default=1,
+                          help="CPU simuladas (por defecto 1); con más de una se muestran métricas por núcleo.")
+    _agregar_opciones_simulacion(ejecutar)
+    ejecutar.set_defaults(funcion=comando_ejecutar)
+
+    barrido = subparsers.add_parser("barrido", help="Compara algoritmos y quantums sobre las mismas cargas.")
+    barrido.add_argument("cargas", nargs="+", help="Archivos de carga (.csv o .jsonl).")
+    barrido.add_argument("--algoritmos", nargs="+", choices=ALGORITMOS, default=list(ALGORITMOS),
+                         help="Algoritmos a comparar (por defecto, todos).")
+    barrido.add_argument("--quantums", nargs="+", type=int, default=[2],
+                         help="Valores de quantum para Round Robin y MLFQ.")
+    barrido.add_argument("--procesos", "-j", type=int, default=None,
+                         help="Procesos trabajadores (por defecto, uno por núcleo).")
+    _agregar_opciones_simulacion(barrido)
+    barrido.set_defaults(funcion=comando_barrido)
+
+    generar = subparsers.add_parser("generar", help="Genera una carga sintética reproducible.")
+    generar.add_argument("cantidad", type=int, help="Número de procesos.")
+    generar.add_argument("--semilla", type=int, default=None, help="Semilla para reproducir la carga.")
+    generar.add_argument("--llegadas", choices=DISTRIBUCIONES_LLEGADA, default="poisson", help="Distribución de llegadas.")
+    generar.add_argument("--tasa", type=float, default=0.1, help="Llegadas por unidad de tiempo (por defecto 0.1).")
+    generar.add_argument("--rafagas", choices=DISTRIBUCIONES_RAFAGA, default="exponencial", help="Distribución de ráfagas de CPU.")
+    generar.add_argument("--rafaga-media", type=float, default=8.0, help="Ráfaga media (exponencial, pareto, constante).")
+    generar.add_argument("--rafaga-corta", type=float, default=2.0, help="Media de las ráfagas cortas (bimodal).")
+    generar.add_argument("--rafaga-larga", type=float, default=40.0, help="Media de las ráfagas largas (bimodal).")
+    generar.add_argument("--proporcion-cortas", type=float, default=0.8, help="Proporción de ráfagas cortas (bimodal).")
+    generar.add_argument("--alfa", type=float, default=1.5, help="Parámetro de forma de Pareto (> 1).")
+    generar.add_argument("--fase", type=_fase, action="append", default=None, metavar="DURACION:FACTOR",
+                         help="Fase de llegadas en ráfaga; se puede repetir y las fases se alternan cíclicamente.")
+    generar.add_argument("--salida", "-o", default="-", help="Archivo de salida ('-' para la salida estándar).")
+    generar.add_argument("--formato", choices=["csv", "jsonl", "trz"], default="csv",
+                         help="Formato de la carga ('trz': traza binaria, requiere --salida).")
+    generar.set_defaults(funcion=comando_generar)
+
+    reproducir = subparsers.add_parser("reproducir", help="Reproduce trazas grandes sin cargarlas en memoria.")
+    reproducir.add_argument("trazas", nargs="+", help="Trazas (.csv o binarias .trz).")
+    reproducir.add_argument("--algoritmos", nargs="+", choices=ALGORITMOS, default=list(ALGORITMOS),
+                            help="Algoritmos con los que se reproduce cada traza (por defecto, todos).")
+    reproducir.add_argument("--quantum", "-q", type=int, default=2, help="Quantum de Round Robin y del primer nivel de MLFQ.")
+    reproducir.add_argument("--ventana", type=int, default=VENTANA_REORDEN,
+                            help=f"Registros que se retienen para ordenar por llegada (por defecto {VENTANA_REORDEN}).")
+    reproducir.add_argument("--limite", type=int, default=None, help="Último instante a simular (por defecto, sin límite).")
+    reproducir.add_argument("--salida", "-o", default="-", help="Archivo de resultados ('-' para la salida estándar).")
+    reproducir.add_argument("--formato", choices=["csv", "jsonl"], default="csv", help="Formato de los resultados.")
+    reproducir.set_defaults(funcion=comando_reproducir)
+    return parser
+
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+    quantums = {"ejecutar": [getattr(args, "quantum", 1)], "reproducir": [getattr(args, "quantum", 1)],
+                "barrido": getattr(args, "quantums", [1])}.get(args.comando, [1])
+    if min(quantums) < 1:
+        print("Error: el quantum debe ser mayor que cero.", file=sys.stderr)
+        return 2
+    if getattr(args, "nucleos", 1) < 1:
+        print("Error: se necesita al menos un núcleo.", file=sys.stderr)
+        return 2
+    if getattr(args, "nucleos", 1) > 1 and (args.cronogramas or args.cache):
+        print("Error: --cronogramas y --cache solo admiten un núcleo.", file=sys.stderr)
+        return 2
+    if args.comando == "generar" and args.formato == "trz" and args.salida == "-":
+        print("Error: el formato trz necesita un archivo de salida (--salida).", file=sys.stderr)
+        return 2
+    if getattr(args, "ventana", 0) < 0:
+        print("Error: la ventana de reordenación no puede ser negativa.", file=sys.stderr)
+        return 2
+    if getattr(args, "cronogramas", None):
+        os.makedirs(args.cronogramas, exist_ok=True)
+    return args.funcion(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,30 @@
-from collections import deque
-import copy
+from array import array
+from time import perf_counter
+
+from cronograma import AlmacenCronograma
+from estadisticas import MetricasEnCurso, calcular_estadisticas
+from politicas import POLITICAS, Politica, crear_politica
+
+# Salvaguarda histórica del simulador: último instante que se simula.
+LIMITE_TIEMPO_POR_DEFECTO = 500
+
+# Algoritmos de planificación soportados por 'Planificador' (ver 'politicas.py').
+ALGORITMOS = tuple(POLITICAS)
+# Algoritmos cuyo resultado depende del quantum.
+ALGORITMOS_CON_QUANTUM = tuple(nombre for nombre, clase in POLITICAS.items() if clase.usa_quantum)
 
 class Proceso:
     """
     Representa un proceso con los atributos necesarios para la planificación.
     Es una estructura de datos simple.
     """
-    def __init__(self, pid, nombre, tiempo_cpu, instante_llegada):
+    __slots__ = ("pid", "nombre", "instante_llegada", "prioridad", "_tiempo_cpu_total", "tiempo_restante_cpu")
+
+    def __init__(self, pid, nombre, tiempo_cpu, instante_llegada, prioridad=0):
             self.pid = pid
             self.nombre = nombre
             self.instante_llegada = instante_llegada
+            self.prioridad = prioridad  # Solo la usa el algoritmo "Prioridad" (menor = más urgente)
             
 
             # Estas variables "privadas" almacenarán los valores reales.
@@ -38,121 +53,572 @@ class Proceso:
         self.tiempo_restante_cpu = value
 
 
+class VistaProceso:
+    """
+    Vista de solo lectura de una fila de 'TablaProcesos' con la misma
+    interfaz que 'Proceso', para que la GUI y el resto del código puedan
+    seguir trabajando con objetos sin duplicar los datos.
+    """
+    __slots__ = ("_tabla", "_indice")
+
+    def __init__(self, tabla, indice):
+        self._tabla = tabla
+        self._indice = indice
+
+    @property
+    def pid(self):
+        return self._tabla.pids[self._indice]
+
+    @property
+    def nombre(self):
+        return self._tabla.nombre(self._indice)
+
+    @property
+    def instante_llegada(self):
+        return self._tabla.llegadas[self._indice]
+
+    @property
+    def prioridad(self):
+        return self._tabla.prioridades[self._indice]
+
+    @property
+    def tiempo_cpu_total(self):
+        return self._tabla.rafagas[self._indice]
+
+    @property
+    def tiempo_restante_cpu(self):
+        return self._tabla.restantes[self._indice]
+
+
+class TablaProcesos:
+    """
+    Tabla compacta de procesos organizada por columnas: cada atributo vive
+    en un arreglo tipado ('array') en lugar de un objeto por proceso. El
+    motor trabaja directamente con índices de fila sobre estos arreglos.
+    """
+    def __init__(self):
+        self.pids = array("q")
+        self.llegadas = array("q")
+        self.rafagas = array("q")
+        self.prioridades = array("q")
+        self.restantes = array("q")
+        self.finalizaciones = array("q")  # 0 mientras el proceso no termina
+        self.nombres = []  # None -> nombre por defecto "Proceso <pid>"
+
+    @classmethod
+    def desde_procesos(cls, procesos):
+        """
+        Construye la tabla a partir de objetos con la interfaz de 'Proceso'
+        (o tuplas pid, nombre, tiempo_cpu, llegada y, opcionalmente, prioridad).
+        """
+        tabla = cls()
+        for p in procesos:
+            if isinstance(p, tuple):
+                tabla.agregar(*p)
+            else:
+                tabla.agregar(p.pid, p.nombre, p.tiempo_cpu_total, p.instante_llegada, getattr(p, "prioridad", 0))
+        return tabla
+
+    def agregar(self, pid, nombre, tiempo_cpu, instante_llegada, prioridad=0):
+        """Añade un proceso al final de la tabla."""
+        self.pids.append(pid)
+        self.nombres.append(nombre)
+        self.llegadas.append(instante_llegada)
+        self.rafagas.append(tiempo_cpu)
+        self.prioridades.append(prioridad)
+        self.restantes.append(tiempo_cpu)
+        self.finalizaciones.append(0)
+
+    def nombre(self, indice):
+        nombre = self.nombres[indice]
+        return f"Proceso {self.pids[indice]}" if nombre is None else nombre
+
+    def esta_ordenada(self):
+        """Indica si las filas ya están ordenadas por instante de llegada."""
+        llegadas = self.llegadas
+        return all(llegadas[i] <= llegadas[i + 1] for i in range(len(llegadas) - 1))
+
+    def ordenada_por_llegada(self):
+        """Devuelve una tabla con las filas ordenadas (de forma estable) por instante de llegada."""
+        if self.esta_ordenada():
+            return self
+        orden = sorted(range(len(self)), key=self.llegadas.__getitem__)
+        tabla = TablaProcesos()
+        for columna in ("pids", "llegadas", "rafagas", "prioridades", "restantes", "finalizaciones"):
+            origen = getattr(self, columna)
+            setattr(tabla, columna, array("q", (origen[i] for i in orden)))
+        tabla.nombres = [self.nombres[i] for i in orden]
+        return tabla
+
+    def compartida(self):
+        """
+        Tabla que comparte con esta las columnas fijas (pid, nombre, llegada,
+        ráfaga y prioridad) y tiene su propio estado de ejecución, para simular
+        en paralelo sobre la misma carga sin copiarla.
+        """
+        tabla = TablaProcesos()
+        tabla.pids, tabla.llegadas, tabla.rafagas, tabla.nombres = self.pids, self.llegadas, self.rafagas, self.nombres
+        tabla.prioridades = self.prioridades
+        tabla.reiniciar()
+        return tabla
+
+    def reiniciar(self):
+        """Restablece el tiempo restante y la finalización de todos los procesos."""
+        self.restantes = array("q", self.rafagas)
+        self.finalizaciones = array("q", bytes(8 * len(self)))
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __getitem__(self, indice):
+        if not -len(self) <= indice < len(self):
+            raise IndexError("índice de proceso fuera de rango")
+        return VistaProceso(self, indice % len(self))
+
+    def __iter__(self):
+        return (VistaProceso(self, i) for i in range(len(self)))
+
+
+class PuntoControl:
+    """
+    Estado del motor al comienzo de un evento, suficiente para reanudar la
+    simulación desde ese instante. Ocupa O(longitud de la cola): los procesos
+    ya terminados se recuperan del registro de finalizaciones de la ejecución
+    original y los que aún no llegaron no tienen estado.
+
+    Como la tabla está ordenada de forma estable por llegada, un punto de
+    control en el instante c sigue siendo válido para otra carga que solo
+    difiera en procesos que llegan en c o más tarde: las filas de los que ya
+    llegaron conservan su índice.
+    """
+    __slots__ = ("tiempo", "siguiente_llegada", "proceso_en_cpu", "quantum_timer", "trabajo_restante", "cola",
+                 "restantes", "tabla", "restantes_tabla", "finalizaciones_tabla",
+                 "finalizados", "num_finalizados", "algoritmo", "quantum", "visibles")
+
+    def __init__(self, motor):
+        tabla = motor.tabla
+        self.tiempo = motor.tiempo
+        self.siguiente_llegada = motor.siguiente_llegada
+        self.proceso_en_cpu = motor.proceso_en_cpu
+        self.quantum_timer = motor.quantum_timer
+        self.trabajo_restante = motor.trabajo_restante
+        self.cola = motor.politica.instantanea()
+        # Restante de los procesos que esperan o están en CPU (los únicos que cambian)
+        en_sistema = list(motor.politica)
+        if motor.proceso_en_cpu is not None:
+            en_sistema.append(motor.proceso_en_cpu)
+        self.restantes = {i: tabla.restantes[i] for i in en_sistema}
+        # Las columnas y el registro de finalizaciones se comparten en lugar de
+        # copiarse: después de terminar, la fila de un proceso ya no cambia
+        # durante esa ejecución ('reiniciar' crea arreglos nuevos).
+        self.tabla = tabla
+        self.restantes_tabla = tabla.restantes
+        self.finalizaciones_tabla = tabla.finalizaciones
+        self.finalizados = motor.finalizados
+        self.num_finalizados = len(motor.finalizados)
+        self.algoritmo = motor.algoritmo
+        self.quantum = motor.quantum
+        # Estados visibles del evento anterior (los rellena 'ejecutar_simulacion')
+        self.visibles = {}
+
+
+class MotorEventos:
+    """
+    Estado de una simulación que avanza por eventos en lugar de tick a tick.
+    Cada llamada a 'avanzar' salta hasta el siguiente instante en el que algo
+    puede cambiar: una llegada, una finalización, el vencimiento del quantum
+    o el límite de tiempo. Trabaja con índices de fila de una 'TablaProcesos'
+    ordenada por llegada.
+
+    Las decisiones de planificación las toma un objeto 'Politica' (ver
+    'politicas.py'), que también guarda la cola de listos; el motor solo
+    lleva el reloj, las llegadas y el proceso en CPU.
+    """
+    def __init__(self, tabla, algoritmo, quantum=2, limite_tiempo=None):
+        self.tabla = tabla
+        self.algoritmo = algoritmo
+        self.quantum = quantum
+        self.limite_tiempo = limite_tiempo
+
+        tabla.reiniciar()
+        self.tiempo = 0
+        self.siguiente_llegada = 0  # Índice del primer proceso que aún no llega
+        self.politica = crear_politica(algoritmo, tabla, quantum)
+        # Solo se avisa a la política tras cada tramo si redefine 'al_ejecutar'
+        self._al_ejecutar = (self.politica.al_ejecutar
+                             if type(self.politica).al_ejecutar is not Politica.al_ejecutar else None)
+        self.proceso_en_cpu = None  # Índice del proceso en CPU
+        self.quantum_timer = 0
+        self.trabajo_restante = sum(tabla.restantes)
+        self.finalizados = array("q")  # Índices de los procesos en orden de finalización
+
+    def terminado(self):
+        """Indica si ya no quedan procesos por atender o se alcanzó el límite."""
+        if self.limite_tiempo is not None and self.tiempo > self.limite_tiempo:
+            return True
+        return not (self.siguiente_llegada < len(self.tabla) or self.politica or self.proceso_en_cpu is not None)
+
+    def decidir(self):
+        """Admite llegadas, aplica los desalojos y elige el proceso que ocupa la CPU en el instante actual."""
+        self.admitir()
+        self.desalojar()
+        self.despachar()
+
+    def admitir(self):
+        """Mueve a 'listos' los procesos que ya llegaron."""
+        llegadas = self.tabla.llegadas
+        n = len(llegadas)
+        while self.siguiente_llegada < n and llegadas[self.siguiente_llegada] <= self.tiempo:
+            self.politica.admitir(self.siguiente_llegada, self.tiempo)
+            self.siguiente_llegada += 1
+
+    def desalojar(self):
+        """Devuelve el proceso en CPU a la cola si la política lo pide (quantum, uno más corto...). True si hubo desalojo."""
+        i = self.proceso_en_cpu
+        politica = self.politica
+        if i is None or not politica.expropiativa or not politica.debe_desalojar(i, self.quantum_timer, self.tiempo):
+            return False
+        politica.reencolar(i, self.tiempo, self.quantum_timer)
+        self.proceso_en_cpu = None
+        return True
+
+    def despachar(self):
+        """Selecciona un nuevo proceso para la CPU si está libre y devuelve True si lo hizo."""
+        if self.proceso_en_cpu is None and self.politica:
+            self.proceso_en_cpu = self.politica.elegir(self.tiempo)
+            self.quantum_timer = 0
+            return True
+        return False
+
+    def duracion_hasta_evento(self):
+        """Unidades de tiempo que pueden transcurrir sin que cambie la decisión tomada en 'decidir'."""
+        candidatos = []
+        if self.siguiente_llegada < len(self.tabla):
+            candidatos.append(self.tabla.llegadas[self.siguiente_llegada] - self.tiempo)
+        if self.proceso_en_cpu is not None:
+            candidatos.append(max(self.tabla.restantes[self.proceso_en_cpu], 1))
+            limite = self.politica.tiempo_hasta_desalojo(self.proceso_en_cpu, self.quantum_timer)
+            if limite is not None:
+                candidatos.append(max(limite, 1))
+        if self.limite_tiempo is not None:
+            candidatos.append(self.limite_tiempo + 1 - self.tiempo)
+        return max(min(candidatos), 1) if candidatos else 1
+
+    def ejecutar(self, duracion):
+        """Avanza el reloj 'duracion' unidades con el proceso actual en la CPU."""
+        i = self.proceso_en_cpu
+        if i is not None:
+            restantes = self.tabla.restantes
+            self.trabajo_restante -= min(duracion, max(restantes[i], 0))
+            restantes[i] -= duracion
+            self.quantum_timer += duracion
+            if restantes[i] <= 0:
+                self.tabla.finalizaciones[i] = self.tiempo + duracion
+                self.finalizados.append(i)
+                self.proceso_en_cpu = None
+                self.quantum_timer = 0
+            if self._al_ejecutar is not None:
+                self._al_ejecutar(i, duracion, self.tiempo)
+        self.tiempo += duracion
+
+    def avanzar(self):
+        """Procesa el siguiente evento y devuelve el tramo ejecutado como (pid, inicio, fin)."""
+        self.decidir()
+        inicio = self.tiempo
+        pid = self.tabla.pids[self.proceso_en_cpu] if self.proceso_en_cpu is not None else None
+        self.ejecutar(self.duracion_hasta_evento())
+        return pid, inicio, self.tiempo
+
+    def punto_control(self):
+        """Captura el estado actual. Debe llamarse al comienzo de un evento (antes de 'decidir')."""
+        return PuntoControl(self)
+
+    def restaurar(self, punto, completo=True):
+        """
+        Continúa desde un 'PuntoControl', que puede venir de otra ejecución
+        sobre una carga distinta siempre que los procesos que ya habían
+        llegado sean los mismos (ver 'PuntoControl').
+
+        Con 'completo=False' no se reinicia la tabla ni se recuperan los
+        procesos terminados, así que el coste solo depende de la longitud de
+        la cola; es para consultar estados sobre la misma carga, y quien
+        llama debe dejar en su valor inicial las filas que haya modificado.
+        """
+        tabla, origen = self.tabla, punto.tabla
+        k = punto.siguiente_llegada
+        if punto.algoritmo != self.algoritmo or punto.quantum != self.quantum or k > len(tabla):
+            raise ValueError("El punto de control no corresponde a esta carga o configuración.")
+        if tabla.pids is not origen.pids and (tabla.pids[:k] != origen.pids[:k] or tabla.llegadas[:k] != origen.llegadas[:k]
+                                              or tabla.rafagas[:k] != origen.rafagas[:k]
+                                              or tabla.prioridades[:k] != origen.prioridades[:k]):
+            raise ValueError("El punto de control no corresponde a esta carga o configuración.")
+        if completo:
+            tabla.reiniciar()
+            self.finalizados = array("q", punto.finalizados[:punto.num_finalizados])
+            for i in self.finalizados:
+                tabla.restantes[i] = punto.restantes_tabla[i]
+                tabla.finalizaciones[i] = punto.finalizaciones_tabla[i]
+            self.trabajo_restante = sum(max(r, 0) for r in punto.restantes.values()) + sum(tabla.rafagas[k:])
+        else:
+            self.finalizados = array("q")
+            self.trabajo_restante = punto.trabajo_restante
+        for i, restante in punto.restantes.items():
+            tabla.restantes[i] = restante
+        self.tiempo = punto.tiempo
+        self.siguiente_llegada = k
+        self.proceso_en_cpu = punto.proceso_en_cpu
+        self.quantum_timer = punto.quantum_timer
+        self.politica.restaurar(punto.cola)
+
+    def estados_visibles(self):
+        """Estados no vacíos del instante actual: 'X' para el proceso en CPU y la posición en la cola para el resto."""
+        pids = self.tabla.pids
+        visibles = {pids[i]: str(posicion + 1) for posicion, i in enumerate(self.politica.ordenados())}
+        if self.proceso_en_cpu is not None:
+            visibles[pids[self.proceso_en_cpu]] = 'X'
+        return visibles
+
+
+def calcular_cambios(visibles_previos, visibles):
+    """Delta entre dos conjuntos de estados visibles (pid -> estado); los que desaparecen pasan a ''."""
+    cambios = {pid: estado for pid, estado in visibles.items() if visibles_previos.get(pid, '') != estado}
+    for pid in visibles_previos:
+        if pid not in visibles:
+            cambios[pid] = ''
+    return cambios
+
+
+def aplicar_cambios(estados, cambios):
+    """
+    Aplica sobre 'estados' (pid -> estado) los cambios de un paso producido
+    con 'modo_delta=True' y devuelve la instantánea completa resultante.
+    """
+    estados.update(cambios)
+    return estados
+
+
 class Planificador:
     """
     Calcula el cronograma completo de ejecución de los procesos
     basado en el algoritmo de planificación seleccionado.
     """
-    def __init__(self, procesos, algoritmo, quantum=2):
-        # Usamos una copia profunda para no modificar los objetos originales de la GUI
-        self.procesos_originales = sorted([copy.deepcopy(p) for p in procesos], key=lambda p: p.instante_llegada)
+    def __init__(self, procesos, algoritmo, quantum=2, limite_tiempo=LIMITE_TIEMPO_POR_DEFECTO):
+        # Volcamos los procesos a una tabla propia ordenada por llegada, así
+        # no se modifican los objetos originales de la GUI.
+        if not isinstance(procesos, TablaProcesos):
+            procesos = TablaProcesos.desde_procesos(procesos)
+        self.tabla = procesos.ordenada_por_llegada()
         self.algoritmo = algoritmo
         self.quantum = quantum
+        # Último instante que se simula; None desactiva la salvaguarda.
+        self.limite_tiempo = limite_tiempo
+        # Instante en el que terminó la última ejecución
+        self.duracion = 0
+        # 'PerfilSimulacion' opcional (ver 'perfil.py'); con None el motor no se instrumenta.
+        self.perfil = None
+        # Cada cuántas unidades de tiempo guarda 'ejecutar_simulacion' un punto de control (0 = nunca)
+        self.intervalo_puntos_control = 0
+        self.puntos_control = []
+        # Función opcional que 'ejecutar_completa' y 'ejecutar_cronograma' llaman con
+        # la tabla y los índices de los procesos que acaban de terminar
+        self.al_finalizar = None
 
-    # En la clase Planificador dentro de core.py
+    def _crear_motor(self):
+        """Motor por eventos de una ejecución; instrumentado solo si hay un perfil activo."""
+        if self.perfil is not None:
+            return self.perfil.crear_motor(self.tabla, self.algoritmo, self.quantum, self.limite_tiempo)
+        return MotorEventos(self.tabla, self.algoritmo, self.quantum, self.limite_tiempo)
 
-    def ejecutar_simulacion(self):
+    @property
+    def procesos_originales(self):
+        """Procesos a simular, ordenados por llegada (vistas sobre la tabla)."""
+        return self.tabla
+
+    def ejecutar_simulacion(self, modo_delta=False, desde=None, metricas=False):
         """
         Ejecuta la simulación paso a paso como un generador, produciendo ('yield')
         el estado en cada instante de tiempo. Al final, devuelve las estadísticas.
+
+        Con 'modo_delta=True' cada paso entrega solo los procesos cuyo estado
+        cambió respecto al instante anterior (despacho, desalojo, cambio de
+        posición en la cola o finalización). La instantánea completa se puede
+        reconstruir con 'estados_iniciales' y 'aplicar_cambios'.
+
+        Con 'desde' (un 'PuntoControl') la simulación se reanuda en ese
+        instante en lugar de empezar en 0. Si 'intervalo_puntos_control' es
+        mayor que cero, se guarda un punto de control en 'puntos_control'
+        cada vez que el reloj avanza al menos ese intervalo.
+
+        Con 'metricas=True' cada paso lleva un cuarto elemento: los agregados
+        de los procesos terminados hasta ese instante (ver 'MetricasEnCurso'),
+        con las mismas claves que los agregados finales.
         """
-        tiempo_actual = 0
-        
-        procesos_nuevos = deque(self.procesos_originales)
-        cola_listos = deque()
-        
-        proceso_en_cpu = None
-        quantum_timer = 0
+        motor = self._crear_motor()
+        pids = self.tabla.pids
+        perfil = self.perfil
+        intervalo = self.intervalo_puntos_control
+        visibles_previos = {}
+        if desde is None:
+            self.puntos_control = []
+        else:
+            motor.restaurar(desde)
+            visibles_previos = desde.visibles
+            self.puntos_control = [p for p in self.puntos_control if p.tiempo <= desde.tiempo]
+        proximo_punto = motor.tiempo if desde is None else motor.tiempo + intervalo
+        if metricas:
+            en_curso = MetricasEnCurso()
+            trabajo_total = sum(self.tabla.rafagas)
+            registrados = self._registrar_finalizados(en_curso, motor, 0)
 
-        instantes_finalizacion = {}
-        
-        # Bucle principal de la simulación
-        while procesos_nuevos or cola_listos or proceso_en_cpu:
-
-            # 1. Mover procesos de 'nuevos' a 'listos'
-            while procesos_nuevos and procesos_nuevos[0].instante_llegada <= tiempo_actual:
-                cola_listos.append(procesos_nuevos.popleft())
-
-            # 2. Lógica de desalojo (preemption) para RR y SRTF
-            if proceso_en_cpu:
-                # Desalojo por Quantum en Round Robin
-                if self.algoritmo == "Round Robin" and quantum_timer >= self.quantum:
-                    cola_listos.append(proceso_en_cpu)
-                    proceso_en_cpu = None
-                
-                # Desalojo por llegada de proceso más corto en SRTF
-                if self.algoritmo == "SRTF" and cola_listos:
-                    proceso_mas_corto_en_cola = min(cola_listos, key=lambda p: p.tiempo_restante_cpu)
-                    if proceso_en_cpu.tiempo_restante_cpu > proceso_mas_corto_en_cola.tiempo_restante_cpu:
-                        cola_listos.append(proceso_en_cpu)
-                        proceso_en_cpu = None
-
-            # 3. Seleccionar un nuevo proceso para la CPU si está libre
-            if not proceso_en_cpu and cola_listos:
-                if self.algoritmo in ["FCFS", "Round Robin"]:
-                    proceso_en_cpu = cola_listos.popleft()
-                elif self.algoritmo == "SJF":
-                    cola_listos = deque(sorted(list(cola_listos), key=lambda p: p.tiempo_cpu_total))
-                    proceso_en_cpu = cola_listos.popleft()
-                elif self.algoritmo == "SRTF":
-                    cola_listos = deque(sorted(list(cola_listos), key=lambda p: p.tiempo_restante_cpu))
-                    proceso_en_cpu = cola_listos.popleft()
-                quantum_timer = 0
-
-            estados_del_tick = {}
-            cola_listos_display = cola_listos
-            # ... (código para preparar estados_del_tick se mantiene igual) ...
-            if self.algoritmo == "SJF":
-                cola_listos_display = deque(sorted(list(cola_listos), key=lambda p: p.tiempo_cpu_total))
-            elif self.algoritmo == "SRTF":
-                cola_listos_display = deque(sorted(list(cola_listos), key=lambda p: p.tiempo_restante_cpu))
-            pids_en_cola = {p.pid: i for i, p in enumerate(cola_listos_display)}
-            for p_orig in self.procesos_originales:
-                estado_actual = ''
-                if p_orig.pid in instantes_finalizacion: estado_actual = ''
-                elif tiempo_actual < p_orig.instante_llegada: estado_actual = ''
-                elif proceso_en_cpu and p_orig.pid == proceso_en_cpu.pid: estado_actual = 'X'
-                elif p_orig.pid in pids_en_cola: estado_actual = str(pids_en_cola[p_orig.pid] + 1)
-                else: estado_actual = ' '
-                estados_del_tick[p_orig.pid] = estado_actual
-
-            # Calculamos el tiempo total restante de todos los procesos activos
-            tiempo_restante_total = (proceso_en_cpu.tiempo_restante_cpu if proceso_en_cpu else 0) + \
-                                    sum(p.tiempo_restante_cpu for p in cola_listos) + \
-                                    sum(p.tiempo_restante_cpu for p in procesos_nuevos)
-            
-            # Modificamos el yield para que también entregue el tiempo restante
-            yield tiempo_actual, estados_del_tick, tiempo_restante_total           
+        # Entre dos eventos nada cambia salvo el tiempo restante del proceso
+        # en CPU, así que el estado se calcula una vez por evento y se repite
+        # en cada tick del intervalo.
+        while not motor.terminado():
+            if intervalo and motor.tiempo >= proximo_punto:
+                proximo_punto = self._guardar_punto_control(motor, visibles_previos)
+            motor.decidir()
+            tiempo_inicio = motor.tiempo
+            trabajo_inicio = motor.trabajo_restante
+            en_cpu = motor.proceso_en_cpu
+            pendiente_cpu = max(self.tabla.restantes[en_cpu], 0) if en_cpu is not None else 0
+            duracion = motor.duracion_hasta_evento()
 
-            
-            # 4. Procesar el tick de tiempo en la CPU
-            if proceso_en_cpu:
-                proceso_en_cpu.tiempo_restante_cpu -= 1
-                quantum_timer += 1
-                if proceso_en_cpu.tiempo_restante_cpu <= 0:
-                    instantes_finalizacion[proceso_en_cpu.pid] = tiempo_actual + 1
-                    proceso_en_cpu = None
-                    quantum_timer = 0
-
-            # 5. Avanzar el tiempo
-            tiempo_actual += 1
-            if tiempo_actual > 500: break # Salvaguarda
-
-        # --- Fin del bucle: Calculamos y devolvemos las estadísticas ---
-        estadisticas_dict = {}
-        for p in self.procesos_originales:
-            ti = p.instante_llegada
-            t = p.tiempo_cpu_total
-            tf = instantes_finalizacion.get(p.pid, 0)
-            T = tf - ti
-            Te = T - t
-            I = round(t / T, 4) if T > 0 else 0
-            
-            estadisticas_dict[p.pid] = {
-                "proceso": f"{p.nombre} (P{p.pid})", "ti": ti, "t": t,
-                "tf": tf, "T": T, "Te": Te, "I": I
-            }
-        
-        # El 'return' en un generador se usa para devolver el valor final
-        # cuando la iteración termina.
-        return estadisticas_dict
+            inicio_estados = perf_counter() if perfil is not None else 0.0
+            visibles = motor.estados_visibles()
+            if modo_delta:
+                cambios = calcular_cambios(visibles_previos, visibles)
+            else:
+                estados_del_tick = {pid: visibles.get(pid, '') for pid in pids}
+            visibles_previos = visibles
+            if perfil is not None:
+                perfil.sumar_fase("estados", perf_counter() - inicio_estados)
+
+            motor.ejecutar(duracion)
+            for k in range(duracion):
+                tiempo_restante_total = trabajo_inicio - min(k, pendiente_cpu)
+                # Modificamos el yield para que también entregue el tiempo restante
+                estados = (cambios if k == 0 else {}) if modo_delta else dict(estados_del_tick)
+                if metricas:
+                    tiempo = tiempo_inicio + k
+                    yield tiempo, estados, tiempo_restante_total, en_curso.resumen(tiempo, trabajo_total - tiempo_restante_total)
+                else:
+                    yield tiempo_inicio + k, estados, tiempo_restante_total
+            if metricas:
+                registrados = self._registrar_finalizados(en_curso, motor, registrados)
+
+        return self._calcular_estadisticas(motor)
+
+    def _registrar_finalizados(self, en_curso, motor, registrados):
+        """Pasa a 'en_curso' los procesos terminados desde la última llamada y devuelve cuántos van."""
+        tabla = self.tabla
+        for i in motor.finalizados[registrados:]:
+            en_curso.registrar(tabla.llegadas[i], tabla.rafagas[i], tabla.finalizaciones[i])
+        return len(motor.finalizados)
+
+    def _avisar_finalizados(self, motor, avisados):
+        """Pasa a 'al_finalizar' los procesos terminados desde la última llamada y devuelve cuántos van."""
+        if len(motor.finalizados) > avisados:
+            self.al_finalizar(self.tabla, motor.finalizados[avisados:])
+        return len(motor.finalizados)
+
+    def _guardar_punto_control(self, motor, visibles_previos):
+        """Guarda un punto de control del motor y devuelve el instante del siguiente."""
+        punto = motor.punto_control()
+        punto.visibles = visibles_previos
+        self.puntos_control.append(punto)
+        return motor.tiempo + self.intervalo_puntos_control
+
+    def heredar_puntos_control(self, anterior, instante):
+        """
+        Adopta los puntos de control de otro planificador cuya carga solo
+        difiere de esta en procesos que llegan en 'instante' o después, y
+        devuelve el último (el más cercano a 'instante'), o None si no hay.
+        Se pasa como 'desde' a 'ejecutar_simulacion' para recalcular solo lo
+        que ocurre a partir de ese punto.
+        """
+        if (anterior.algoritmo, anterior.quantum, anterior.limite_tiempo) != (self.algoritmo, self.quantum, self.limite_tiempo):
+            self.puntos_control = []
+            return None
+        self.puntos_control = [p for p in anterior.puntos_control if p.tiempo <= instante]
+        return self.puntos_control[-1] if self.puntos_control else None
+
+    def estados_iniciales(self):
+        """Instantánea con todos los procesos en estado vacío, base para aplicar los deltas."""
+        return {pid: '' for pid in self.tabla.pids}
+
+    def ejecutar_simulacion_eventos(self):
+        """
+        Variante por eventos de 'ejecutar_simulacion'. En lugar de avanzar de
+        uno en uno, salta directamente entre llegadas, finalizaciones,
+        vencimientos de quantum y desalojos, produciendo ('yield')
+        segmentos (pid, inicio, fin) del cronograma. pid es None cuando la CPU
+        está ociosa. Al final, devuelve las mismas estadísticas.
+        """
+        motor = self._crear_motor()
+        segmento = None
+        while not motor.terminado():
+            pid, inicio, fin = motor.avanzar()
+            # Fusionamos los tramos consecutivos del mismo proceso (p. ej. un
+            # quantum que vence sin nadie más en la cola de listos).
+            if segmento and segmento[0] == pid and segmento[2] == inicio:
+                segmento = (pid, segmento[1], fin)
+                continue
+            if segmento:
+                yield segmento
+            segmento = (pid, inicio, fin)
+        if segmento:
+            yield segmento
+
+        return self._calcular_estadisticas(motor)
+
+    def ejecutar_cronograma(self):
+        """
+        Ejecuta la simulación por eventos y devuelve (cronograma, estadísticas).
+        El cronograma es un 'AlmacenCronograma' codificado por tramos: para
+        cada proceso guarda cuándo entra en CPU y cuándo cambia su posición en
+        la cola, sin generar un paso por cada instante.
+        """
+        cronograma = AlmacenCronograma(sorted(self.tabla, key=lambda p: p.pid))
+        cronograma.metadatos = {"algoritmo": self.algoritmo, "quantum": self.quantum}
+        motor = self._crear_motor()
+        visibles_previos = {}
+        # También guarda puntos de control si 'intervalo_puntos_control' > 0 (ver 'ejecutar_simulacion')
+        self.puntos_control = []
+        proximo_punto = 0
+        avisar, avisados = self.al_finalizar is not None, 0
+        while not motor.terminado():
+            if self.intervalo_puntos_control and motor.tiempo >= proximo_punto:
+                proximo_punto = self._guardar_punto_control(motor, visibles_previos)
+            motor.decidir()
+            visibles = motor.estados_visibles()
+            cronograma.agregar_cambios(motor.tiempo, calcular_cambios(visibles_previos, visibles))
+            visibles_previos = visibles
+            motor.ejecutar(motor.duracion_hasta_evento())
+            if avisar:
+                avisados = self._avisar_finalizados(motor, avisados)
+        cronograma.num_ticks = motor.tiempo
+        return cronograma, self._calcular_estadisticas(motor)
+
+    def ejecutar_completa(self, columnar=False):
+        """
+        Ejecuta la simulación por eventos hasta el final, sin producir pasos
+        intermedios, y devuelve solo las estadísticas: el diccionario por pid
+        o, con 'columnar=True', un 'EstadisticasColumnares'.
+        """
+        motor = self._crear_motor()
+        avisar, avisados = self.al_finalizar is not None, 0
+        while not motor.terminado():
+            motor.avanzar()
+            if avisar:
+                avisados = self._avisar_finalizados(motor, avisados)
+        self.duracion = motor.tiempo
+        return self.estadisticas_columnares() if columnar else self.estadisticas_columnares().como_dict()
+
+    def estadisticas_columnares(self):
+        """Estadísticas de la última ejecución como columnas y agregados (ver 'estadisticas.py')."""
+        return calcular_estadisticas(self.tabla, self.duracion)
+
+    def _calcular_estadisticas(self, motor):
+        """Calcula las métricas finales de cada proceso a partir de sus instantes de finalización."""
+        self.duracion = motor.tiempo
+        return self.estadisticas_columnares().como_dict()
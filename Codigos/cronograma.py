@@ -0,0 +1,242 @@
+"""
+Almacenamiento compacto del cronograma de ejecución (diagrama de Gantt).
+
+En lugar de guardar una celda por proceso y por instante, cada fila guarda
+solo los instantes en los que cambia su estado (codificación por tramos).
+Así la memoria crece con el número de cambios y no con la duración de la
+simulación, y consultar una celda cualquiera cuesta O(log n). El cronograma
+se puede guardar en JSON o en un formato binario compacto y volver a cargar
+sin repetir la simulación. No depende de Qt.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+import json
+import os
+import struct
+import sys
+
+FIRMA_BINARIA = b"PRFC"
+VERSION_FORMATO = 1
+_ESTADO_VACIO = 0
+_ESTADO_CPU = -1
+
+
+def _codificar_estado(estado):
+    """'' -> 0, 'X' -> -1 y la posición n en la cola -> n."""
+    if estado == '':
+        return _ESTADO_VACIO
+    if estado == 'X':
+        return _ESTADO_CPU
+    return int(estado)
+
+
+def _decodificar_estado(codigo):
+    if codigo == _ESTADO_VACIO:
+        return ''
+    if codigo == _ESTADO_CPU:
+        return 'X'
+    return str(codigo)
+
+
+def _a_little_endian(arreglo):
+    if sys.byteorder != "little":
+        arreglo = array(arreglo.typecode, arreglo)
+        arreglo.byteswap()
+    return arreglo.tobytes()
+
+
+def _desde_little_endian(typecode, datos):
+    arreglo = array(typecode)
+    arreglo.frombytes(datos)
+    if sys.byteorder != "little":
+        arreglo.byteswap()
+    return arreglo
+
+
+class ErrorCronograma(ValueError):
+    """Error de formato al cargar un cronograma guardado."""
+
+
+class AlmacenCronograma:
+    """
+    Estados por proceso e instante, guardados como cambios por fila. Se
+    alimenta con los deltas de 'Planificador.ejecutar_simulacion(modo_delta=True)'
+    o se obtiene completo con 'Planificador.ejecutar_cronograma()'.
+    """
+    def __init__(self, procesos=()):
+        self.reiniciar(procesos)
+
+    def reiniciar(self, procesos):
+        """Vacía el almacén y define sus filas (en el orden recibido) a partir de los procesos."""
+        procesos = list(procesos)
+        self._definir_filas([p.pid for p in procesos], [f"{p.nombre} (P{p.pid})" for p in procesos])
+
+    def _definir_filas(self, pids, etiquetas):
+        self.pids = list(pids)
+        self.etiquetas = list(etiquetas)
+        self._fila_de_pid = {pid: fila for fila, pid in enumerate(self.pids)}
+        self._tiempos = [array("q") for _ in self.pids]
+        self._estados = [[] for _ in self.pids]
+        self.num_ticks = 0
+        self.metadatos = {}
+
+    def agregar_cambios(self, tiempo, cambios):
+        """Registra los estados que cambian a partir de 'tiempo' (pid -> estado)."""
+        for pid, estado in cambios.items():
+            fila = self._fila_de_pid.get(pid)
+            if fila is None:
+                continue
+            tiempos, estados = self._tiempos[fila], self._estados[fila]
+            if tiempos and tiempos[-1] == tiempo:
+                estados[-1] = estado
+            else:
+                tiempos.append(tiempo)
+                estados.append(estado)
+        self.num_ticks = max(self.num_ticks, tiempo + 1)
+
+    def estado(self, fila, tiempo):
+        """Estado de la fila en el instante dado ('' si no hay nada registrado)."""
+        if tiempo >= self.num_ticks:
+            return ''
+        posicion = bisect_right(self._tiempos[fila], tiempo) - 1
+        return self._estados[fila][posicion] if posicion >= 0 else ''
+
+    def tramos(self, fila):
+        """Genera los tramos (inicio, fin, estado) no vacíos de una fila; 'fin' es exclusivo."""
+        tiempos, estados = self._tiempos[fila], self._estados[fila]
+        for i, estado in enumerate(estados):
+            fin = tiempos[i + 1] if i + 1 < len(tiempos) else self.num_ticks
+            if estado != '' and fin > tiempos[i]:
+                yield tiempos[i], fin, estado
+
+    def segmentos(self):
+        """Genera todos los tramos como (pid, inicio, fin, estado): 'X' en CPU o la posición en la cola."""
+        for fila, pid in enumerate(self.pids):
+            for inicio, fin, estado in self.tramos(fila):
+                yield pid, inicio, fin, estado
+
+    def prefijo(self, procesos, tiempo):
+        """
+        Nuevo almacén con filas para 'procesos' y los cambios anteriores a
+        'tiempo' de los que ya estaban en este; sirve para reanudar una
+        simulación desde un punto de control sin tocar el original.
+        """
+        almacen = AlmacenCronograma(procesos)
+        for fila, pid in enumerate(almacen.pids):
+            origen = self._fila_de_pid.get(pid)
+            if origen is None:
+                continue
+            tiempos = self._tiempos[origen]
+            corte = bisect_left(tiempos, tiempo)
+            almacen._tiempos[fila] = tiempos[:corte]
+            almacen._estados[fila] = self._estados[origen][:corte]
+        almacen.num_ticks = min(self.num_ticks, tiempo)
+        almacen.metadatos = dict(self.metadatos)
+        return almacen
+
+    def __len__(self):
+        return len(self.pids)
+
+    # --- Serialización ---
+
+    def a_dict(self):
+        """Representación JSON del cronograma."""
+        return {
+            "version": VERSION_FORMATO,
+            "num_ticks": self.num_ticks,
+            "metadatos": self.metadatos,
+            "filas": [
+                {"pid": pid, "etiqueta": self.etiquetas[fila], "tiempos": self._tiempos[fila].tolist(),
+                 "estados": [_codificar_estado(e) for e in self._estados[fila]]}
+                for fila, pid in enumerate(self.pids)
+            ],
+        }
+
+    @classmethod
+    def desde_dict(cls, datos):
+        """Reconstruye un cronograma a partir de 'a_dict'."""
+        try:
+            if datos["version"] != VERSION_FORMATO:
+                raise ErrorCronograma(f"Versión de cronograma no soportada: {datos['version']}.")
+            almacen = cls()
+            filas = datos["filas"]
+            almacen._definir_filas([f["pid"] for f in filas], [f["etiqueta"] for f in filas])
+            for fila, f in enumerate(filas):
+                almacen._tiempos[fila] = array("q", f["tiempos"])
+                almacen._estados[fila] = [_decodificar_estado(c) for c in f["estados"]]
+            almacen.num_ticks = datos["num_ticks"]
+            almacen.metadatos = datos.get("metadatos", {})
+        except (KeyError, TypeError) as e:
+            raise ErrorCronograma(f"Cronograma JSON incompleto o inválido ({e}).") from None
+        return almacen
+
+    def a_bytes(self):
+        """Formato binario: cabecera, metadatos JSON y, por fila, los instantes y estados codificados."""
+        partes = []
+        metadatos = json.dumps(self.metadatos).encode("utf-8")
+        partes.append(FIRMA_BINARIA + struct.pack("<BqII", VERSION_FORMATO, self.num_ticks, len(self.pids), len(metadatos)))
+        partes.append(metadatos)
+        for fila, pid in enumerate(self.pids):
+            etiqueta = self.etiquetas[fila].encode("utf-8")
+            partes.append(struct.pack("<qHI", pid, len(etiqueta), len(self._tiempos[fila])))
+            partes.append(etiqueta)
+            partes.append(_a_little_endian(self._tiempos[fila]))
+            partes.append(_a_little_endian(array("i", (_codificar_estado(e) for e in self._estados[fila]))))
+        return b"".join(partes)
+
+    @classmethod
+    def desde_bytes(cls, datos):
+        """Reconstruye un cronograma a partir de 'a_bytes'."""
+        vista = memoryview(datos)
+        try:
+            if bytes(vista[:4]) != FIRMA_BINARIA:
+                raise ErrorCronograma("El archivo no es un cronograma binario.")
+            version, num_ticks, num_filas, largo_meta = struct.unpack_from("<BqII", vista, 4)
+            if version != VERSION_FORMATO:
+                raise ErrorCronograma(f"Versión de cronograma no soportada: {version}.")
+            pos = 4 + struct.calcsize("<BqII")
+            metadatos = json.loads(bytes(vista[pos:pos + largo_meta]).decode("utf-8"))
+            pos += largo_meta
+            pids, etiquetas, tiempos, estados = [], [], [], []
+            for _ in range(num_filas):
+                pid, largo_etiqueta, num_cambios = struct.unpack_from("<qHI", vista, pos)
+                pos += struct.calcsize("<qHI")
+                etiquetas.append(bytes(vista[pos:pos + largo_etiqueta]).decode("utf-8"))
+                pos += largo_etiqueta
+                tiempos.append(_desde_little_endian("q", vista[pos:pos + 8 * num_cambios]))
+                pos += 8 * num_cambios
+                codigos = _desde_little_endian("i", vista[pos:pos + 4 * num_cambios])
+                pos += 4 * num_cambios
+                estados.append([_decodificar_estado(c) for c in codigos])
+                pids.append(pid)
+        except (struct.error, ValueError, UnicodeDecodeError) as e:
+            if isinstance(e, ErrorCronograma):
+                raise
+            raise ErrorCronograma(f"Cronograma binario dañado ({e}).") from None
+        almacen = cls()
+        almacen._definir_filas(pids, etiquetas)
+        almacen._tiempos, almacen._estados = tiempos, estados
+        almacen.num_ticks = num_ticks
+        almacen.metadatos = metadatos
+        return almacen
+
+    def guardar(self, ruta):
+        """Guarda el cronograma: JSON si la ruta termina en '.json', binario en otro caso."""
+        if os.path.splitext(ruta)[1].lower() == ".json":
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                json.dump(self.a_dict(), archivo, ensure_ascii=False, separators=(",", ":"))
+        else:
+            with open(ruta, "wb") as archivo:
+                archivo.write(self.a_bytes())
+
+    @classmethod
+    def cargar(cls, ruta):
+        """Carga un cronograma guardado con 'guardar'."""
+        if os.path.splitext(ruta)[1].lower() == ".json":
+            with open(ruta, encoding="utf-8") as archivo:
+                try:
+                    return cls.desde_dict(json.load(archivo))
+                except json.JSONDecodeError as e:
+                    raise ErrorCronograma(f"JSON inválido ({e.msg}).") from None
+        with open(ruta, "rb") as archivo:
+            return cls.desde_bytes(archivo.read())
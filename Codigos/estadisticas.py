@@ -0,0 +1,304 @@
+"""
+Cálculo de las estadísticas finales de una simulación en forma de columnas.
+
+Las métricas por proceso (T, Te, I) y los agregados se calculan en una sola
+pasada vectorizada con NumPy cuando está instalado; si no, se usa una
+implementación equivalente en Python puro. NumPy se importa en el primer
+cálculo y no al importar el módulo, para que arrancar la CLI o la GUI no
+pague su coste. El formato de diccionario por pid que usa la GUI se sigue
+pudiendo obtener con 'como_dict'.
+"""
+from array import array
+from collections import Counter
+import math
+
+np = None  # Módulo numpy tras '_cargar_numpy'; False si no está instalado
+
+PERCENTILES = (50, 90, 99)
+
+
+def _percentil(ordenados, q):
+    """Percentil con interpolación lineal (el mismo criterio que 'numpy.percentile')."""
+    if not ordenados:
+        return 0.0
+    posicion = (len(ordenados) - 1) * q / 100
+    inferior = math.floor(posicion)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicion - inferior)
+
+
+class EstadisticasColumnares:
+    """
+    Estadísticas de una ejecución organizadas por columnas: 'pid', 'ti', 't',
+    'tf', 'T', 'Te' e 'I' son arreglos alineados (una posición por proceso) y
+    'agregados' es un diccionario con las métricas globales.
+    """
+    def __init__(self, nombres, columnas, agregados):
+        self.nombres = nombres
+        self.columnas = columnas
+        self.agregados = agregados
+
+    def __getitem__(self, columna):
+        return self.columnas[columna]
+
+    def __len__(self):
+        return len(self.columnas["pid"])
+
+    def filas(self):
+        """Genera (pid, datos) con el formato de diccionario histórico del simulador."""
+        columnas = {nombre: _a_lista(self.columnas[nombre]) for nombre in ("pid", "ti", "t", "tf")}
+        for i, pid in enumerate(columnas["pid"]):
+            yield pid, datos_proceso(self.nombres(i), pid, columnas["ti"][i], columnas["t"][i], columnas["tf"][i])
+
+    def como_dict(self):
+        """Diccionario pid -> métricas, tal como lo devuelve 'ejecutar_simulacion'."""
+        return dict(self.filas())
+
+
+def datos_proceso(nombre, pid, ti, t, tf):
+    """Métricas de un proceso con el formato de diccionario histórico del simulador."""
+    T = tf - ti
+    return {"proceso": f"{nombre} (P{pid})", "ti": ti, "t": t, "tf": tf, "T": T, "Te": T - t,
+            "I": round(t / T, 4) if T > 0 else 0}
+
+
+def _a_lista(valores):
+    return valores.tolist()
+
+
+def _cargar_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:  # NumPy es opcional: sin él se usa el cálculo en Python puro
+            np = False
+    return np
+
+
+def calcular_estadisticas(tabla, duracion):
+    """
+    Calcula las estadísticas de una 'TablaProcesos' ya simulada. 'duracion'
+    es el instante en el que terminó la simulación; se usa para el
+    throughput y la utilización de CPU.
+    """
+    if _cargar_numpy():
+        return _calcular_numpy(tabla, duracion)
+    return _calcular_python(tabla, duracion)
+
+
+def _calcular_numpy(tabla, duracion):
+    pid = np.frombuffer(tabla.pids, dtype=np.int64).copy()
+    ti = np.frombuffer(tabla.llegadas, dtype=np.int64).copy()
+    t = np.frombuffer(tabla.rafagas, dtype=np.int64).copy()
+    tf = np.frombuffer(tabla.finalizaciones, dtype=np.int64).copy()
+    restantes = np.frombuffer(tabla.restantes, dtype=np.int64)
+
+    T = tf - ti
+    Te = T - t
+    positivos = T > 0
+    I = np.zeros(len(t), dtype=np.float64)
+    np.divide(t, T, out=I, where=positivos)
+
+    terminados = tf > 0
+    T_fin, Te_fin, I_fin = T[terminados], Te[terminados], I[terminados]
+    ocupado = int((t - np.clip(restantes, 0, None)).sum())
+    agregados = _agregados(
+        finalizados=int(terminados.sum()),
+        media=lambda c: float(c.mean()) if len(c) else 0.0,
+        percentil=lambda c, q: float(np.percentile(c, q)) if len(c) else 0.0,
+        maximo=lambda c: int(c.max()) if len(c) else 0,
+        T=T_fin, Te=Te_fin, I=I_fin, ocupado=ocupado, duracion=duracion,
+    )
+    columnas = {"pid": pid, "ti": ti, "t": t, "tf": tf, "T": T, "Te": Te, "I": I}
+    return EstadisticasColumnares(tabla.nombre, columnas, agregados)
+
+
+def _calcular_python(tabla, duracion):
+    T = array("q", (f - l for f, l in zip(tabla.finalizaciones, tabla.llegadas)))
+    Te = array("q", (d - r for d, r in zip(T, tabla.rafagas)))
+    I = array("d", ((r / d if d > 0 else 0.0) for r, d in zip(tabla.rafagas, T)))
+
+    terminados = [i for i, f in enumerate(tabla.finalizaciones) if f > 0]
+    T_fin = sorted(T[i] for i in terminados)
+    Te_fin = sorted(Te[i] for i in terminados)
+    I_fin = [I[i] for i in terminados]
+    ocupado = sum(r - max(x, 0) for r, x in zip(tabla.rafagas, tabla.restantes))
+    agregados = _agregados(
+        finalizados=len(terminados),
+        media=lambda c: sum(c) / len(c) if c else 0.0,
+        percentil=lambda c, q: float(_percentil(c, q)),
+        maximo=lambda c: max(c) if c else 0,
+        T=T_fin, Te=Te_fin, I=I_fin, ocupado=ocupado, duracion=duracion,
+    )
+    columnas = {"pid": array("q", tabla.pids), "ti": array("q", tabla.llegadas), "t": array("q", tabla.rafagas),
+                "tf": array("q", tabla.finalizaciones), "T": T, "Te": Te, "I": I}
+    return EstadisticasColumnares(tabla.nombre, columnas, agregados)
+
+
+def _agregados(finalizados, media, percentil, maximo, T, Te, I, ocupado, duracion):
+    """Métricas globales sobre los procesos que terminaron."""
+    agregados = {
+        "procesos_finalizados": finalizados,
+        "T_promedio": media(T),
+        "Te_promedio": media(Te),
+        "I_promedio": media(I),
+        "Te_maximo": maximo(Te),
+        "throughput": finalizados / duracion if duracion > 0 else 0.0,
+        "utilizacion_cpu": ocupado / duracion if duracion > 0 else 0.0,
+        "duracion": duracion,
+    }
+    for q in PERCENTILES:
+        agregados[f"T_p{q}"] = percentil(T, q)
+        agregados[f"Te_p{q}"] = percentil(Te, q)
+    return agregados
+
+
+class EstimadorP2:
+    """
+    Estimación en línea de un percentil con el algoritmo P² (Jain y
+    Chlamtac): cinco marcadores en lugar de guardar todas las observaciones,
+    así que la memoria no depende de cuántos procesos terminen. Con menos de
+    cinco observaciones el valor es exacto.
+    """
+    def __init__(self, q):
+        self.p = q / 100
+        self.alturas = []
+        self.posiciones = [1, 2, 3, 4, 5]
+        self.deseadas = [1, 1 + 2 * self.p, 1 + 4 * self.p, 3 + 2 * self.p, 5]
+        self.incrementos = [0, self.p / 2, self.p, (1 + self.p) / 2, 1]
+        self.cantidad = 0
+
+    def agregar(self, x):
+        alturas, posiciones = self.alturas, self.posiciones
+        self.cantidad += 1
+        if len(alturas) < 5:
+            alturas.append(x)
+            alturas.sort()
+            return
+        # 1. Celda en la que cae la observación (ajustando los extremos)
+        if x < alturas[0]:
+            alturas[0] = x
+            k = 0
+        elif x >= alturas[4]:
+            alturas[4] = x
+            k = 3
+        else:
+            k = next(i for i in range(4) if x < alturas[i + 1])
+        for i in range(k + 1, 5):
+            posiciones[i] += 1
+        for i in range(5):
+            self.deseadas[i] += self.incrementos[i]
+        # 2. Ajuste de los marcadores centrales con interpolación parabólica
+        for i in (1, 2, 3):
+            d = self.deseadas[i] - posiciones[i]
+            if (d >= 1 and posiciones[i + 1] - posiciones[i] > 1) or (d <= -1 and posiciones[i - 1] - posiciones[i] < -1):
+                s = 1 if d > 0 else -1
+                altura = self._parabolica(i, s)
+                if not alturas[i - 1] < altura < alturas[i + 1]:
+                    altura = alturas[i] + s * (alturas[i + s] - alturas[i]) / (posiciones[i + s] - posiciones[i])
+                alturas[i] = altura
+                posiciones[i] += s
+
+    def _parabolica(self, i, s):
+        q, n = self.alturas, self.posiciones
+        return q[i] + s / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + s) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - s) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+    def valor(self):
+        if self.cantidad <= 5:
+            return float(_percentil(self.alturas, self.p * 100))
+        return float(self.alturas[2])
+
+
+class MetricasEnCurso:
+    """
+    Agregados de una simulación que aún no ha terminado, actualizados a medida
+    que finalizan los procesos. 'resumen' devuelve las mismas claves que
+    'EstadisticasColumnares.agregados'; los percentiles son estimaciones P².
+    """
+    def __init__(self):
+        self.finalizados = 0
+        self.suma_T = 0
+        self.suma_Te = 0
+        self.suma_I = 0.0
+        self.Te_maximo = 0
+        self.percentiles_T = {q: EstimadorP2(q) for q in PERCENTILES}
+        self.percentiles_Te = {q: EstimadorP2(q) for q in PERCENTILES}
+
+    def registrar(self, llegada, rafaga, finalizacion):
+        """Incorpora un proceso que acaba de terminar."""
+        T = finalizacion - llegada
+        Te = T - rafaga
+        self.finalizados += 1
+        self.suma_T += T
+        self.suma_Te += Te
+        self.suma_I += rafaga / T if T > 0 else 0.0
+        self.Te_maximo = max(self.Te_maximo, Te)
+        self._agregar_percentiles(T, Te)
+
+    def _agregar_percentiles(self, T, Te):
+        for q in PERCENTILES:
+            self.percentiles_T[q].agregar(T)
+            self.percentiles_Te[q].agregar(Te)
+
+    def _percentiles(self, q):
+        """(percentil q de T, percentil q de Te) de los procesos terminados."""
+        return self.percentiles_T[q].valor(), self.percentiles_Te[q].valor()
+
+    def resumen(self, duracion, ocupado):
+        """Agregados hasta el instante 'duracion', con 'ocupado' unidades de CPU ya ejecutadas."""
+        n = self.finalizados
+        agregados = {
+            "procesos_finalizados": n,
+            "T_promedio": self.suma_T / n if n else 0.0,
+            "Te_promedio": self.suma_Te / n if n else 0.0,
+            "I_promedio": self.suma_I / n if n else 0.0,
+            "Te_maximo": self.Te_maximo,
+            "throughput": n / duracion if duracion > 0 else 0.0,
+            "utilizacion_cpu": ocupado / duracion if duracion > 0 else 0.0,
+            "duracion": duracion,
+        }
+        for q in PERCENTILES:
+            agregados[f"T_p{q}"], agregados[f"Te_p{q}"] = self._percentiles(q) if n else (0.0, 0.0)
+        return agregados
+
+
+class MetricasHistograma(MetricasEnCurso):
+    """
+    'MetricasEnCurso' con percentiles exactos: como T y Te son enteros, se
+    cuenta cuántos procesos tienen cada valor. La memoria depende de cuántos
+    valores distintos aparecen, no de cuántos procesos terminan, y registrar
+    un proceso cuesta mucho menos que actualizar los estimadores P².
+    """
+    def __init__(self):
+        super().__init__()
+        self.percentiles_T = Counter()
+        self.percentiles_Te = Counter()
+
+    def _agregar_percentiles(self, T, Te):
+        self.percentiles_T[T] += 1
+        self.percentiles_Te[Te] += 1
+
+    def _percentiles(self, q):
+        return _percentil_histograma(self.percentiles_T, self.finalizados, q), \
+            _percentil_histograma(self.percentiles_Te, self.finalizados, q)
+
+
+def _percentil_histograma(histograma, n, q):
+    """'_percentil' sobre las n observaciones de un histograma valor -> veces."""
+    posicion = (n - 1) * q / 100
+    inferior = math.floor(posicion)
+    superior = min(inferior + 1, n - 1)
+    valor_inferior = valor_superior = None
+    acumulado = 0
+    for valor in sorted(histograma):
+        acumulado += histograma[valor]
+        if valor_inferior is None and acumulado > inferior:
+            valor_inferior = valor
+        if acumulado > superior:
+            valor_superior = valor
+            break
+    return float(valor_inferior + (valor_superior - valor_inferior) * (posicion - inferior))
@@ -0,0 +1,108 @@
+"""
+Generador de cargas de trabajo sintéticas para pruebas de escala.
+
+Produce los procesos de forma perezosa (uno a uno, ya ordenados por
+llegada) y reproducible a partir de una semilla, así que se pueden generar
+millones sin tenerlos todos en memoria como objetos. Cada proceso se entrega
+como la tupla (pid, nombre, tiempo_cpu, llegada) que acepta
+'TablaProcesos.desde_procesos', por lo que la salida alimenta directamente
+al 'Planificador':
+
+    tabla = TablaProcesos.desde_procesos(generar_procesos(10**6, semilla=7))
+    Planificador(tabla, "SRTF", limite_tiempo=None).ejecutar_completa()
+"""
+import math
+import random
+
+DISTRIBUCIONES_LLEGADA = ("poisson", "uniforme")
+DISTRIBUCIONES_RAFAGA = ("exponencial", "bimodal", "pareto", "constante")
+
+
+def _muestreador_rafagas(rng, distribucion, media, rafaga_corta, rafaga_larga, proporcion_cortas, alfa):
+    """Devuelve una función sin argumentos que produce ráfagas de CPU (enteros >= 1)."""
+    if distribucion == "exponencial":
+        return lambda: max(1, math.ceil(rng.expovariate(1 / media)))
+    if distribucion == "bimodal":
+        # Mezcla de trabajos cortos (interactivos) y largos (por lotes)
+        return lambda: max(1, math.ceil(rng.expovariate(1 / (rafaga_corta if rng.random() < proporcion_cortas else rafaga_larga))))
+    if distribucion == "pareto":
+        # Cola pesada: escala elegida para que la media sea 'media' (requiere alfa > 1)
+        escala = media * (alfa - 1) / alfa
+        return lambda: max(1, math.ceil(escala * rng.paretovariate(alfa)))
+    if distribucion == "constante":
+        return lambda: max(1, round(media))
+    raise ValueError(f"Distribución de ráfagas desconocida: {distribucion!r}.")
+
+
+def _llegadas(rng, distribucion, tasa, fases):
+    """
+    Genera instantes de llegada (reales, crecientes). Con 'fases', una lista
+    de (duracion, factor), la tasa se multiplica por 'factor' durante cada
+    fase y las fases se repiten cíclicamente (ráfagas de llegadas).
+    """
+    tiempo = 0.0
+    if not fases:
+        fases = [(math.inf, 1.0)]
+    indice_fase = 0
+    fin_fase = fases[0][0]
+    while True:
+        tasa_actual = tasa * fases[indice_fase][1]
+        if tasa_actual > 0:
+            if distribucion == "poisson":
+                siguiente = tiempo + rng.expovariate(tasa_actual)
+            else:
+                siguiente = tiempo + rng.uniform(0, 2 / tasa_actual)
+        else:
+            siguiente = math.inf
+        if siguiente >= fin_fase:
+            # Cambio de fase: como el proceso de Poisson no tiene memoria,
+            # basta con volver a muestrear desde el inicio de la nueva fase
+            tiempo = fin_fase
+            indice_fase = (indice_fase + 1) % len(fases)
+            fin_fase = tiempo + fases[indice_fase][0]
+            continue
+        tiempo = siguiente
+        yield tiempo
+
+
+def generar_procesos(cantidad, semilla=None, llegadas="poisson", tasa_llegada=0.1, rafagas="exponencial",
+                     rafaga_media=8.0, rafaga_corta=2.0, rafaga_larga=40.0, proporcion_cortas=0.8,
+                     alfa=1.5, fases=None, pid_inicial=1):
+    """
+    Genera 'cantidad' procesos como tuplas (pid, nombre, tiempo_cpu, llegada).
+
+    - llegadas: "poisson" (tiempos entre llegadas exponenciales) o "uniforme",
+      con 'tasa_llegada' procesos por unidad de tiempo en promedio.
+    - rafagas: "exponencial" (media 'rafaga_media'), "bimodal" (mezcla de
+      'rafaga_corta' y 'rafaga_larga' con 'proporcion_cortas'), "pareto"
+      (cola pesada de parámetro 'alfa' y media 'rafaga_media') o "constante".
+    - fases: lista opcional de (duracion, factor) que modula la tasa de
+      llegadas de forma cíclica, p. ej. [(100, 10), (900, 0.2)].
+
+    La misma semilla y los mismos parámetros producen siempre la misma carga.
+    El nombre es None, es decir, el nombre por defecto "Proceso <pid>".
+    """
+    if llegadas not in DISTRIBUCIONES_LLEGADA:
+        raise ValueError(f"Distribución de llegadas desconocida: {llegadas!r}.")
+    if tasa_llegada <= 0:
+        raise ValueError("La tasa de llegadas debe ser mayor que cero.")
+    for nombre, valor in (("rafaga_media", rafaga_media), ("rafaga_corta", rafaga_corta), ("rafaga_larga", rafaga_larga)):
+        if valor <= 0:
+            raise ValueError(f"'{nombre}' debe ser mayor que cero (recibido {valor}).")
+    if not 0 <= proporcion_cortas <= 1:
+        raise ValueError(f"'proporcion_cortas' debe estar entre 0 y 1 (recibido {proporcion_cortas}).")
+    if rafagas == "pareto" and alfa <= 1:
+        raise ValueError("La distribución de Pareto necesita alfa > 1 para tener media finita.")
+    if fases:
+        if any(duracion <= 0 or factor < 0 for duracion, factor in fases) or not any(factor > 0 for _, factor in fases):
+            raise ValueError("Las fases deben tener duración positiva, factores no negativos y al menos uno positivo.")
+
+    # Validamos al llamar (no al empezar a iterar), por eso el generador va aparte
+    rng = random.Random(semilla)
+    siguiente_rafaga = _muestreador_rafagas(rng, rafagas, rafaga_media, rafaga_corta, rafaga_larga, proporcion_cortas, alfa)
+    return _generar(siguiente_rafaga, _llegadas(rng, llegadas, tasa_llegada, fases), cantidad, pid_inicial)
+
+
+def _generar(siguiente_rafaga, instantes, cantidad, pid_inicial):
+    for pid in range(pid_inicial, pid_inicial + cantidad):
+        yield pid, None, siguiente_rafaga(), int(next(instantes))
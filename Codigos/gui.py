@@ -1,16 +1,29 @@
 import sys
-from PySide6.QtCore import Qt, QTimer
+import time
+from concurrent.futures import ThreadPoolExecutor
+from PySide6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
-    QHeaderView, QFrame, QDialog, QComboBox, QSpinBox, QScrollArea,
-    QDialogButtonBox,QProgressBar
+    QHeaderView, QFrame, QDialog, QComboBox, QSpinBox, QTableView,
+    QDialogButtonBox,QProgressBar, QFileDialog, QCheckBox, QSlider
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QIntValidator, QColor, QFont
 
 # Importamos las clases necesarias del módulo de lógica
-from core import Proceso, Planificador
+from core import ALGORITMOS, ALGORITMOS_CON_QUANTUM, Proceso, Planificador
+from cargas import ErrorCarga, leer_registros
+from cronograma import AlmacenCronograma, ErrorCronograma
+from cache import CacheResultados, ResultadoSimulacion, huella
+from perfil import PerfilSimulacion
+from segundo_plano import TAM_LOTE, SimulacionEnSegundoPlano
+from navegacion import SimulacionNavegable
+
+COLUMNAS_MINIMAS_CRONOGRAMA = 50  # Columnas visibles al empezar una simulación
+INTERVALO_MINIMO_MS = 16  # Un cuadro a ~60 Hz: no tiene sentido repintar más a menudo
+PRESUPUESTO_CUADRO_S = 0.012  # Tiempo máximo que un callback del timer dedica a avanzar la simulación
+INTERVALO_PUNTOS_CONTROL = 64  # Instantes entre puntos de control para re-simular tras editar un proceso
 
 class CustomErrorDialog(QDialog):
     """Un diálogo de error personalizado y estilizado."""
@@ -66,6 +79,11 @@ class EditProcessDialog(QDialog):
         self.tiempo_cpu_input = QLineEdit(str(proceso.tiempo_cpu_total))
         self.tiempo_cpu_input.setValidator(QIntValidator(1, 1000)) # Validamos que sea un número
         layout.addWidget(self.tiempo_cpu_input)
+
+        layout.addWidget(QLabel("Prioridad (0 = más urgente):"))
+        self.prioridad_input = QLineEdit(str(proceso.prioridad))
+        self.prioridad_input.setValidator(QIntValidator(0, 1000))
+        layout.addWidget(self.prioridad_input)
         
         button_box = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept)
@@ -77,14 +95,182 @@ class EditProcessDialog(QDialog):
         return {
             "nombre": self.nombre_input.text().strip(),
             "llegada": int(self.llegada_input.text()),
-            "tiempo_cpu": int(self.tiempo_cpu_input.text())
+            "tiempo_cpu": int(self.tiempo_cpu_input.text()),
+            "prioridad": int(self.prioridad_input.text() or 0)
         }
 
+class ModeloProcesos(QAbstractTableModel):
+    """
+    Modelo de la lista "Procesos a Simular". Las filas se insertan, cambian o
+    eliminan sin reconstruir la tabla, y un índice por pid evita recorrer la
+    lista para encontrar un proceso. Las dos últimas columnas son los
+    botones de editar y eliminar, dibujados por la vista como celdas.
+    """
+    ENCABEZADOS = ("PID", "Nombre", "Llegada", "CPU", "Prio.", "", "")
+    COLUMNA_EDITAR, COLUMNA_ELIMINAR = 5, 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.procesos = []
+        self._fila_de_pid = {}
+        self._colores_boton = {self.COLUMNA_EDITAR: QColor("#3b82f6"), self.COLUMNA_ELIMINAR: QColor("#ef4444")}
+        self._color_texto_boton = QColor("#ffffff")
+
+    def agregar(self, procesos):
+        """Añade varios procesos al final con una sola notificación a la vista."""
+        procesos = list(procesos)
+        if not procesos:
+            return
+        inicio = len(self.procesos)
+        self.beginInsertRows(QModelIndex(), inicio, inicio + len(procesos) - 1)
+        self.procesos.extend(procesos)
+        for fila, p in enumerate(procesos, inicio):
+            self._fila_de_pid[p.pid] = fila
+        self.endInsertRows()
+
+    def buscar(self, pid):
+        """Proceso con ese pid, o None."""
+        fila = self._fila_de_pid.get(pid)
+        return None if fila is None else self.procesos[fila]
+
+    def actualizar(self, pid):
+        """Avisa a la vista de que los datos del proceso cambiaron."""
+        fila = self._fila_de_pid[pid]
+        self.dataChanged.emit(self.index(fila, 0), self.index(fila, len(self.ENCABEZADOS) - 1))
+
+    def eliminar(self, pid):
+        """Quita el proceso de la lista y lo devuelve (None si no estaba)."""
+        fila = self._fila_de_pid.pop(pid, None)
+        if fila is None:
+            return None
+        self.beginRemoveRows(QModelIndex(), fila, fila)
+        eliminado = self.procesos.pop(fila)
+        for siguiente in range(fila, len(self.procesos)):
+            self._fila_de_pid[self.procesos[siguiente].pid] = siguiente
+        self.endRemoveRows()
+        return eliminado
+
+    def vaciar(self):
+        self.beginResetModel()
+        self.procesos.clear()
+        self._fila_de_pid.clear()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.procesos)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.ENCABEZADOS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        columna = index.column()
+        if columna in self._colores_boton:
+            if role == Qt.DisplayRole:
+                return "✎" if columna == self.COLUMNA_EDITAR else "✕"
+            if role == Qt.BackgroundRole:
+                return self._colores_boton[columna]
+            if role == Qt.ForegroundRole:
+                return self._color_texto_boton
+            if role == Qt.TextAlignmentRole:
+                return int(Qt.AlignCenter)
+            return None
+        if role != Qt.DisplayRole:
+            return None
+        p = self.procesos[index.row()]
+        return (str(p.pid), p.nombre, str(p.instante_llegada), str(p.tiempo_cpu_total), str(p.prioridad))[columna]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+            return None
+        return self.ENCABEZADOS[section]
+
+
+class ModeloCronograma(QAbstractTableModel):
+    """
+    Modelo del cronograma sobre un 'AlmacenCronograma'. La vista solo pide
+    las celdas visibles, así que la memoria y el coste de repintado dependen
+    del tamaño de la pantalla y no de la duración de la simulación.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.almacen = AlmacenCronograma()
+        self.columnas_minimas = 0
+        self._color_cpu = QColor("#22c55e")
+        self._color_cola = QColor("#f97316")
+        self._color_texto_cpu = QColor("#ffffff")
+
+    def reiniciar(self, procesos, columnas_minimas=0):
+        """Vacía el cronograma y define una fila por proceso."""
+        self.beginResetModel()
+        # Almacén nuevo: el anterior puede seguir referenciado (p. ej. en la caché)
+        self.almacen = AlmacenCronograma(procesos)
+        self.columnas_minimas = columnas_minimas
+        self.endResetModel()
+
+    def cargar(self, almacen):
+        """Sustituye el cronograma por uno ya completo (p. ej. cargado de un archivo)."""
+        self.beginResetModel()
+        self.almacen = almacen
+        self.columnas_minimas = 0
+        self.endResetModel()
+
+    def agregar_cambios(self, tiempo, cambios):
+        """Añade el instante 'tiempo' a partir de los estados que cambiaron en él."""
+        self.agregar_lote([(tiempo, cambios)])
+
+    def agregar_lote(self, pasos):
+        """Añade varios instantes (tiempo, cambios) con una sola notificación a la vista."""
+        if not pasos:
+            return
+        columnas_previas = self.columnCount()
+        primero, ultimo = pasos[0][0], pasos[-1][0]
+        if ultimo >= columnas_previas:
+            self.beginInsertColumns(QModelIndex(), columnas_previas, ultimo)
+        for tiempo, cambios in pasos:
+            self.almacen.agregar_cambios(tiempo, cambios)
+        if ultimo >= columnas_previas:
+            self.endInsertColumns()
+        if primero < columnas_previas and self.rowCount():
+            self.dataChanged.emit(self.index(0, primero), self.index(self.rowCount() - 1, min(ultimo, columnas_previas - 1)))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.almacen)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else max(self.almacen.num_ticks, self.columnas_minimas)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+        if role not in (Qt.DisplayRole, Qt.BackgroundRole, Qt.ForegroundRole):
+            return None
+        estado = self.almacen.estado(index.row(), index.column())
+        if role == Qt.DisplayRole:
+            return estado
+        if role == Qt.BackgroundRole:
+            if estado == 'X': return self._color_cpu
+            if estado.isdigit(): return self._color_cola
+        elif role == Qt.ForegroundRole and estado == 'X':
+            return self._color_texto_cpu
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(section)
+        return self.almacen.etiquetas[section] if section < len(self.almacen) else None
+
+
 class MainWindow(QMainWindow):
     """Ventana principal de la aplicación."""
     def __init__(self):
         super().__init__()
-        self.procesos_para_simular = []
+        self.modelo_procesos = ModeloProcesos(self)
         self.pid_counter = 1
         self.total_cpu_work = 0
 
@@ -127,8 +313,20 @@ class MainWindow(QMainWindow):
         self.animation_timer = QTimer(self)
         self.animation_timer.timeout.connect(self._avanzar_simulacion_paso)
         
-        # Variable para almacenar el generador de la simulación
-        self.simulation_generator = None
+        # Simulación en curso: el generador corre en un hilo trabajador (ver 'segundo_plano.py')
+        self.simulacion = None
+        self.planificador = None
+        # Resultados de simulaciones ya completadas, por huella de la carga y parámetros
+        self.cache_resultados = CacheResultados()
+        # Simulación consultable por instante, preparada en un hilo aparte al iniciar
+        self.navegable = None
+        self._futuro_navegable = None
+        self._ejecutor_navegacion = ThreadPoolExecutor(max_workers=1)
+        self.timer_navegacion = QTimer(self)
+        self.timer_navegacion.timeout.connect(self._comprobar_navegacion)
+        # Pasos acumulados según la velocidad elegida y el tiempo real transcurrido
+        self._credito_pasos = 0.0
+        self._ultimo_callback = 0.0
 
 
 
@@ -182,15 +380,23 @@ class MainWindow(QMainWindow):
     def crear_panel_configuracion(self):
         panel, layout, _ = self._crear_panel_base("Configuración")
         layout.addWidget(QLabel("Algoritmo de Planificación:"))
-        self.combo_algoritmo = QComboBox(); self.combo_algoritmo.addItems(["FCFS", "SJF", "SRTF", "Round Robin"])
+        self.combo_algoritmo = QComboBox(); self.combo_algoritmo.addItems(list(ALGORITMOS))
         self.combo_algoritmo.currentTextChanged.connect(self.toggle_quantum_input)
         layout.addWidget(self.combo_algoritmo)
         self.label_quantum = QLabel("Quantum de tiempo:"); self.input_quantum = QSpinBox()
         self.input_quantum.setRange(1, 100); self.input_quantum.setValue(2)
         self.label_quantum.hide(); self.input_quantum.hide()
         layout.addWidget(self.label_quantum); layout.addWidget(self.input_quantum)
+        layout.addWidget(QLabel("Velocidad (instantes por segundo):"))
+        self.input_velocidad = QSpinBox(); self.input_velocidad.setRange(1, 10000); self.input_velocidad.setValue(2)
+        self.input_velocidad.valueChanged.connect(self._actualizar_intervalo_animacion)
+        layout.addWidget(self.input_velocidad)
+        self.check_perfil = QCheckBox("Perfilar simulación")
+        layout.addWidget(self.check_perfil)
         self.btn_iniciar = QPushButton("Iniciar Simulación"); self.btn_iniciar.clicked.connect(self.iniciar_simulacion_ui)
         layout.addWidget(self.btn_iniciar)
+        self.btn_saltar_final = QPushButton("Saltar al final"); self.btn_saltar_final.setEnabled(False); self.btn_saltar_final.clicked.connect(self.saltar_al_final_ui)
+        layout.addWidget(self.btn_saltar_final)
         self.btn_reiniciar = QPushButton("Reiniciar"); self.btn_reiniciar.setObjectName("dangerButton"); self.btn_reiniciar.clicked.connect(self.reiniciar_simulacion_ui)
         layout.addWidget(self.btn_reiniciar)
         return panel
@@ -200,27 +406,55 @@ class MainWindow(QMainWindow):
         self.nombre_input = QLineEdit(placeholderText="Nombre del proceso")
         self.llegada_input = QLineEdit(placeholderText="Instante de Llegada"); self.llegada_input.setValidator(QIntValidator(0, 1000))
         self.tiempo_cpu_input = QLineEdit(placeholderText="Tiempo en CPU"); self.tiempo_cpu_input.setValidator(QIntValidator(1, 1000))
+        self.prioridad_input = QLineEdit(placeholderText="Prioridad (opcional, 0 = más urgente)"); self.prioridad_input.setValidator(QIntValidator(0, 1000))
         self.btn_agregar = QPushButton("Agregar Proceso"); self.btn_agregar.clicked.connect(self.agregar_proceso_a_lista)
-        layout.addWidget(self.nombre_input); layout.addWidget(self.llegada_input); layout.addWidget(self.tiempo_cpu_input); layout.addWidget(self.btn_agregar)
+        self.btn_importar = QPushButton("Importar procesos..."); self.btn_importar.clicked.connect(self.importar_procesos_ui)
+        layout.addWidget(self.nombre_input); layout.addWidget(self.llegada_input); layout.addWidget(self.tiempo_cpu_input)
+        layout.addWidget(self.prioridad_input); layout.addWidget(self.btn_agregar); layout.addWidget(self.btn_importar)
         return panel
 
     def crear_panel_procesos_agregados(self):
         panel, layout, _ = self._crear_panel_base("Procesos a Simular")
-        self.tabla_procesos_nuevos = QTableWidget()
-        self.tabla_procesos_nuevos.setColumnCount(6); self.tabla_procesos_nuevos.setHorizontalHeaderLabels(["PID", "Nombre", "Llegada", "CPU", "", ""])
+        # Vista sobre 'ModeloProcesos': un clic en las dos últimas columnas edita o elimina
+        self.tabla_procesos_nuevos = QTableView()
+        self.tabla_procesos_nuevos.setModel(self.modelo_procesos)
+        self.tabla_procesos_nuevos.setStyleSheet("QTableView { background-color: #1e293b; color: #e2e8f0; border: none; gridline-color: #334155; }")
+        self.tabla_procesos_nuevos.clicked.connect(self._clic_en_proceso)
         header = self.tabla_procesos_nuevos.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents); header.setSectionResizeMode(4, QHeaderView.ResizeToContents); header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
+        # Anchos fijos: ajustarse al contenido obligaría a medir todas las filas en cada cambio
+        for columna, ancho in ((0, 60), (ModeloProcesos.COLUMNA_EDITAR, 40), (ModeloProcesos.COLUMNA_ELIMINAR, 40)):
+            header.setSectionResizeMode(columna, QHeaderView.Fixed); header.resizeSection(columna, ancho)
         self.tabla_procesos_nuevos.verticalHeader().setVisible(False)
         layout.addWidget(self.tabla_procesos_nuevos)
         return panel
 
     def crear_panel_cronograma(self):
         panel, layout, title_label = self._crear_panel_base("Cronograma de Ejecución")
-        self.tabla_cronograma = QTableWidget()
-        self.tabla_cronograma.setShowGrid(True); self.tabla_cronograma.setStyleSheet("QTableWidget { gridline-color: #334155; }")
-        scroll_area = QScrollArea(); scroll_area.setWidgetResizable(True); scroll_area.setWidget(self.tabla_cronograma)
-        layout.addWidget(scroll_area)
+        # Vista virtualizada: el modelo solo genera las celdas visibles
+        self.modelo_cronograma = ModeloCronograma(self)
+        self.tabla_cronograma = QTableView()
+        self.tabla_cronograma.setModel(self.modelo_cronograma)
+        self.tabla_cronograma.setShowGrid(True); self.tabla_cronograma.setStyleSheet("QTableView { background-color: #1e293b; color: #e2e8f0; border: none; gridline-color: #334155; }")
+        self.tabla_cronograma.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.tabla_cronograma.horizontalHeader().setDefaultSectionSize(35)
+        layout.addWidget(self.tabla_cronograma)
+        # Navegación por instantes: se habilita cuando 'SimulacionNavegable' termina su pasada
+        navegacion_layout = QHBoxLayout()
+        self.btn_paso_atras = QPushButton("◀"); self.btn_paso_atras.clicked.connect(lambda: self._mover_instante(-1))
+        self.slider_instante = QSlider(Qt.Horizontal); self.slider_instante.setTracking(False)
+        self.slider_instante.valueChanged.connect(self._ir_a_instante)
+        self.btn_paso_adelante = QPushButton("▶"); self.btn_paso_adelante.clicked.connect(lambda: self._mover_instante(1))
+        self.label_instante = QLabel("")
+        navegacion_layout.addWidget(self.btn_paso_atras); navegacion_layout.addWidget(self.slider_instante, 1)
+        navegacion_layout.addWidget(self.btn_paso_adelante); navegacion_layout.addWidget(self.label_instante)
+        layout.addLayout(navegacion_layout)
+        self._habilitar_navegacion(False)
+        archivo_layout = QHBoxLayout()
+        self.btn_guardar_cronograma = QPushButton("Guardar cronograma"); self.btn_guardar_cronograma.clicked.connect(self.guardar_cronograma_ui)
+        self.btn_abrir_cronograma = QPushButton("Abrir cronograma"); self.btn_abrir_cronograma.clicked.connect(self.abrir_cronograma_ui)
+        archivo_layout.addWidget(self.btn_guardar_cronograma); archivo_layout.addWidget(self.btn_abrir_cronograma); archivo_layout.addStretch(1)
+        layout.addLayout(archivo_layout)
         return panel, self.tabla_cronograma, title_label
 
     def crear_panel_estadisticas(self):
@@ -231,20 +465,57 @@ class MainWindow(QMainWindow):
         self.tabla_estadisticas.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.tabla_estadisticas.verticalHeader().setVisible(False)
         layout.addWidget(self.tabla_estadisticas)
+        # Métricas globales mientras la simulación avanza (y las finales al terminar)
+        self.label_metricas = QLabel("")
+        layout.addWidget(self.label_metricas)
+        # Resumen del perfilado (solo si se marcó "Perfilar simulación")
+        self.label_perfil = QLabel(); self.label_perfil.setFont(QFont("Consolas", 10)); self.label_perfil.hide()
+        layout.addWidget(self.label_perfil)
         return panel, self.tabla_estadisticas
 
     def agregar_proceso_a_lista(self):
         try:
             nombre = self.nombre_input.text().strip() or f"Proceso {self.pid_counter}"
             tiempo_cpu = int(self.tiempo_cpu_input.text()); llegada = int(self.llegada_input.text())
+            prioridad = int(self.prioridad_input.text() or 0)
             if tiempo_cpu <= 0:
                 CustomErrorDialog("El tiempo en CPU debe ser mayor que cero.", self).exec(); return
-            self.procesos_para_simular.append(Proceso(self.pid_counter, nombre, tiempo_cpu, llegada))
+            self.modelo_procesos.agregar([Proceso(self.pid_counter, nombre, tiempo_cpu, llegada, prioridad)])
             self.pid_counter += 1
-            self._actualizar_tabla_procesos_nuevos()
-            self.nombre_input.clear(); self.tiempo_cpu_input.clear(); self.llegada_input.clear()
+            self.nombre_input.clear(); self.tiempo_cpu_input.clear(); self.llegada_input.clear(); self.prioridad_input.clear()
         except ValueError:
             CustomErrorDialog("Los campos 'Llegada' y 'Tiempo en CPU' deben ser números válidos.", self).exec()
+
+    def importar_procesos_ui(self):
+        """Añade de una vez los procesos de un archivo de carga (CSV, JSON Lines o JSON, ver 'cargas.py')."""
+        ruta, _ = QFileDialog.getOpenFileName(self, "Importar procesos", "", "Cargas (*.csv *.jsonl *.ndjson *.json);;Todos los archivos (*)")
+        if ruta:
+            self.importar_procesos(ruta)
+
+    def importar_procesos(self, ruta):
+        """
+        Lee el archivo completo antes de tocar la lista, así que un error de
+        formato no deja la importación a medias. Los procesos reciben PIDs
+        nuevos consecutivos para no chocar con los que ya estaban.
+        """
+        try:
+            filas = list(leer_registros(ruta))
+        except (OSError, ErrorCarga) as e:
+            CustomErrorDialog(f"No se pudo importar la carga:\n{e}", self).exec()
+            return 0
+        pid = self.pid_counter
+        procesos = []
+        for _, nombre, tiempo_cpu, llegada, prioridad in filas:
+            procesos.append(Proceso(pid, nombre or f"Proceso {pid}", tiempo_cpu, llegada, prioridad))
+            pid += 1
+        self.pid_counter = pid
+        self.modelo_procesos.agregar(procesos)
+        return len(procesos)
+
+    @property
+    def procesos_para_simular(self):
+        """Procesos de la lista "Procesos a Simular", en el orden en que se añadieron."""
+        return self.modelo_procesos.procesos
     
     def iniciar_simulacion_ui(self):
         if not self.procesos_para_simular:
@@ -253,9 +524,10 @@ class MainWindow(QMainWindow):
         
         # Deshabilitar botones para evitar conflictos durante la animación
         self.btn_iniciar.setEnabled(False)
-        self.btn_agregar.setEnabled(False)
+        self.btn_agregar.setEnabled(False); self.btn_importar.setEnabled(False)
 
         self.btn_reiniciar.setEnabled(True)
+        self.btn_saltar_final.setEnabled(True)
 
         # Calcular el trabajo total y reiniciar la barra de progreso
         self.total_cpu_work = sum(p.tiempo_cpu_total for p in self.procesos_para_simular)
@@ -264,102 +536,176 @@ class MainWindow(QMainWindow):
         algoritmo = self.combo_algoritmo.currentText()
         self.cronograma_title_label.setText(f"Cronograma de Ejecución ({algoritmo}) - Ejecutando...")
         
-        # Preparamos la tabla del cronograma
-        self.tabla_cronograma.clear()
+        # Preparamos el cronograma: una fila por proceso, ordenadas por PID
         procesos_ordenados = sorted(self.procesos_para_simular, key=lambda p: p.pid)
-        self.tabla_cronograma.setRowCount(len(procesos_ordenados))
-        self.tabla_cronograma.setVerticalHeaderLabels([f"{p.nombre} (P{p.pid} )" for p in procesos_ordenados])
-        self.tabla_cronograma.setColumnCount(50) # Un número inicial de columnas
-        self.tabla_cronograma.setHorizontalHeaderLabels([str(i) for i in range(50)])
-        self.tabla_cronograma.horizontalHeader().setDefaultSectionSize(35)
-
-        # Creamos el planificador y OBTENEMOS EL GENERADOR
-        planificador = Planificador(self.procesos_para_simular, algoritmo, self.input_quantum.value())
-        self.simulation_generator = planificador.ejecutar_simulacion()
+        self.modelo_cronograma.reiniciar(procesos_ordenados, COLUMNAS_MINIMAS_CRONOGRAMA)
+        self.modelo_cronograma.almacen.metadatos = {"algoritmo": algoritmo, "quantum": self.input_quantum.value()}
+
+        # Creamos el planificador y OBTENEMOS EL GENERADOR (en modo delta:
+        # cada paso trae solo los procesos que cambiaron de estado)
+        self.planificador = Planificador(self.procesos_para_simular, algoritmo, self.input_quantum.value())
+        self.planificador.intervalo_puntos_control = INTERVALO_PUNTOS_CONTROL
+        if self.check_perfil.isChecked():
+            self.planificador.perfil = PerfilSimulacion()
+        self.simulacion = SimulacionEnSegundoPlano(self.planificador.ejecutar_simulacion(modo_delta=True, metricas=True)).iniciar()
+        self._preparar_navegacion()
         
         # Limpiamos tablas anteriores
         self.tabla_estadisticas.setRowCount(0)
+        self.label_perfil.hide(); self.label_metricas.setText("")
 
-        # Iniciamos el temporizador para que se ejecute cada 0.5 segundos (500 ms)
-        self.animation_timer.start(500)
+        # Iniciamos el temporizador según la velocidad elegida (2 instantes por segundo por defecto)
+        self._credito_pasos = 0.0
+        self._ultimo_callback = time.perf_counter()
+        self.animation_timer.start(self._intervalo_animacion())
 
+    def _intervalo_animacion(self):
+        """Milisegundos entre callbacks: uno por instante a baja velocidad, uno por cuadro a alta."""
+        return max(1000 // self.input_velocidad.value(), INTERVALO_MINIMO_MS)
+
+    def _actualizar_intervalo_animacion(self):
+        if self.animation_timer.isActive():
+            self.animation_timer.setInterval(self._intervalo_animacion())
 
     def _avanzar_simulacion_paso(self):
+        # Cuántos instantes tocan según la velocidad y el tiempo real transcurrido
+        ahora = time.perf_counter()
+        velocidad = self.input_velocidad.value()
+        self._credito_pasos = min(self._credito_pasos + velocidad * (ahora - self._ultimo_callback), velocidad)
+        self._ultimo_callback = ahora
+        pasos_pendientes = max(int(self._credito_pasos), 1)
+
+        # Tomamos solo los pasos que el trabajador ya calculó (si va por detrás, no
+        # esperamos) y los añadimos por lotes sin pasarnos del presupuesto del cuadro
+        avanzados, ultimo = 0, None
+        while avanzados < pasos_pendientes:
+            pasos = self.simulacion.tomar(min(TAM_LOTE, pasos_pendientes - avanzados))
+            if not pasos:
+                break
+            # El modelo añade las columnas que hagan falta con una sola notificación por lote
+            self.modelo_cronograma.agregar_lote([(paso[0], paso[1]) for paso in pasos])
+            avanzados, ultimo = avanzados + len(pasos), pasos[-1]
+            if time.perf_counter() - ahora > PRESUPUESTO_CUADRO_S:
+                break
+        if self.simulacion.agotada:
+            self._finalizar_simulacion(self.simulacion.resultado)
+            return
+        if ultimo is None:
+            return
+        self._credito_pasos = max(self._credito_pasos - avanzados, 0.0)
+
+        if self.total_cpu_work > 0:
+            trabajo_realizado = self.total_cpu_work - ultimo[2]
+            porcentaje = (trabajo_realizado / self.total_cpu_work) * 100
+            self.progress_bar.setValue(int(porcentaje))
+        self._mostrar_metricas_en_curso(ultimo[3])
+
+        # Hacemos scroll para que la columna actual sea visible
+        self.tabla_cronograma.scrollTo(self.modelo_cronograma.index(0, ultimo[0]))
+        self._mostrar_instante_en_slider(ultimo[0])
+
+    def saltar_al_final_ui(self):
+        """Ejecuta lo que queda de la simulación a máxima velocidad y repinta el cronograma una sola vez."""
+        if self.simulacion is None:
+            return
+        self.animation_timer.stop()
+        resultado = self.cache_resultados.obtener(huella(self.planificador))
+        if resultado is not None:
+            # Ya se simuló esta misma carga con estos parámetros
+            self._detener_simulacion()
+            self.modelo_cronograma.cargar(resultado.cronograma)
+            self._finalizar_simulacion(resultado.estadisticas, resultado.agregados)
+            return
+        modelo = self.modelo_cronograma
+        modelo.beginResetModel()
         try:
-            # Pedimos el siguiente estado al generador
-            tiempo_actual, estados_del_tick, tiempo_restante_total = next(self.simulation_generator)
-            
-            if self.total_cpu_work > 0:
-                trabajo_realizado = self.total_cpu_work - tiempo_restante_total
-                porcentaje = (trabajo_realizado / self.total_cpu_work) * 100
-                self.progress_bar.setValue(int(porcentaje))
-
-            # Si necesitamos más columnas en la tabla, las añadimos
-            if tiempo_actual >= self.tabla_cronograma.columnCount():
-                self.tabla_cronograma.setColumnCount(tiempo_actual + 10)
-                # Actualizamos las cabeceras para las nuevas columnas
-                self.tabla_cronograma.setHorizontalHeaderLabels([str(i) for i in range(self.tabla_cronograma.columnCount())])
-
-
-            procesos_ordenados = sorted(self.procesos_para_simular, key=lambda p: p.pid)
-            
-            # Rellenamos la columna para el tiempo_actual
-            for r, p in enumerate(procesos_ordenados):
-                estado = estados_del_tick.get(p.pid, "")
-                item = QTableWidgetItem(str(estado))
-                item.setTextAlignment(Qt.AlignCenter)
-
-                if estado == 'X':
-                    item.setBackground(QColor("#22c55e"))
-                    item.setForeground(QColor("#ffffff"))
-                elif estado.isdigit():
-                    item.setBackground(QColor("#f97316"))
-                
-                self.tabla_cronograma.setItem(r, tiempo_actual, item)
-            
-            # Hacemos scroll para que la columna actual sea visible
-            self.tabla_cronograma.scrollToItem(self.tabla_cronograma.item(0, tiempo_actual))
-
-        except StopIteration as e:
-            # El generador se ha agotado (la simulación terminó)
-            self.animation_timer.stop()
-            self.cronograma_title_label.setText(f"Cronograma de Ejecución ({self.combo_algoritmo.currentText()}) - Finalizado")
-            self.progress_bar.setValue(100)
-
-            # El valor de 'return' del generador está en e.value
-            estadisticas_dict = e.value
-            if estadisticas_dict:
-                 estadisticas_ordenadas = [estadisticas_dict[p.pid] for p in self.procesos_para_simular if p.pid in estadisticas_dict]
-                 self.mostrar_estadisticas(estadisticas_ordenadas)
-            
-            # Volvemos a habilitar los botones
-            self.btn_iniciar.setEnabled(True)
-            self.btn_reiniciar.setEnabled(True)
-            self.btn_agregar.setEnabled(True)
-
-
-    def mostrar_cronograma(self, cronograma, duracion_total):
-        self.tabla_cronograma.clearContents()
-        columnas = max(duracion_total + 1, 30)
-        self.tabla_cronograma.setColumnCount(columnas)
-        self.tabla_cronograma.setHorizontalHeaderLabels([str(i) for i in range(columnas)])
-        procesos_ordenados = sorted(self.procesos_para_simular, key=lambda p: p.pid)
-        self.tabla_cronograma.setRowCount(len(procesos_ordenados))
-        self.tabla_cronograma.setVerticalHeaderLabels([f"{p.nombre} (P{p.pid})" for p in procesos_ordenados])
-        for r, p in enumerate(procesos_ordenados):
-            for c, estado in enumerate(cronograma.get(p.pid, [])):
-                if c >= columnas: break
-                item = QTableWidgetItem(str(estado)); item.setTextAlignment(Qt.AlignCenter)
-                if estado == 'X': item.setBackground(QColor("#22c55e")); item.setForeground(QColor("#ffffff"))
-                elif estado.isdigit(): item.setBackground(QColor("#f97316"))
-                self.tabla_cronograma.setItem(r, c, item)
-        self.tabla_cronograma.resizeColumnsToContents()
+            while not self.simulacion.agotada:
+                for tiempo_actual, cambios, *_ in self.simulacion.tomar(TAM_LOTE, bloquear=True):
+                    modelo.almacen.agregar_cambios(tiempo_actual, cambios)
+        finally:
+            modelo.endResetModel()
+        self._finalizar_simulacion(self.simulacion.resultado)
+        if modelo.columnCount():
+            self.tabla_cronograma.scrollTo(modelo.index(0, modelo.almacen.num_ticks - 1))
+
+    def _finalizar_simulacion(self, estadisticas_dict, agregados=None):
+        # El generador se ha agotado (la simulación terminó)
+        self.animation_timer.stop()
+        desde_cache = agregados is not None
+        if agregados is None:
+            agregados = self.planificador.estadisticas_columnares().agregados
+            self.cache_resultados.guardar(huella(self.planificador),
+                                          ResultadoSimulacion(estadisticas_dict, agregados, self.modelo_cronograma.almacen))
+        self.simulacion = None
+        self._mostrar_instante_en_slider(self.modelo_cronograma.almacen.num_ticks - 1)
+        self.cronograma_title_label.setText(f"Cronograma de Ejecución ({self.combo_algoritmo.currentText()}) - Finalizado")
+        self.progress_bar.setValue(100)
+
+        # 'estadisticas_dict' es el valor de 'return' del generador
+        self._mostrar_metricas_en_curso(agregados)
+        if estadisticas_dict:
+             estadisticas_ordenadas = [estadisticas_dict[p.pid] for p in self.procesos_para_simular if p.pid in estadisticas_dict]
+             self.mostrar_estadisticas(estadisticas_ordenadas, agregados["I_promedio"])
+        # Con un resultado de la caché la simulación no llegó a completarse y el perfil sería parcial
+        perfil = self.planificador.perfil if self.planificador else None
+        if perfil is not None and not desde_cache:
+            self.label_perfil.setText(perfil.resumen()); self.label_perfil.show()
         
-    def mostrar_estadisticas(self, estadisticas):
+        # Volvemos a habilitar los botones
+        self.btn_iniciar.setEnabled(True)
+        self.btn_reiniciar.setEnabled(True)
+        self.btn_agregar.setEnabled(True); self.btn_importar.setEnabled(True)
+        self.btn_saltar_final.setEnabled(False)
+
+
+    def mostrar_cronograma(self, cronograma):
+        """Muestra un cronograma completo ('AlmacenCronograma') sin volver a simular."""
+        self.modelo_cronograma.cargar(cronograma)
+        algoritmo = cronograma.metadatos.get("algoritmo")
+        titulo = f"Cronograma de Ejecución ({algoritmo})" if algoritmo else "Cronograma de Ejecución"
+        self.cronograma_title_label.setText(titulo)
+
+    def guardar_cronograma_ui(self):
+        if self.simulacion is not None or not self.modelo_cronograma.almacen.num_ticks:
+            CustomErrorDialog("No hay un cronograma finalizado para guardar.", self).exec()
+            return
+        ruta, _ = QFileDialog.getSaveFileName(self, "Guardar cronograma", "", "Cronograma binario (*.crono);;JSON (*.json)")
+        if not ruta: return
+        # Tras retroceder con el deslizador la vista solo muestra una parte del cronograma
+        almacen = self.navegable.cronograma if self.navegable else self.modelo_cronograma.almacen
+        try:
+            almacen.guardar(ruta)
+        except OSError as e:
+            CustomErrorDialog(f"No se pudo guardar el cronograma: {e.strerror}", self).exec()
+
+    def abrir_cronograma_ui(self):
+        ruta, _ = QFileDialog.getOpenFileName(self, "Abrir cronograma", "", "Cronogramas (*.crono *.json);;Todos los archivos (*)")
+        if not ruta: return
+        try:
+            cronograma = AlmacenCronograma.cargar(ruta)
+        except OSError as e:
+            CustomErrorDialog(f"No se pudo abrir el cronograma: {e.strerror}", self).exec(); return
+        except ErrorCronograma as e:
+            CustomErrorDialog(str(e), self).exec(); return
+        self._detener_simulacion()
+        self.planificador = None  # El cronograma abierto no corresponde a la última simulación
+        self._descartar_navegacion()
+        self.btn_saltar_final.setEnabled(False)
+        self.btn_iniciar.setEnabled(True); self.btn_agregar.setEnabled(True); self.btn_importar.setEnabled(True)
+        self.tabla_estadisticas.setRowCount(0); self.label_perfil.hide(); self.label_metricas.setText("")
+        self.mostrar_cronograma(cronograma)
+
+    def _mostrar_metricas_en_curso(self, metricas):
+        """Resume los agregados ('MetricasEnCurso' o los finales) en una línea."""
+        self.label_metricas.setText(
+            f"Finalizados: {metricas['procesos_finalizados']} · T medio: {metricas['T_promedio']:.2f} · "
+            f"Te medio: {metricas['Te_promedio']:.2f} · Te p90: {metricas['Te_p90']:.2f} · "
+            f"Throughput: {metricas['throughput']:.3f} proc/u · CPU: {metricas['utilizacion_cpu']:.0%}")
+
+    def mostrar_estadisticas(self, estadisticas, promedio=None):
         self.tabla_estadisticas.setRowCount(0)
         if not estadisticas: return
         self.tabla_estadisticas.setRowCount(len(estadisticas))
-        total_indices = 0
         for r, data in enumerate(estadisticas):
             self.tabla_estadisticas.setItem(r, 0, QTableWidgetItem(data["proceso"]))
             self.tabla_estadisticas.setItem(r, 1, QTableWidgetItem(str(data["ti"])))
@@ -368,9 +714,9 @@ class MainWindow(QMainWindow):
             self.tabla_estadisticas.setItem(r, 4, QTableWidgetItem(str(data["T"])))
             self.tabla_estadisticas.setItem(r, 5, QTableWidgetItem(str(data["Te"])))
             self.tabla_estadisticas.setItem(r, 6, QTableWidgetItem(f'{data["I"]:.2f}')) 
-            total_indices += data["I"]
         if estadisticas:
-            promedio = total_indices / len(estadisticas)
+            if promedio is None:
+                promedio = sum(data["I"] for data in estadisticas) / len(estadisticas)
             avg_row = self.tabla_estadisticas.rowCount()
             self.tabla_estadisticas.insertRow(avg_row)
             self.tabla_estadisticas.setSpan(avg_row, 0, 1, 6)
@@ -380,61 +726,173 @@ class MainWindow(QMainWindow):
             self.tabla_estadisticas.setItem(avg_row, 0, label_item)
             self.tabla_estadisticas.setItem(avg_row, 6, promedio_item)
 
-    def reiniciar_simulacion_ui(self):
-        self.animation_timer.stop() # Detenemos el timer 
-        self.procesos_para_simular.clear()
-        self.pid_counter = 1
-        self.procesos_para_simular.clear(); self.pid_counter = 1
-        for table in [self.tabla_procesos_nuevos, self.tabla_cronograma, self.tabla_estadisticas]:
-            table.setRowCount(0)
-        self.tabla_cronograma.setColumnCount(0); self.btn_iniciar.setEnabled(True)
+    def _preparar_navegacion(self):
+        """Lanza en segundo plano la pasada por eventos que permite saltar a cualquier instante."""
+        self._descartar_navegacion()
+        self._futuro_navegable = self._ejecutor_navegacion.submit(SimulacionNavegable, self.planificador)
+        self.timer_navegacion.start(100)
+
+    def _descartar_navegacion(self):
+        # Una pasada en curso no se puede interrumpir, pero su resultado se ignora
+        self._futuro_navegable = None
+        self.navegable = None
+        self.timer_navegacion.stop()
+        self._habilitar_navegacion(False)
+        self.label_instante.setText("")
+
+    def _comprobar_navegacion(self):
+        if self._futuro_navegable is None or not self._futuro_navegable.done():
+            return
+        self.timer_navegacion.stop()
+        self.navegable = self._futuro_navegable.result()
+        self._futuro_navegable = None
+        self.slider_instante.blockSignals(True)
+        self.slider_instante.setRange(0, max(self.navegable.num_ticks - 1, 0))
+        self.slider_instante.blockSignals(False)
+        self._habilitar_navegacion(True)
+        self._mostrar_instante_en_slider(self.modelo_cronograma.almacen.num_ticks - 1)
+
+    def _habilitar_navegacion(self, habilitar):
+        for control in (self.btn_paso_atras, self.slider_instante, self.btn_paso_adelante):
+            control.setEnabled(habilitar)
+
+    def _mostrar_instante_en_slider(self, tiempo):
+        """Mueve el deslizador sin provocar un salto (la vista ya está en ese instante)."""
+        if self.navegable is None or tiempo < 0:
+            return
+        self.slider_instante.blockSignals(True)
+        self.slider_instante.setValue(tiempo)
+        self.slider_instante.blockSignals(False)
+        self._describir_instante(tiempo)
+
+    def _describir_instante(self, tiempo):
+        visibles, _ = self.navegable.estado_en(tiempo)
+        en_cpu = next((pid for pid, estado in visibles.items() if estado == 'X'), None)
+        cola = sorted((int(estado), pid) for pid, estado in visibles.items() if estado != 'X')
+        texto = f"t = {tiempo} · CPU: {f'P{en_cpu}' if en_cpu is not None else 'libre'}"
+        if cola:
+            texto += " · Cola: " + ", ".join(f"P{pid}" for _, pid in cola)
+        self.label_instante.setText(texto)
+
+    def _mover_instante(self, desplazamiento):
+        self.slider_instante.setValue(self.slider_instante.value() + desplazamiento)
+
+    def _ir_a_instante(self, tiempo):
+        """
+        Muestra el cronograma hasta 'tiempo' sin reproducir los instantes
+        anteriores. Si la animación estaba en marcha, continúa desde ahí.
+        """
+        navegable = self.navegable
+        if navegable is None or not 0 <= tiempo < navegable.num_ticks:
+            return
+        animando = self.simulacion is not None
+        if animando:
+            self._detener_simulacion()
+        procesos = sorted(navegable.planificador.tabla, key=lambda p: p.pid)
+        self.modelo_cronograma.cargar(navegable.cronograma.prefijo(procesos, tiempo + 1))
+        self.tabla_cronograma.scrollTo(self.modelo_cronograma.index(0, tiempo))
+        self._describir_instante(tiempo)
+        if self.total_cpu_work > 0:
+            _, restante = navegable.estado_en(tiempo)
+            self.progress_bar.setValue(int((self.total_cpu_work - restante) / self.total_cpu_work * 100))
+        if animando:
+            anterior = self.planificador
+            self.planificador = Planificador(anterior.tabla.compartida(), anterior.algoritmo, anterior.quantum, anterior.limite_tiempo)
+            self.planificador.intervalo_puntos_control = INTERVALO_PUNTOS_CONTROL
+            self.planificador.perfil = None  # Un perfil de media simulación sería engañoso
+            self.simulacion = SimulacionEnSegundoPlano(navegable.pasos_desde(self.planificador, tiempo + 1, metricas=True)).iniciar()
+            self._credito_pasos = 0.0
+            self._ultimo_callback = time.perf_counter()
+            self.animation_timer.start(self._intervalo_animacion())
+
+    def _detener_simulacion(self):
+        """Para la animación y cancela el hilo trabajador, si hay una simulación en curso."""
+        self.animation_timer.stop()
+        if self.simulacion is not None:
+            self.simulacion.cancelar()
+            self.simulacion = None
+
+    def _vaciar_resultados(self):
+        """Descarta el cronograma, las estadísticas y la navegación de la última simulación."""
+        self._detener_simulacion() # Detenemos el timer y el trabajador
+        self.planificador = None
+        self._descartar_navegacion()
+        self.btn_saltar_final.setEnabled(False)
+        self.tabla_estadisticas.setRowCount(0)
+        self.label_perfil.hide(); self.label_metricas.setText("")
+        self.modelo_cronograma.reiniciar([])
         self.cronograma_title_label.setText("Cronograma de Ejecución")
         self.progress_bar.setValue(0)
+
+    def reiniciar_simulacion_ui(self):
+        self._vaciar_resultados()
+        self.modelo_procesos.vaciar(); self.pid_counter = 1
         
         # Reactivamos TODOS los botones para dejar la UI en su estado inicial.
         self.btn_iniciar.setEnabled(True)
-        self.btn_agregar.setEnabled(True)  
+        self.btn_agregar.setEnabled(True); self.btn_importar.setEnabled(True)  
         self.btn_reiniciar.setEnabled(True)
 
-    def _actualizar_tabla_procesos_nuevos(self):
-        self.tabla_procesos_nuevos.setRowCount(0)
-        # Estilo para los botones de icono
-        btn_style = "QPushButton { font-size: 18px; color: #ffffff; padding: 5px; max-width: 40px; border-radius: 4px; background-color: #3b82f6; } QPushButton:hover { background-color: #2563eb; }"
-        for p in self.procesos_para_simular:
-            row = self.tabla_procesos_nuevos.rowCount(); self.tabla_procesos_nuevos.insertRow(row)
-            self.tabla_procesos_nuevos.setItem(row, 0, QTableWidgetItem(str(p.pid)))
-            self.tabla_procesos_nuevos.setItem(row, 1, QTableWidgetItem(p.nombre))
-            self.tabla_procesos_nuevos.setItem(row, 2, QTableWidgetItem(str(p.instante_llegada)))
-            self.tabla_procesos_nuevos.setItem(row, 3, QTableWidgetItem(str(p.tiempo_cpu_total)))
-            
-            btn_editar = QPushButton("✎"); btn_editar.setStyleSheet(btn_style) 
-            btn_eliminar = QPushButton("✕"); btn_eliminar.setStyleSheet(btn_style.replace("#3b82f6", "#ef4444").replace("#2563eb", "#dc2626")) # <-- Icono minimalista
-            
-            pid = p.pid
-            btn_editar.clicked.connect(lambda ch, p_id=pid: self.editar_proceso_ui(p_id))
-            btn_eliminar.clicked.connect(lambda ch, p_id=pid: self.eliminar_proceso_ui(p_id))
-            
-            self.tabla_procesos_nuevos.setCellWidget(row, 4, btn_editar)
-            self.tabla_procesos_nuevos.setCellWidget(row, 5, btn_eliminar)
-    
+    def _clic_en_proceso(self, index):
+        pid = self.modelo_procesos.procesos[index.row()].pid
+        if index.column() == ModeloProcesos.COLUMNA_EDITAR:
+            self.editar_proceso_ui(pid)
+        elif index.column() == ModeloProcesos.COLUMNA_ELIMINAR:
+            self.eliminar_proceso_ui(pid)
+
     def eliminar_proceso_ui(self, pid):
-        self.procesos_para_simular = [p for p in self.procesos_para_simular if p.pid != pid]
-        self._actualizar_tabla_procesos_nuevos()
+        eliminado = self.modelo_procesos.eliminar(pid)
+        if eliminado:
+            self._resimular_tras_cambio(eliminado.instante_llegada)
 
     def editar_proceso_ui(self, pid):
-        proceso = next((p for p in self.procesos_para_simular if p.pid == pid), None)
+        proceso = self.modelo_procesos.buscar(pid)
         if not proceso: return
         dialog = EditProcessDialog(proceso, self)
         if dialog.exec() == QDialog.Accepted:
             data = dialog.get_data()
+            llegada_anterior = proceso.instante_llegada
             proceso.nombre = data["nombre"] or f"Proceso {proceso.pid}"
             proceso.instante_llegada = data["llegada"]
             proceso.tiempo_cpu_total = data["tiempo_cpu"]
-            self._actualizar_tabla_procesos_nuevos()
+            proceso.prioridad = data["prioridad"]
+            self.modelo_procesos.actualizar(pid)
+            self._resimular_tras_cambio(min(llegada_anterior, proceso.instante_llegada))
+
+    def _resimular_tras_cambio(self, instante):
+        """
+        Tras editar o eliminar un proceso que llega en 'instante', actualiza el
+        cronograma ya terminado: reanuda desde el último punto de control
+        anterior a ese instante y solo recalcula lo que viene después.
+        """
+        anterior = self.planificador
+        if anterior is None or self.simulacion is not None:
+            return
+        if not self.procesos_para_simular:
+            self._vaciar_resultados()  # Sin procesos no queda nada que mostrar
+            return
+        if self.combo_algoritmo.currentText() != anterior.algoritmo or self.input_quantum.value() != anterior.quantum:
+            return  # Con otra configuración hay que simular de nuevo con "Iniciar"
+        self.planificador = Planificador(self.procesos_para_simular, anterior.algoritmo, anterior.quantum)
+        self.planificador.intervalo_puntos_control = INTERVALO_PUNTOS_CONTROL
+        punto = self.planificador.heredar_puntos_control(anterior, instante)
+        if punto is None:
+            self.planificador = anterior
+            return
+        # Conservamos el cronograma anterior al punto de control y recalculamos el resto
+        procesos_ordenados = sorted(self.procesos_para_simular, key=lambda p: p.pid)
+        # (si se retrocedió con el deslizador, la vista no tiene el cronograma completo)
+        completo = self.navegable.cronograma if self.navegable else self.modelo_cronograma.almacen
+        self.modelo_cronograma.cargar(completo.prefijo(procesos_ordenados, punto.tiempo))
+        self.total_cpu_work = sum(p.tiempo_cpu_total for p in self.procesos_para_simular)
+        self.tabla_estadisticas.setRowCount(0); self.label_perfil.hide(); self.label_metricas.setText("")
+        self.simulacion = SimulacionEnSegundoPlano(self.planificador.ejecutar_simulacion(modo_delta=True, desde=punto, metricas=True)).iniciar()
+        self._preparar_navegacion()
+        self.saltar_al_final_ui()
 
     def toggle_quantum_input(self, text):
-        is_rr = (text == "Round Robin")
-        self.label_quantum.setVisible(is_rr); self.input_quantum.setVisible(is_rr)
+        usa_quantum = text in ALGORITMOS_CON_QUANTUM
+        self.label_quantum.setVisible(usa_quantum); self.input_quantum.setVisible(usa_quantum)
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
@@ -1,15 +1,107 @@
+"""
+Punto de entrada del simulador.
+
+    python Codigos/main.py                    # Abre la interfaz gráfica
+    python Codigos/main.py --tiempos          # Igual, e informa de los tiempos de arranque
+    python Codigos/main.py ejecutar carga.csv --algoritmo SRTF   # Sin interfaz (órdenes de 'cli.py')
+    python Codigos/main.py servir --puerto 8765                  # Servicio HTTP (ver 'servicio.py')
+    python Codigos/main.py --help             # Lista las órdenes
+
+PySide6 y 'gui' solo se importan cuando se pide la interfaz gráfica, así que
+las órdenes sin interfaz arrancan sin cargar Qt. Una orden o una opción
+desconocida termina con un error (código 2) en lugar de abrir la ventana. Con '--tiempos' se muestra
+en la salida de errores cuánto tarda cada fase del arranque (importaciones,
+creación de la aplicación y de la ventana, primer evento).
+"""
+from time import perf_counter
+
+INICIO = perf_counter()
+
 import sys
-#Importamos la Clase QApplicationpara gestionarla  la aplicacion
-from PySide6.QtWidgets import QApplication
-from gui import MainWindow
 
-if __name__ == "main":
-    # La aplicación se crea como antes
-    app = QApplication(sys.argv)
+# Órdenes que se ejecutan sin interfaz gráfica
+COMANDOS_CLI = ("ejecutar", "barrido", "generar", "reproducir")
+COMANDO_SERVICIO = "servir"
+OPCIONES_AYUDA = ("-h", "--help")
+
+AYUDA = """uso: main.py [--tiempos] [orden [argumentos...]]
+
+Sin orden abre la interfaz gráfica. Órdenes sin interfaz:
+  ejecutar     Simula una o más cargas con un algoritmo
+  barrido      Compara algoritmos y quantums sobre las mismas cargas
+  generar      Genera una carga sintética reproducible
+  reproducir   Reproduce trazas grandes sin cargarlas en memoria
+  servir       Servicio local de simulación (HTTP/JSON)
+
+Opciones:
+  -h, --help   Muestra esta ayuda y termina
+  --tiempos    Informa en la salida de errores de los tiempos de arranque
+
+'main.py <orden> --help' muestra los argumentos de cada orden."""
+
 
-    #Creamos la ventana principal (que ahora contiene los estilos)
+class Cronometro:
+    """Mide las fases del arranque desde INICIO y, si está activo, las muestra en la salida de errores."""
+    def __init__(self, activo):
+        self.activo = activo
+        self.fases = []
+        self._anterior = INICIO
+
+    def marcar(self, fase):
+        ahora = perf_counter()
+        self.fases.append((fase, ahora - self._anterior))
+        if self.activo:
+            print(f"[arranque] {fase}: {(ahora - self._anterior) * 1000:.1f} ms "
+                  f"(total {(ahora - INICIO) * 1000:.1f} ms)", file=sys.stderr)
+        self._anterior = ahora
+
+
+def abrir_gui(argv, cronometro):
+    """Importa Qt y la interfaz, abre la ventana principal y ejecuta el bucle de eventos."""
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+    cronometro.marcar("importar PySide6")
+    from gui import MainWindow
+    cronometro.marcar("importar gui")
+
+    app = QApplication(argv)
+    cronometro.marcar("crear QApplication")
     window = MainWindow()
+    cronometro.marcar("construir la ventana")
     window.show()
+    # El primer evento se atiende cuando la ventana ya está en pantalla y responde
+    QTimer.singleShot(0, lambda: cronometro.marcar("mostrar la ventana (primer evento)"))
+    return app.exec()
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    tiempos = "--tiempos" in argv
+    if tiempos:
+        argv.remove("--tiempos")
+    cronometro = Cronometro(tiempos)
+    cronometro.marcar("iniciar el lanzador")
+
+    if argv and argv[0] in OPCIONES_AYUDA:
+        print(AYUDA)
+        return 0
+
+    if argv and argv[0] in COMANDOS_CLI:
+        import cli
+        cronometro.marcar("importar cli")
+        codigo = cli.main(argv)
+        cronometro.marcar(f"ejecutar '{argv[0]}'")
+        return codigo
+    if argv and argv[0] == COMANDO_SERVICIO:
+        import servicio
+        cronometro.marcar("importar servicio")
+        return servicio.main(argv[1:])
+    if argv:
+        # La interfaz no admite argumentos: cualquier otro es un error, no un motivo para cargar Qt
+        print(f"{AYUDA}\n\nmain.py: error: orden desconocida {argv[0]!r}", file=sys.stderr)
+        return 2
+    return abrir_gui([sys.argv[0]], cronometro)
+
 
-    #Ejecutamos la aplicación
-    sys.exit(app.exec())
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+"""
+Simulación con varias CPU (SMP).
+
+Cada núcleo tiene su propia cola de listos (una instancia de la política
+elegida, ver 'politicas.py'), así que funciona con todos los algoritmos. Las
+llegadas se asignan al núcleo menos cargado y un núcleo que se queda sin
+trabajo roba un proceso en espera del núcleo con la cola más larga.
+
+Igual que 'MotorEventos', el motor avanza por eventos: en cada instante solo
+se atiende a los núcleos en los que algo cambia (termina o vence el quantum
+de su proceso, o recibe una llegada), y el núcleo menos cargado y el de cola
+más larga se obtienen de montículos, de modo que el coste por evento es
+O(log núcleos) y no depende del total de núcleos ni de procesos. No depende
+de Qt.
+"""
+from array import array
+import heapq
+
+from core import LIMITE_TIEMPO_POR_DEFECTO, TablaProcesos
+from estadisticas import calcular_estadisticas
+from politicas import Politica, crear_politica
+
+
+class _Extremo:
+    """
+    Núcleo con el menor valor asociado (o el mayor, con 'maximo=True'),
+    desempatando por número de núcleo. Las entradas obsoletas del montículo
+    se descartan al consultar, así que actualizar cuesta O(log n).
+    """
+    def __init__(self, n, maximo=False):
+        self._signo = -1 if maximo else 1
+        self.valores = [0] * n
+        self._heap = [(0, c) for c in range(n)]
+
+    def actualizar(self, c, valor):
+        if valor == self.valores[c]:
+            return
+        self.valores[c] = valor
+        heapq.heappush(self._heap, (self._signo * valor, c))
+        if len(self._heap) > 4 * len(self.valores) + 64:
+            # Demasiadas entradas obsoletas: se reconstruye con las vigentes
+            self._heap = [(self._signo * v, c) for c, v in enumerate(self.valores)]
+            heapq.heapify(self._heap)
+
+    def extremo(self):
+        heap = self._heap
+        while heap[0][0] != self._signo * self.valores[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][1]
+
+
+class Nucleo:
+    """Estado y contadores de una CPU."""
+    __slots__ = ("politica", "proceso_en_cpu", "quantum_timer", "desde", "version", "inicio_tramo",
+                 "tramos", "ocupado", "despachos", "migraciones_entrantes", "migraciones_salientes", "terminados")
+
+    def __init__(self, politica):
+        self.politica = politica
+        self.proceso_en_cpu = None
+        self.quantum_timer = 0
+        self.desde = 0  # Instante hasta el que está descontado el trabajo del proceso en CPU
+        self.version = 0  # Invalida los eventos programados antes de la última decisión
+        self.inicio_tramo = 0
+        self.tramos = []  # (pid, inicio, fin) ejecutados en este núcleo
+        self.ocupado = 0
+        self.despachos = 0
+        self.migraciones_entrantes = 0
+        self.migraciones_salientes = 0
+        self.terminados = 0
+
+
+class MotorMultinucleo:
+    """
+    Simulación por eventos con 'nucleos' CPU sobre una 'TablaProcesos'
+    ordenada por llegada. 'ejecutar' la lleva hasta el final (o el límite).
+    """
+    def __init__(self, tabla, algoritmo, quantum=2, limite_tiempo=None, nucleos=2):
+        if nucleos < 1:
+            raise ValueError("Se necesita al menos un núcleo.")
+        self.tabla = tabla
+        self.algoritmo = algoritmo
+        self.quantum = quantum
+        self.limite_tiempo = limite_tiempo
+
+        tabla.reiniciar()
+        self.tiempo = 0
+        self.siguiente_llegada = 0
+        self.nucleos = [Nucleo(crear_politica(algoritmo, tabla, quantum)) for _ in range(nucleos)]
+        politica = self.nucleos[0].politica
+        self._con_aviso = type(politica).al_ejecutar is not Politica.al_ejecutar
+        self._eventos = []  # Montículo (instante, núcleo, versión) de finalizaciones y vencimientos
+        self._carga = _Extremo(nucleos)  # Procesos asignados a cada núcleo (en cola + en CPU)
+        self._espera = _Extremo(nucleos, maximo=True)  # Longitud de cada cola de listos
+        self.finalizados = array("q")
+
+    def _actualizar_carga(self, c):
+        nucleo = self.nucleos[c]
+        en_cola = len(nucleo.politica)
+        self._espera.actualizar(c, en_cola)
+        self._carga.actualizar(c, en_cola + (nucleo.proceso_en_cpu is not None))
+
+    def _sincronizar(self, c):
+        """Descuenta el trabajo hecho por el núcleo hasta el instante actual."""
+        nucleo = self.nucleos[c]
+        i = nucleo.proceso_en_cpu
+        duracion = self.tiempo - nucleo.desde
+        if i is not None and duracion > 0:
+            restantes = self.tabla.restantes
+            restantes[i] -= duracion
+            nucleo.quantum_timer += duracion
+            nucleo.ocupado += duracion
+            if restantes[i] <= 0:
+                self.tabla.finalizaciones[i] = self.tiempo
+                self.finalizados.append(i)
+                nucleo.terminados += 1
+                self._liberar(nucleo)
+            if self._con_aviso:
+                nucleo.politica.al_ejecutar(i, duracion, nucleo.desde)
+        nucleo.desde = self.tiempo
+
+    def _liberar(self, nucleo):
+        nucleo.tramos.append((self.tabla.pids[nucleo.proceso_en_cpu], nucleo.inicio_tramo, self.tiempo))
+        nucleo.proceso_en_cpu = None
+        nucleo.quantum_timer = 0
+
+    def _decidir(self, c):
+        """Desalojo y despacho del núcleo en el instante actual, como 'MotorEventos.decidir'."""
+        nucleo = self.nucleos[c]
+        politica = nucleo.politica
+        i = nucleo.proceso_en_cpu
+        if i is not None and politica.expropiativa and politica.debe_desalojar(i, nucleo.quantum_timer, self.tiempo):
+            politica.reencolar(i, self.tiempo, nucleo.quantum_timer)
+            self._liberar(nucleo)
+        if nucleo.proceso_en_cpu is None and politica:
+            i = nucleo.proceso_en_cpu = politica.elegir(self.tiempo)
+            nucleo.quantum_timer = 0
+            nucleo.despachos += 1
+            nucleo.inicio_tramo = self.tiempo
+            # Si vuelve a entrar el mismo proceso (quantum vencido sin competencia) se prolonga su tramo
+            if nucleo.tramos and nucleo.tramos[-1][0] == self.tabla.pids[i] and nucleo.tramos[-1][2] == self.tiempo:
+                nucleo.inicio_tramo = nucleo.tramos.pop()[1]
+
+    def _robar(self, c):
+        """Un núcleo ocioso toma un proceso en espera del núcleo con la cola más larga."""
+        victima = self._espera.extremo()
+        if self._espera.valores[victima] == 0:
+            return
+        i = self.nucleos[victima].politica.ceder(self.tiempo)
+        self.nucleos[victima].migraciones_salientes += 1
+        self._actualizar_carga(victima)
+        nucleo = self.nucleos[c]
+        nucleo.politica.admitir(i, self.tiempo)
+        nucleo.migraciones_entrantes += 1
+        self._decidir(c)
+
+    def _programar(self, c):
+        """Programa el próximo evento propio del núcleo (finalización o desalojo)."""
+        nucleo = self.nucleos[c]
+        nucleo.version += 1
+        i = nucleo.proceso_en_cpu
+        if i is None:
+            return
+        duracion = max(self.tabla.restantes[i], 1)
+        limite = nucleo.politica.tiempo_hasta_desalojo(i, nucleo.quantum_timer)
+        if limite is not None:
+            duracion = min(duracion, max(limite, 1))
+        heapq.heappush(self._eventos, (self.tiempo + duracion, c, nucleo.version))
+
+    def _proximo_instante(self):
+        eventos = self._eventos
+        while eventos and eventos[0][2] != self.nucleos[eventos[0][1]].version:
+            heapq.heappop(eventos)
+        candidatos = []
+        if eventos:
+            candidatos.append(eventos[0][0])
+        if self.siguiente_llegada < len(self.tabla):
+            candidatos.append(self.tabla.llegadas[self.siguiente_llegada])
+        return min(candidatos) if candidatos else None
+
+    def ejecutar(self):
+        """Simula hasta que no quede trabajo o se supere 'limite_tiempo'."""
+        llegadas = self.tabla.llegadas
+        n = len(llegadas)
+        while True:
+            instante = self._proximo_instante()
+            if instante is None:
+                return
+            if self.limite_tiempo is not None and instante > self.limite_tiempo:
+                # Como 'MotorEventos', la simulación se corta en limite_tiempo + 1
+                self.tiempo = max(self.tiempo, self.limite_tiempo + 1)
+                for c, nucleo in enumerate(self.nucleos):
+                    if nucleo.proceso_en_cpu is not None:
+                        self._sincronizar(c)
+                        if nucleo.proceso_en_cpu is not None:
+                            self._liberar(nucleo)
+                return
+            self.tiempo = instante
+
+            tocados = set()
+            while self._eventos and self._eventos[0][0] == instante:
+                _, c, version = heapq.heappop(self._eventos)
+                if version == self.nucleos[c].version:
+                    self._sincronizar(c)
+                    self._actualizar_carga(c)
+                    tocados.add(c)
+            while self.siguiente_llegada < n and llegadas[self.siguiente_llegada] <= instante:
+                c = self._carga.extremo()
+                self._sincronizar(c)
+                self.nucleos[c].politica.admitir(self.siguiente_llegada, instante)
+                self.siguiente_llegada += 1
+                self._actualizar_carga(c)
+                tocados.add(c)
+
+            ociosos = []
+            for c in sorted(tocados):
+                self._decidir(c)
+                self._actualizar_carga(c)
+                if self.nucleos[c].proceso_en_cpu is None:
+                    ociosos.append(c)
+            for c in ociosos:
+                self._robar(c)
+                self._actualizar_carga(c)
+            for c in tocados:
+                self._programar(c)
+
+    def estadisticas_nucleos(self):
+        """Lista con las métricas de cada núcleo: ocupación, despachos, migraciones y procesos terminados."""
+        duracion = self.tiempo
+        return [{
+            "nucleo": c,
+            "ocupado": nucleo.ocupado,
+            "utilizacion": nucleo.ocupado / duracion if duracion > 0 else 0.0,
+            "despachos": nucleo.despachos,
+            "migraciones_entrantes": nucleo.migraciones_entrantes,
+            "migraciones_salientes": nucleo.migraciones_salientes,
+            "terminados": nucleo.terminados,
+        } for c, nucleo in enumerate(self.nucleos)]
+
+
+class PlanificadorMultinucleo:
+    """
+    Equivalente a 'Planificador' con varias CPU:
+
+        planificador = PlanificadorMultinucleo(procesos, "SRTF", nucleos=8)
+        estadisticas = planificador.ejecutar_completa()
+        planificador.estadisticas_nucleos  # Utilización y migraciones por núcleo
+        planificador.tramos_por_nucleo     # Cronograma: una fila de (pid, inicio, fin) por núcleo
+
+    Las estadísticas por proceso tienen el formato de 'Planificador'; en los
+    agregados, 'utilizacion_cpu' es la utilización media de los núcleos.
+    """
+    def __init__(self, procesos, algoritmo, quantum=2, limite_tiempo=LIMITE_TIEMPO_POR_DEFECTO, nucleos=2):
+        if not isinstance(procesos, TablaProcesos):
+            procesos = TablaProcesos.desde_procesos(procesos)
+        self.tabla = procesos.ordenada_por_llegada()
+        self.algoritmo = algoritmo
+        self.quantum = quantum
+        self.limite_tiempo = limite_tiempo
+        self.nucleos = nucleos
+        self.duracion = 0
+        self.estadisticas_nucleos = []
+        self.tramos_por_nucleo = []
+
+    def ejecutar_completa(self, columnar=False):
+        """Simula hasta el final y devuelve las estadísticas por proceso (o un 'EstadisticasColumnares')."""
+        motor = MotorMultinucleo(self.tabla, self.algoritmo, self.quantum, self.limite_tiempo, self.nucleos)
+        motor.ejecutar()
+        self.duracion = motor.tiempo
+        self.estadisticas_nucleos = motor.estadisticas_nucleos()
+        self.tramos_por_nucleo = [nucleo.tramos for nucleo in motor.nucleos]
+        estadisticas = self.estadisticas_columnares()
+        return estadisticas if columnar else estadisticas.como_dict()
+
+    def estadisticas_columnares(self):
+        estadisticas = calcular_estadisticas(self.tabla, self.duracion)
+        estadisticas.agregados["utilizacion_cpu"] /= self.nucleos
+        return estadisticas
@@ -0,0 +1,98 @@
+"""
+Acceso aleatorio a cualquier instante de una simulación.
+
+'SimulacionNavegable' recorre la simulación una vez por eventos, guardando el
+cronograma completo y puntos de control dispersos. Después, el estado de
+cualquier instante se obtiene restaurando el punto de control anterior y
+reproduciendo como mucho 'intervalo' unidades de tiempo, sin importar lo
+lejos que esté ese instante del comienzo. No depende de Qt.
+"""
+from bisect import bisect_right
+
+from core import MotorEventos, Planificador
+
+INTERVALO_POR_DEFECTO = 256  # Unidades de tiempo entre puntos de control
+
+
+class SimulacionNavegable:
+    """
+    Simulación consultable por instante:
+
+        navegable = SimulacionNavegable(planificador)
+        visibles, restante = navegable.estado_en(40000)
+        for paso in navegable.pasos_desde(nuevo_planificador, 40000): ...
+
+    Trabaja sobre tablas que comparten las columnas fijas de la carga del
+    planificador recibido, así que no interfiere con una simulación de ese
+    planificador que se esté ejecutando en otro hilo.
+    """
+    def __init__(self, planificador, intervalo=INTERVALO_POR_DEFECTO):
+        self.planificador = Planificador(planificador.tabla.compartida(), planificador.algoritmo,
+                                         planificador.quantum, planificador.limite_tiempo)
+        self.planificador.intervalo_puntos_control = intervalo
+        self.cronograma, self.estadisticas = self.planificador.ejecutar_cronograma()
+        self.num_ticks = self.cronograma.num_ticks
+        self._tiempos = [punto.tiempo for punto in self.planificador.puntos_control]
+
+        # Motor reutilizable para las consultas y filas que cada consulta modificó
+        tabla = self.planificador.tabla.compartida()
+        self._motor = MotorEventos(tabla, planificador.algoritmo, planificador.quantum, planificador.limite_tiempo)
+        self._modificadas = set()
+
+    @property
+    def puntos_control(self):
+        return self.planificador.puntos_control
+
+    def punto_previo(self, tiempo):
+        """Último punto de control en o antes de 'tiempo'."""
+        return self.puntos_control[max(bisect_right(self._tiempos, tiempo) - 1, 0)]
+
+    def _restablecer_filas(self):
+        tabla = self._motor.tabla
+        for i in self._modificadas:
+            tabla.restantes[i] = tabla.rafagas[i]
+            tabla.finalizaciones[i] = 0
+        self._modificadas.clear()
+
+    def estado_en(self, tiempo):
+        """
+        Estado del instante 'tiempo' como (visibles, tiempo_restante_total):
+        'visibles' tiene 'X' para el proceso en CPU y la posición en la cola
+        para los que esperan; el resto de procesos están vacíos.
+        """
+        if not 0 <= tiempo < self.num_ticks:
+            raise IndexError(f"instante fuera de la simulación (0 a {self.num_ticks - 1})")
+        motor = self._motor
+        self._restablecer_filas()
+        punto = self.punto_previo(tiempo)
+        motor.restaurar(punto, completo=False)
+        self._modificadas.update(punto.restantes)
+        while True:
+            motor.decidir()
+            en_cpu = motor.proceso_en_cpu
+            duracion = motor.duracion_hasta_evento()
+            if motor.tiempo + duracion > tiempo:
+                pendiente_cpu = max(motor.tabla.restantes[en_cpu], 0) if en_cpu is not None else 0
+                return motor.estados_visibles(), motor.trabajo_restante - min(tiempo - motor.tiempo, pendiente_cpu)
+            if en_cpu is not None:
+                self._modificadas.add(en_cpu)
+            motor.ejecutar(duracion)
+
+    def pasos_desde(self, planificador, tiempo, metricas=False):
+        """
+        Generador con los pasos en modo delta a partir de 'tiempo', para
+        continuar una animación cuyo cronograma ya muestra
+        'cronograma.prefijo(..., tiempo)'. 'planificador' debe simular la
+        misma carga; hereda los puntos de control hasta 'tiempo'. Al final
+        devuelve las estadísticas, como 'ejecutar_simulacion' (y, como ella,
+        con 'metricas=True' añade los agregados en curso a cada paso).
+        """
+        punto = planificador.heredar_puntos_control(self.planificador, tiempo)
+        pasos = planificador.ejecutar_simulacion(modo_delta=True, desde=punto, metricas=metricas)
+        while True:
+            try:
+                paso = next(pasos)
+            except StopIteration as e:
+                return e.value
+            if paso[0] >= tiempo:
+                yield paso
@@ -0,0 +1,115 @@
+"""
+Perfilado opcional del motor de simulación.
+
+Un 'PerfilSimulacion' acumula el tiempo de cada fase del motor y contadores
+de planificación. Se activa asignándolo al planificador:
+
+    planificador.perfil = PerfilSimulacion()
+    for paso in planificador.ejecutar_simulacion(): ...
+    print(planificador.perfil.resumen())
+
+Sin perfil el planificador usa 'MotorEventos' tal cual, así que la
+instrumentación no cuesta nada cuando está desactivada.
+"""
+from collections import Counter
+from time import perf_counter
+
+from core import MotorEventos
+
+# Fases medidas: admisión de llegadas, comprobación de desalojos, selección del
+# siguiente proceso, construcción de los estados de cada paso y avance del reloj
+# (incluye el descuento del trabajo restante).
+FASES = ("admision", "desalojo", "despacho", "estados", "ejecucion")
+
+
+class PerfilSimulacion:
+    """Tiempos por fase y contadores de una ejecución del planificador."""
+    def __init__(self):
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.tiempos = dict.fromkeys(FASES, 0.0)
+        self.eventos = 0
+        self.despachos = 0
+        self.desalojos = 0
+        self.cambios_contexto = 0
+        # Longitud de la cola de listos -> unidades de tiempo simuladas con esa longitud
+        self.histograma_cola = Counter()
+        self.max_cola = 0
+
+    def sumar_fase(self, fase, segundos):
+        self.tiempos[fase] += segundos
+
+    def crear_motor(self, tabla, algoritmo, quantum=2, limite_tiempo=None):
+        """Reinicia el perfil y devuelve un motor instrumentado que lo alimenta."""
+        self.reiniciar()
+        return MotorEventosPerfilado(self, tabla, algoritmo, quantum, limite_tiempo)
+
+    def como_dict(self):
+        return {
+            "tiempos": dict(self.tiempos),
+            "tiempo_total": sum(self.tiempos.values()),
+            "eventos": self.eventos,
+            "despachos": self.despachos,
+            "desalojos": self.desalojos,
+            "cambios_contexto": self.cambios_contexto,
+            "max_cola": self.max_cola,
+            "histograma_cola": dict(sorted(self.histograma_cola.items())),
+        }
+
+    def resumen(self):
+        """Texto legible con las fases ordenadas por tiempo y los contadores."""
+        total = sum(self.tiempos.values()) or 1.0
+        lineas = [f"{fase:<10} {segundos * 1000:9.2f} ms  {segundos / total:6.1%}"
+                  for fase, segundos in sorted(self.tiempos.items(), key=lambda f: -f[1])]
+        lineas.append(f"Eventos: {self.eventos}  Despachos: {self.despachos}  Desalojos: {self.desalojos}  "
+                      f"Cambios de contexto: {self.cambios_contexto}")
+        simulado = sum(self.histograma_cola.values())
+        if simulado:
+            media = sum(longitud * t for longitud, t in self.histograma_cola.items()) / simulado
+            lineas.append(f"Cola de listos: media {media:.2f}, máxima {self.max_cola}")
+        return "\n".join(lineas)
+
+
+class MotorEventosPerfilado(MotorEventos):
+    """'MotorEventos' que mide cada fase y cuenta despachos, desalojos y cambios de contexto."""
+    def __init__(self, perfil, tabla, algoritmo, quantum=2, limite_tiempo=None):
+        super().__init__(tabla, algoritmo, quantum, limite_tiempo)
+        self.perfil = perfil
+        self._ultimo_en_cpu = None
+
+    def admitir(self):
+        inicio = perf_counter()
+        super().admitir()
+        self.perfil.tiempos["admision"] += perf_counter() - inicio
+
+    def desalojar(self):
+        inicio = perf_counter()
+        desalojo = super().desalojar()
+        self.perfil.tiempos["desalojo"] += perf_counter() - inicio
+        if desalojo:
+            self.perfil.desalojos += 1
+        return desalojo
+
+    def despachar(self):
+        inicio = perf_counter()
+        despacho = super().despachar()
+        self.perfil.tiempos["despacho"] += perf_counter() - inicio
+        if despacho:
+            self.perfil.despachos += 1
+            # Solo hay cambio de contexto si la CPU pasa a un proceso distinto
+            if self._ultimo_en_cpu is not None and self._ultimo_en_cpu != self.proceso_en_cpu:
+                self.perfil.cambios_contexto += 1
+            self._ultimo_en_cpu = self.proceso_en_cpu
+        return despacho
+
+    def ejecutar(self, duracion):
+        perfil = self.perfil
+        perfil.eventos += 1
+        longitud = len(self.politica)
+        perfil.histograma_cola[longitud] += duracion
+        if longitud > perfil.max_cola:
+            perfil.max_cola = longitud
+        inicio = perf_counter()
+        super().ejecutar(duracion)
+        perfil.tiempos["ejecucion"] += perf_counter() - inicio
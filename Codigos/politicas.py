@@ -0,0 +1,304 @@
+"""
+Políticas de planificación.
+
+Cada política decide qué proceso ocupa la CPU y guarda su propia estructura
+de procesos listos (índices de fila de una 'TablaProcesos'). 'MotorEventos'
+solo habla con la política a través de estos ganchos, así que añadir una
+política nueva no toca el bucle del motor:
+
+  - admitir(i, tiempo): el proceso i llega a la cola de listos.
+  - reencolar(i, tiempo, quantum_timer): el proceso i vuelve a la cola tras
+    ser desalojado (por defecto, igual que 'admitir').
+  - elegir(tiempo): extrae el siguiente proceso a despachar.
+  - debe_desalojar(i, quantum_timer, tiempo): si el proceso en CPU debe dejarla.
+    Solo se consulta si la política es 'expropiativa'.
+  - tiempo_hasta_desalojo(i, quantum_timer): unidades que puede ejecutar el
+    proceso antes de que 'debe_desalojar' cambie sin que llegue nadie
+    (None si no hay límite); el motor no salta más allá.
+  - al_ejecutar(i, duracion, tiempo): aviso tras ejecutar i 'duracion' unidades desde 'tiempo'
+    (solo se llama si la política lo redefine).
+  - ceder(tiempo): extrae un proceso en espera para que lo ejecute otra CPU
+    (robo de trabajo en 'multinucleo.py'); la política lo olvida.
+
+Para registrar una política nueva basta con añadir su clase a 'POLITICAS'.
+"""
+from collections import deque
+import heapq
+import itertools
+
+# Envejecimiento de 'Prioridad': unidades de tiempo de espera que mejoran en 1
+# la prioridad de un proceso.
+ENVEJECIMIENTO = 10
+# Niveles de 'MLFQ': el nivel k usa un quantum de quantum * 2**k y el último es FCFS.
+NIVELES_MLFQ = 3
+
+
+class Politica:
+    """Interfaz común de las políticas (ver el comentario del módulo)."""
+    nombre = None
+    usa_quantum = False
+    expropiativa = False
+
+    def __init__(self, tabla, quantum=2):
+        self.tabla = tabla
+        self.quantum = quantum
+
+    def admitir(self, i, tiempo):
+        raise NotImplementedError
+
+    def reencolar(self, i, tiempo, quantum_timer):
+        self.admitir(i, tiempo)
+
+    def elegir(self, tiempo):
+        raise NotImplementedError
+
+    def debe_desalojar(self, i, quantum_timer, tiempo):
+        return False
+
+    def tiempo_hasta_desalojo(self, i, quantum_timer):
+        return None
+
+    def al_ejecutar(self, i, duracion, tiempo):
+        pass
+
+    def ceder(self, tiempo):
+        # Se cede el que iba a despacharse a continuación: es el que más tiempo lleva esperando turno
+        return self.elegir(tiempo)
+
+    # --- Estado de la cola de listos ---
+
+    def ordenados(self):
+        """Lista de los procesos en el orden en que serían despachados."""
+        raise NotImplementedError
+
+    def __iter__(self):
+        """Recorre los procesos sin un orden garantizado."""
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def instantanea(self):
+        """Copia del estado de la política para un punto de control."""
+        raise NotImplementedError
+
+    def restaurar(self, instantanea):
+        raise NotImplementedError
+
+
+class PoliticaFIFO(Politica):
+    """Cola FIFO: insertar y despachar en O(1)."""
+    def __init__(self, tabla, quantum=2):
+        super().__init__(tabla, quantum)
+        self._fifo = deque()
+
+    def admitir(self, i, tiempo):
+        self._fifo.append(i)
+
+    def elegir(self, tiempo):
+        return self._fifo.popleft()
+
+    def ordenados(self):
+        return list(self._fifo)
+
+    def __iter__(self):
+        return iter(self._fifo)
+
+    def __len__(self):
+        return len(self._fifo)
+
+    def instantanea(self):
+        return list(self._fifo)
+
+    def restaurar(self, instantanea):
+        self._fifo = deque(instantanea)
+
+
+class PoliticaMonticulo(Politica):
+    """
+    Montículo ordenado por 'clave' (menor primero) que desempata por orden de
+    llegada a la cola, igual que el ordenamiento estable que usaban SJF y
+    SRTF: insertar y despachar en O(log n), consultar el primero en O(1).
+    """
+    def __init__(self, tabla, quantum=2):
+        super().__init__(tabla, quantum)
+        self._heap = []
+        self._secuencia = itertools.count()
+
+    def clave(self, i, tiempo):
+        raise NotImplementedError
+
+    def admitir(self, i, tiempo):
+        heapq.heappush(self._heap, (self.clave(i, tiempo), next(self._secuencia), i))
+
+    def elegir(self, tiempo):
+        return heapq.heappop(self._heap)[2]
+
+    def primero(self):
+        return self._heap[0][2]
+
+    def ordenados(self):
+        return [entrada[2] for entrada in sorted(self._heap)]
+
+    def __iter__(self):
+        return (entrada[2] for entrada in self._heap)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def instantanea(self):
+        siguiente = next(self._secuencia)
+        self._secuencia = itertools.count(siguiente)
+        return list(self._heap), siguiente
+
+    def restaurar(self, instantanea):
+        contenido, siguiente = instantanea
+        self._heap = list(contenido)
+        self._secuencia = itertools.count(siguiente)
+
+
+class FCFS(PoliticaFIFO):
+    """First-Come, First-Served, no expropiativo."""
+    nombre = "FCFS"
+
+
+class RoundRobin(PoliticaFIFO):
+    """Turnos de 'quantum' unidades; al vencer, el proceso vuelve al final de la cola."""
+    nombre = "Round Robin"
+    usa_quantum = True
+    expropiativa = True
+
+    def debe_desalojar(self, i, quantum_timer, tiempo):
+        return quantum_timer >= self.quantum
+
+    def tiempo_hasta_desalojo(self, i, quantum_timer):
+        return self.quantum - quantum_timer
+
+
+class SJF(PoliticaMonticulo):
+    """Shortest Job First, no expropiativo: primero la ráfaga total más corta."""
+    nombre = "SJF"
+
+    def clave(self, i, tiempo):
+        return self.tabla.rafagas[i]
+
+
+class SRTF(PoliticaMonticulo):
+    """Shortest Remaining Time First: desaloja si llega alguien con menos tiempo restante."""
+    nombre = "SRTF"
+    expropiativa = True
+
+    def clave(self, i, tiempo):
+        # La clave se evalúa al insertar: el restante no cambia mientras espera
+        return self.tabla.restantes[i]
+
+    def debe_desalojar(self, i, quantum_timer, tiempo):
+        restantes = self.tabla.restantes
+        return bool(self._heap) and restantes[i] > restantes[self.primero()]
+
+
+class Prioridad(PoliticaMonticulo):
+    """
+    Prioridad no expropiativa (menor valor = más urgente) con envejecimiento:
+    la prioridad efectiva de un proceso mejora en 1 por cada ENVEJECIMIENTO
+    unidades que pasa en la cola. Como todos envejecen al mismo ritmo,
+    ordenar por 'prioridad - (ahora - entrada) / ENVEJECIMIENTO' equivale a
+    ordenar por la clave fija 'prioridad * ENVEJECIMIENTO + entrada' (entera,
+    sin errores de redondeo en los empates), así que basta un montículo y
+    nadie espera indefinidamente.
+    """
+    nombre = "Prioridad"
+
+    def clave(self, i, tiempo):
+        return self.tabla.prioridades[i] * ENVEJECIMIENTO + tiempo
+
+
+class MLFQ(Politica):
+    """
+    Multilevel Feedback Queue con NIVELES_MLFQ colas FIFO. Los procesos
+    entran en el nivel 0; si agotan el quantum de su nivel (quantum * 2**k)
+    bajan al siguiente, y el último nivel es FCFS. Un proceso en CPU cede el
+    paso si aparece alguien en un nivel superior y vuelve a su mismo nivel.
+    Todas las operaciones son O(1) (el número de niveles es fijo).
+    """
+    nombre = "MLFQ"
+    usa_quantum = True
+    expropiativa = True
+
+    def __init__(self, tabla, quantum=2):
+        super().__init__(tabla, quantum)
+        self._niveles = [deque() for _ in range(NIVELES_MLFQ)]
+        self._nivel_de = {}  # Nivel de cada proceso que está en el sistema
+
+    def _quantum_nivel(self, nivel):
+        return None if nivel == NIVELES_MLFQ - 1 else self.quantum * 2 ** nivel
+
+    def admitir(self, i, tiempo):
+        self._nivel_de[i] = 0
+        self._niveles[0].append(i)
+
+    def reencolar(self, i, tiempo, quantum_timer):
+        nivel = self._nivel_de[i]
+        quantum = self._quantum_nivel(nivel)
+        if quantum is not None and quantum_timer >= quantum:
+            nivel += 1
+            self._nivel_de[i] = nivel
+        self._niveles[nivel].append(i)
+
+    def elegir(self, tiempo):
+        for cola in self._niveles:
+            if cola:
+                return cola.popleft()
+        raise IndexError("no hay procesos listos")
+
+    def debe_desalojar(self, i, quantum_timer, tiempo):
+        nivel = self._nivel_de[i]
+        quantum = self._quantum_nivel(nivel)
+        if quantum is not None and quantum_timer >= quantum:
+            return True
+        return any(self._niveles[k] for k in range(nivel))
+
+    def tiempo_hasta_desalojo(self, i, quantum_timer):
+        quantum = self._quantum_nivel(self._nivel_de[i])
+        return None if quantum is None else quantum - quantum_timer
+
+    def al_ejecutar(self, i, duracion, tiempo):
+        if self.tabla.restantes[i] <= 0:
+            del self._nivel_de[i]
+
+    def ceder(self, tiempo):
+        i = self.elegir(tiempo)
+        del self._nivel_de[i]
+        return i
+
+    def ordenados(self):
+        return [i for cola in self._niveles for i in cola]
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._niveles)
+
+    def __len__(self):
+        return sum(len(cola) for cola in self._niveles)
+
+    def instantanea(self):
+        en_cola = [list(cola) for cola in self._niveles]
+        # Solo los procesos en el sistema tienen nivel, así que la copia es O(cola)
+        return en_cola, dict(self._nivel_de)
+
+    def restaurar(self, instantanea):
+        en_cola, nivel_de = instantanea
+        self._niveles = [deque(cola) for cola in en_cola]
+        self._nivel_de = dict(nivel_de)
+
+
+# Políticas disponibles por nombre, en el orden en que se ofrecen.
+POLITICAS = {clase.nombre: clase for clase in (FCFS, SJF, SRTF, RoundRobin, Prioridad, MLFQ)}
+
+
+def crear_politica(algoritmo, tabla, quantum=2):
+    """Instancia la política registrada con el nombre 'algoritmo'."""
+    try:
+        clase = POLITICAS[algoritmo]
+    except KeyError:
+        raise ValueError(f"algoritmo desconocido: {algoritmo!r}") from None
+    return clase(tabla, quantum)
@@ -0,0 +1,118 @@
+"""
+Ejecución de la simulación en un hilo aparte.
+
+'SimulacionEnSegundoPlano' consume el generador de 'Planificador.ejecutar_simulacion'
+en un hilo trabajador y entrega los pasos por lotes a través de una cola
+acotada: si el consumidor (la GUI) va más lento, el trabajador se detiene
+hasta que haya sitio, así que la memoria ocupada no crece con la duración
+de la simulación. No depende de Qt.
+"""
+from collections import deque
+import queue
+import threading
+import time
+
+TAM_LOTE = 256  # Pasos por lote como máximo
+ESPERA_LOTE_S = 0.02  # Un lote incompleto se entrega tras este tiempo para no retrasar la animación
+MAX_LOTES = 8  # Lotes en la cola antes de que el trabajador tenga que esperar
+INTERVALO_CANCELACION_S = 0.05  # Cada cuánto comprueba la cancelación un trabajador bloqueado
+
+
+class SimulacionEnSegundoPlano:
+    """
+    Ejecuta un generador de pasos en un hilo trabajador. Uso típico:
+
+        simulacion = SimulacionEnSegundoPlano(planificador.ejecutar_simulacion(modo_delta=True)).iniciar()
+        pasos = simulacion.tomar(100)  # No bloquea: solo lo ya calculado
+        ...
+        if simulacion.agotada: estadisticas = simulacion.resultado
+
+    Los pasos se entregan en orden y 'resultado' guarda el valor de 'return'
+    del generador. Un error en el trabajador se vuelve a lanzar en 'tomar'.
+    """
+    def __init__(self, pasos, tam_lote=TAM_LOTE, max_lotes=MAX_LOTES):
+        self._pasos = pasos
+        self._tam_lote = tam_lote
+        self._cola = queue.Queue(maxsize=max_lotes)
+        self._cancelada = threading.Event()
+        self._hilo = threading.Thread(target=self._producir, name="simulacion", daemon=True)
+        self._pendientes = deque()  # Pasos recibidos que aún no se entregaron
+        self.resultado = None
+        self.terminada = False  # El trabajador ya envió el final (o un error)
+
+    def iniciar(self):
+        self._hilo.start()
+        return self
+
+    # --- Hilo trabajador ---
+
+    def _poner(self, mensaje):
+        """Encola un mensaje esperando si la cola está llena. Devuelve False si se canceló mientras tanto."""
+        while not self._cancelada.is_set():
+            try:
+                self._cola.put(mensaje, timeout=INTERVALO_CANCELACION_S)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _producir(self):
+        lote = []
+        inicio_lote = time.perf_counter()
+        try:
+            while not self._cancelada.is_set():
+                try:
+                    lote.append(next(self._pasos))
+                except StopIteration as e:
+                    if not lote or self._poner(("pasos", lote)):
+                        self._poner(("fin", e.value))
+                    return
+                if len(lote) >= self._tam_lote or time.perf_counter() - inicio_lote > ESPERA_LOTE_S:
+                    if not self._poner(("pasos", lote)):
+                        return
+                    lote = []
+                    inicio_lote = time.perf_counter()
+        except Exception as e:
+            self._poner(("error", e))
+        finally:
+            if self._cancelada.is_set():
+                self._pasos.close()
+
+    # --- Hilo consumidor ---
+
+    def _recibir(self, tipo, valor):
+        if tipo == "pasos":
+            self._pendientes.extend(valor)
+        elif tipo == "fin":
+            self.resultado = valor
+            self.terminada = True
+        else:
+            self.terminada = True
+            raise valor
+
+    def tomar(self, max_pasos, bloquear=False):
+        """
+        Devuelve hasta 'max_pasos' pasos. Sin 'bloquear' solo entrega los que
+        el trabajador ya calculó (puede ser una lista vacía); con 'bloquear'
+        espera hasta reunirlos o hasta que termine la simulación.
+        """
+        while len(self._pendientes) < max_pasos and not self.terminada:
+            try:
+                tipo, valor = self._cola.get(block=bloquear)
+            except queue.Empty:
+                break
+            self._recibir(tipo, valor)
+        cantidad = min(max_pasos, len(self._pendientes))
+        return [self._pendientes.popleft() for _ in range(cantidad)]
+
+    @property
+    def agotada(self):
+        """True cuando terminó la simulación y ya se entregaron todos sus pasos."""
+        return self.terminada and not self._pendientes
+
+    def cancelar(self, espera=1.0):
+        """Detiene el trabajador y descarta los pasos pendientes. Espera como máximo 'espera' segundos."""
+        self._cancelada.set()
+        if self._hilo.is_alive():
+            self._hilo.join(espera)
+        self._pendientes.clear()
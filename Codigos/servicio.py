@@ -0,0 +1,484 @@
+"""
+Servicio local de simulación sobre HTTP/JSON.
+
+Permite que otras herramientas del mismo equipo envíen cargas y reciban el
+cronograma y las estadísticas sin abrir la interfaz gráfica. Está hecho con
+'asyncio' (un único hilo atiende a todos los clientes) y las simulaciones se
+ejecutan en un pool de procesos. No importa 'gui' ni PySide6.
+
+    python Codigos/servicio.py --puerto 8765 --trabajadores 4
+
+Rutas:
+  - POST /simulaciones: cuerpo {"procesos": [...], "algoritmo": "SRTF",
+    "quantum": 2, "limite_tiempo": null, "cronograma": false}; los procesos
+    tienen los campos de 'cargas.py'. La respuesta es JSON Lines enviado por
+    fragmentos: primero {"tipo": "aceptado", ...} en cuanto el trabajo entra
+    en la cola; después una línea "proceso" por proceso en el orden en que
+    terminan, enviadas mientras la simulación sigue en marcha; al acabar,
+    las de los procesos que no llegaron a terminar, una "tramo" por tramo
+    del cronograma (si se pidió), "agregados" y "fin". Si el trabajo falla
+    llega una línea "error" en su lugar.
+  - GET /estado: trabajos en curso, capacidad y contadores.
+  - GET /algoritmos: algoritmos disponibles.
+
+Dos peticiones idénticas (misma 'cache.huella') mientras la primera sigue en
+curso comparten la misma ejecución, y los resultados terminados se sirven
+desde una 'CacheResultados'. Un cuerpo idéntico byte a byte a uno reciente
+no se vuelve a interpretar, y las respuestas recientes se guardan ya
+codificadas. El cronograma solo se calcula si se pide: registrar la posición
+en la cola de cada proceso cuesta mucho más que la simulación con colas
+largas. Como mucho se admiten 'max_en_cola' trabajos a la vez (en cola o
+ejecutándose); por encima se responde 503.
+"""
+import argparse
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+from time import perf_counter
+
+from core import ALGORITMOS, Planificador
+from cache import CacheResultados, ResultadoSimulacion, huella
+from cargas import MAXIMO_ENTERO, ErrorCarga, filas_desde_registros
+from estadisticas import datos_proceso
+
+MAX_EN_COLA = 64  # Trabajos distintos admitidos a la vez
+MAX_CUERPO = 64 * 2**20  # Bytes como máximo en el cuerpo de una petición
+TIEMPO_LECTURA_S = 30  # Tiempo para recibir la petición completa
+LINEAS_POR_FRAGMENTO = 512  # Líneas JSON por fragmento de la respuesta
+INTERVALO_ENVIO_S = 0.2  # Los procesos terminados se envían al menos con esta frecuencia
+CUERPOS_RECIENTES = 32  # Cuerpos ya interpretados que se recuerdan por su SHA-256
+RESPUESTAS_RECIENTES = 16  # Respuestas ya codificadas que se reutilizan
+
+RAZONES = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 503: "Service Unavailable"}
+
+
+class ErrorPeticion(Exception):
+    """Petición que se contesta con un código de error HTTP."""
+    def __init__(self, estado, mensaje):
+        super().__init__(mensaje)
+        self.estado = estado
+        self.mensaje = mensaje
+
+
+class EmisorFinalizados:
+    """
+    'al_finalizar' del planificador en el proceso del pool: junta los procesos
+    que terminan y manda sus líneas "proceso" por 'cola' en lotes de
+    LINEAS_POR_FRAGMENTO, o antes si pasan INTERVALO_ENVIO_S sin enviar.
+    """
+    def __init__(self, cola):
+        self.cola = cola
+        self.tabla = None
+        self.pendientes = []  # Índices de fila aún no enviados
+        self.ultimo_envio = perf_counter()
+
+    def __call__(self, tabla, indices):
+        self.tabla = tabla
+        self.pendientes.extend(indices)
+        if len(self.pendientes) >= LINEAS_POR_FRAGMENTO or perf_counter() - self.ultimo_envio >= INTERVALO_ENVIO_S:
+            self.enviar()
+
+    def enviar(self):
+        if self.pendientes:
+            tabla = self.tabla
+            pids, llegadas, rafagas, finalizaciones = tabla.pids, tabla.llegadas, tabla.rafagas, tabla.finalizaciones
+            self.cola.put(b"".join(
+                _linea({"tipo": "proceso", "pid": pids[i],
+                        **datos_proceso(tabla.nombre(i), pids[i], llegadas[i], rafagas[i], finalizaciones[i])})
+                for i in self.pendientes))
+            self.pendientes = []
+        self.ultimo_envio = perf_counter()
+
+
+def simular_trabajo(tabla, algoritmo, quantum, limite_tiempo, incluir_cronograma, cola=None):
+    """
+    Se ejecuta en un proceso del pool: simula la carga y devuelve el
+    'ResultadoSimulacion' (sin cronograma si no se pidió). Con 'cola', las
+    líneas de los procesos que terminan se envían por ella sobre la marcha.
+    """
+    planificador = Planificador(tabla, algoritmo, quantum, limite_tiempo)
+    if cola is None:
+        return ResultadoSimulacion.calcular(planificador, incluir_cronograma)
+    planificador.al_finalizar = emisor = EmisorFinalizados(cola)
+    resultado = ResultadoSimulacion.calcular(planificador, incluir_cronograma)
+    emisor.enviar()
+    return resultado
+
+
+def preparar_planificador(cuerpo):
+    """Valida el cuerpo JSON de POST /simulaciones y devuelve (planificador, incluir_cronograma)."""
+    try:
+        peticion = json.loads(cuerpo)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ErrorPeticion(400, f"JSON inválido ({e}).") from None
+    if not isinstance(peticion, dict):
+        raise ErrorPeticion(400, "Se esperaba un objeto JSON.")
+    algoritmo = peticion.get("algoritmo", "FCFS")
+    if algoritmo not in ALGORITMOS:
+        raise ErrorPeticion(400, f"Algoritmo desconocido: {algoritmo!r}. Disponibles: {', '.join(ALGORITMOS)}.")
+    quantum = peticion.get("quantum", 2)
+    if not isinstance(quantum, int) or isinstance(quantum, bool) or not 1 <= quantum <= MAXIMO_ENTERO:
+        raise ErrorPeticion(400, f"El quantum debe ser un entero entre 1 y {MAXIMO_ENTERO}.")
+    limite = peticion.get("limite_tiempo")
+    if limite is not None and (not isinstance(limite, int) or isinstance(limite, bool)
+                               or not 0 <= limite <= MAXIMO_ENTERO):
+        raise ErrorPeticion(400, f"'limite_tiempo' debe ser un entero entre 0 y {MAXIMO_ENTERO} o null.")
+    try:
+        filas = list(filas_desde_registros(peticion.get("procesos"), "procesos"))
+    except ErrorCarga as e:
+        raise ErrorPeticion(400, str(e)) from None
+    return Planificador(filas, algoritmo, quantum, limite), bool(peticion.get("cronograma", False))
+
+
+def _preparar_con_huella(cuerpo):
+    planificador, incluir_cronograma = preparar_planificador(cuerpo)
+    return planificador, incluir_cronograma, huella(planificador)
+
+
+def _linea(datos):
+    return json.dumps(datos, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _lineas_resultado(resultado, incluir_cronograma, con_terminados=True):
+    """
+    Genera las líneas JSON de un resultado en el orden en que se envían: los
+    procesos terminados por orden de finalización (como llegan durante la
+    ejecución) y después los que no terminaron. Sin 'con_terminados' se
+    omiten los primeros, que ya se enviaron sobre la marcha.
+    """
+    terminados = [(pid, datos) for pid, datos in resultado.estadisticas.items() if datos["tf"] > 0]
+    if con_terminados:
+        terminados.sort(key=lambda fila: fila[1]["tf"])
+        for pid, datos in terminados:
+            yield _linea({"tipo": "proceso", "pid": pid, **datos})
+    if len(terminados) < len(resultado.estadisticas):
+        for pid, datos in resultado.estadisticas.items():
+            if datos["tf"] == 0:
+                yield _linea({"tipo": "proceso", "pid": pid, **datos})
+    if incluir_cronograma:
+        for pid, inicio, fin, estado in resultado.cronograma.segmentos():
+            yield _linea({"tipo": "tramo", "pid": pid, "inicio": inicio, "fin": fin, "estado": estado})
+    yield _linea({"tipo": "agregados", **resultado.agregados})
+    yield _linea({"tipo": "fin"})
+
+
+class TrabajoEnCurso:
+    """
+    Ejecución en el pool compartida por todos los clientes que la piden:
+    guarda los lotes de líneas "proceso" que ya mandó el trabajador (para
+    quien se une tarde) y el futuro con el 'ResultadoSimulacion'.
+    """
+    def __init__(self, futuro):
+        self.futuro = futuro
+        self.lotes = []
+        self.cerrado = False  # No llegarán más lotes
+        self._aviso = asyncio.Event()
+
+    def recibir(self, lote):
+        """Añade un lote recibido del trabajador; None indica que no hay más."""
+        if lote is None:
+            self.cerrado = True
+        else:
+            self.lotes.append(lote)
+        self._aviso.set()
+
+    async def lotes_recibidos(self):
+        """Genera los lotes ya recibidos y los que lleguen hasta que el trabajo termina."""
+        enviados = 0
+        while True:
+            while enviados < len(self.lotes):
+                yield self.lotes[enviados]
+                enviados += 1
+            if self.cerrado:
+                return
+            self._aviso.clear()
+            await self._aviso.wait()
+
+
+def _recibir_lotes(cola, bucle, trabajo):
+    """Hilo que pasa al bucle de asyncio los lotes que el trabajador deja en 'cola'."""
+    try:
+        while True:
+            lote = cola.get()
+            bucle.call_soon_threadsafe(trabajo.recibir, lote)
+            if lote is None:
+                return
+    except (EOFError, OSError, RuntimeError):
+        pass  # El servicio se está cerrando
+
+
+class ServicioSimulacion:
+    """Estado del servicio: pool de procesos, trabajos en curso por huella y caché de resultados."""
+    def __init__(self, trabajadores=None, max_en_cola=MAX_EN_COLA, cache=None):
+        # 'spawn': el proceso principal tiene hilos ('asyncio.to_thread') y bifurcarlo no es seguro
+        contexto = multiprocessing.get_context("spawn")
+        self.ejecutor = ProcessPoolExecutor(trabajadores, mp_context=contexto)
+        # Las colas del gestor se pueden pasar a los trabajadores del pool como argumento
+        self.gestor = contexto.Manager()
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.max_en_cola = max_en_cola
+        self.cache = cache if cache is not None else CacheResultados()
+        # Los resultados sin cronograma no se guardan en 'cache' (que los escribe completos en disco)
+        self.cache_estadisticas = CacheResultados()
+        self._en_curso = {}  # (huella, con cronograma) -> 'TrabajoEnCurso'
+        self._cuerpos = OrderedDict()  # SHA-256 del cuerpo -> (planificador, incluir_cronograma, huella)
+        self._respuestas = OrderedDict()  # (huella, con cronograma, con terminados) -> fragmentos ya codificados
+        self.completados = 0
+        self.deduplicados = 0
+        self.rechazados = 0
+
+    def estado(self):
+        return {
+            "trabajos_en_curso": len(self._en_curso),
+            "max_en_cola": self.max_en_cola,
+            "trabajadores": self.trabajadores,
+            "completados": self.completados,
+            "deduplicados": self.deduplicados,
+            "rechazados": self.rechazados,
+            "aciertos_cache": self.cache.aciertos + self.cache_estadisticas.aciertos,
+        }
+
+    async def _interpretar(self, cuerpo):
+        """
+        Devuelve (planificador, incluir_cronograma, huella) del cuerpo, sin
+        volver a interpretarlo si es idéntico a uno reciente.
+        """
+        digesto = hashlib.sha256(cuerpo).digest()
+        preparado = self._cuerpos.get(digesto)
+        if preparado is None:
+            # Construir la tabla ordena la carga: en un hilo para no frenar a los demás clientes
+            try:
+                preparado = await asyncio.to_thread(_preparar_con_huella, cuerpo)
+            except ErrorPeticion:
+                raise
+            except Exception as e:
+                # Un caso que la validación no contempla no debe dejar al cliente sin respuesta
+                raise ErrorPeticion(400, f"No se pudo interpretar la petición ({type(e).__name__}: {e}).") from None
+            self._cuerpos[digesto] = preparado
+            while len(self._cuerpos) > CUERPOS_RECIENTES:
+                self._cuerpos.popitem(last=False)
+        self._cuerpos.move_to_end(digesto)
+        return preparado
+
+    def _en_curso_para(self, clave, incluir_cronograma):
+        # Una ejecución con cronograma también sirve a quien solo pide estadísticas
+        trabajo = self._en_curso.get((clave, True))
+        if trabajo is None and not incluir_cronograma:
+            trabajo = self._en_curso.get((clave, False))
+        return trabajo
+
+    async def _obtener_trabajo(self, planificador, incluir_cronograma, clave):
+        """
+        Devuelve (origen, resultado o 'TrabajoEnCurso') del trabajo con huella
+        'clave'. 'origen' es "cache", "compartido" (se une a una ejecución
+        idéntica en curso) o "nuevo".
+        """
+        trabajo = self._en_curso_para(clave, incluir_cronograma)
+        if trabajo is not None:
+            self.deduplicados += 1
+            return "compartido", trabajo
+        resultado = None if incluir_cronograma else self.cache_estadisticas.obtener(clave)
+        if resultado is None:
+            if self.cache.directorio:
+                resultado = await asyncio.to_thread(self.cache.obtener, clave)
+            else:
+                resultado = self.cache.obtener(clave)
+        if resultado is not None:
+            return "cache", resultado
+        trabajo = self._en_curso_para(clave, incluir_cronograma)  # Pudo empezar mientras se leía la caché
+        if trabajo is not None:
+            self.deduplicados += 1
+            return "compartido", trabajo
+        if len(self._en_curso) >= self.max_en_cola:
+            self.rechazados += 1
+            raise ErrorPeticion(503, "Demasiados trabajos en curso; inténtalo más tarde.")
+        bucle = asyncio.get_running_loop()
+        cola = self.gestor.Queue()
+        futuro = bucle.run_in_executor(
+            self.ejecutor, simular_trabajo, planificador.tabla, planificador.algoritmo,
+            planificador.quantum, planificador.limite_tiempo, incluir_cronograma, cola)
+        trabajo = TrabajoEnCurso(futuro)
+        threading.Thread(target=_recibir_lotes, args=(cola, bucle, trabajo), daemon=True).start()
+        self._en_curso[clave, incluir_cronograma] = trabajo
+        futuro.add_done_callback(lambda f: self._al_terminar(clave, incluir_cronograma, f, cola))
+        return "nuevo", trabajo
+
+    def _al_terminar(self, clave, incluir_cronograma, futuro, cola):
+        self._en_curso.pop((clave, incluir_cronograma), None)
+        # El trabajador ya dejó todos sus lotes en la cola: el aviso de cierre va detrás
+        asyncio.get_running_loop().run_in_executor(None, cola.put, None)
+        if futuro.cancelled() or futuro.exception() is not None:
+            return
+        self.completados += 1
+        if not incluir_cronograma:
+            self.cache_estadisticas.guardar(clave, futuro.result())
+        elif self.cache.directorio:
+            asyncio.get_running_loop().run_in_executor(None, self.cache.guardar, clave, futuro.result())
+        else:
+            self.cache.guardar(clave, futuro.result())
+
+    def _fragmentos(self, clave, resultado, incluir_cronograma, con_terminados=True):
+        """Cuerpo de la respuesta en fragmentos de LINEAS_POR_FRAGMENTO líneas, codificado una sola vez."""
+        clave_respuesta = (clave, incluir_cronograma, con_terminados)
+        fragmentos = self._respuestas.get(clave_respuesta)
+        if fragmentos is None:
+            fragmentos, lote = [], []
+            for linea in _lineas_resultado(resultado, incluir_cronograma, con_terminados):
+                lote.append(linea)
+                if len(lote) >= LINEAS_POR_FRAGMENTO:
+                    fragmentos.append(b"".join(lote))
+                    lote = []
+            if lote:
+                fragmentos.append(b"".join(lote))
+            self._respuestas[clave_respuesta] = fragmentos
+            while len(self._respuestas) > RESPUESTAS_RECIENTES:
+                self._respuestas.popitem(last=False)
+        self._respuestas.move_to_end(clave_respuesta)
+        return fragmentos
+
+    async def atender(self, lector, escritor):
+        """Atiende una conexión: una petición por conexión."""
+        try:
+            try:
+                metodo, ruta, cuerpo = await asyncio.wait_for(_leer_peticion(lector), TIEMPO_LECTURA_S)
+                if ruta == "/simulaciones":
+                    if metodo != "POST":
+                        raise ErrorPeticion(405, "Usa POST para enviar una simulación.")
+                    await self._simular(escritor, cuerpo)
+                elif ruta in ("/estado", "/algoritmos"):
+                    if metodo != "GET":
+                        raise ErrorPeticion(405, "Usa GET.")
+                    await _responder_json(escritor, 200, self.estado() if ruta == "/estado" else list(ALGORITMOS))
+                else:
+                    raise ErrorPeticion(404, f"Ruta desconocida: {ruta}")
+            except ErrorPeticion as e:
+                await _responder_json(escritor, e.estado, {"error": e.mensaje})
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass  # El cliente se fue o no terminó de enviar: no hay a quién responder
+        finally:
+            escritor.close()
+            try:
+                await escritor.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _simular(self, escritor, cuerpo):
+        planificador, incluir_cronograma, clave = await self._interpretar(cuerpo)
+        origen, trabajo = await self._obtener_trabajo(planificador, incluir_cronograma, clave)
+
+        escritor.write(_cabecera(200, "application/x-ndjson", "Transfer-Encoding: chunked\r\n"))
+        await _escribir_fragmento(escritor, _linea({"tipo": "aceptado", "huella": clave, "origen": origen,
+                                                    "procesos": len(planificador.tabla)}))
+        if origen == "cache":
+            resultado, con_terminados = trabajo, True
+        else:
+            # Los procesos que terminan se reenvían mientras el trabajo sigue en marcha
+            async for lote in trabajo.lotes_recibidos():
+                await _escribir_fragmento(escritor, lote)
+            try:
+                # 'shield': si este cliente se desconecta, la ejecución sigue para los demás
+                resultado, con_terminados = await asyncio.shield(trabajo.futuro), False
+            except Exception as e:
+                await _escribir_fragmento(escritor, _linea({"tipo": "error", "mensaje": str(e)}))
+                await _escribir_fragmento(escritor, b"")
+                return
+        for fragmento in self._fragmentos(clave, resultado, incluir_cronograma, con_terminados):
+            await _escribir_fragmento(escritor, fragmento)  # 'drain' frena si el cliente lee despacio
+        await _escribir_fragmento(escritor, b"")
+
+    def cerrar(self):
+        self.ejecutor.shutdown(cancel_futures=True)
+        self.gestor.shutdown()
+
+
+async def _leer_peticion(lector):
+    """Lee una petición HTTP/1.1 y devuelve (método, ruta, cuerpo)."""
+    linea = await lector.readline()
+    if not linea:
+        raise ConnectionError("conexión cerrada")
+    try:
+        metodo, destino, _ = linea.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise ErrorPeticion(400, "Línea de petición inválida.") from None
+    cabeceras = {}
+    while True:
+        linea = await lector.readline()
+        if linea in (b"\r\n", b"\n", b""):
+            break
+        nombre, _, valor = linea.decode("latin-1").partition(":")
+        cabeceras[nombre.strip().lower()] = valor.strip()
+    try:
+        largo = int(cabeceras.get("content-length", 0))
+    except ValueError:
+        raise ErrorPeticion(400, "Content-Length inválido.") from None
+    if largo > MAX_CUERPO:
+        raise ErrorPeticion(413, f"El cuerpo supera el máximo de {MAX_CUERPO} bytes.")
+    cuerpo = await lector.readexactly(largo) if largo > 0 else b""
+    return metodo.upper(), destino.split("?", 1)[0], cuerpo
+
+
+def _cabecera(estado, tipo, extra=""):
+    return (f"HTTP/1.1 {estado} {RAZONES[estado]}\r\nContent-Type: {tipo}\r\n"
+            f"Connection: close\r\n{extra}\r\n").encode("latin-1")
+
+
+async def _responder_json(escritor, estado, datos):
+    cuerpo = json.dumps(datos, ensure_ascii=False).encode("utf-8")
+    escritor.write(_cabecera(estado, "application/json; charset=utf-8", f"Content-Length: {len(cuerpo)}\r\n") + cuerpo)
+    await escritor.drain()
+
+
+async def _escribir_fragmento(escritor, datos):
+    """Envía un fragmento de 'Transfer-Encoding: chunked'; uno vacío cierra la respuesta."""
+    escritor.write(f"{len(datos):X}\r\n".encode("latin-1") + datos + b"\r\n")
+    await escritor.drain()
+
+
+async def servir(host="127.0.0.1", puerto=8765, trabajadores=None, max_en_cola=MAX_EN_COLA, directorio_cache=None):
+    servicio = ServicioSimulacion(trabajadores, max_en_cola, CacheResultados(directorio=directorio_cache))
+    servidor = await asyncio.start_server(servicio.atender, host, puerto, backlog=1024)
+    direccion = servidor.sockets[0].getsockname()
+    print(f"Servicio de simulación en http://{direccion[0]}:{direccion[1]} "
+          f"({servicio.trabajadores} trabajadores, hasta {max_en_cola} trabajos)", file=sys.stderr)
+    try:
+        # Con SIGTERM también se cierran el pool y el gestor de colas, sin dejar procesos huérfanos
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    except (NotImplementedError, AttributeError):
+        pass  # Windows no admite manejadores de señales en el bucle
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        servicio.cerrar()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio local de simulación (HTTP/JSON).")
+    parser.add_argument("--host", default="127.0.0.1", help="Dirección de escucha (por defecto solo local).")
+    parser.add_argument("--puerto", type=int, default=8765, help="Puerto TCP (por defecto 8765).")
+    parser.add_argument("--trabajadores", "-j", type=int, default=None,
+                        help="Procesos que simulan en paralelo (por defecto, uno por núcleo).")
+    parser.add_argument("--max-en-cola", type=int, default=MAX_EN_COLA,
+                        help="Trabajos distintos admitidos a la vez; el resto recibe 503.")
+    parser.add_argument("--cache", metavar="DIRECTORIO", default=None,
+                        help="Guarda también los resultados en disco, en este directorio.")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(servir(args.host, args.puerto, args.trabajadores, args.max_en_cola, args.cache))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
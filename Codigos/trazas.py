@@ -0,0 +1,322 @@
+"""
+Reproducción de trazas grabadas (llegadas y ráfagas de CPU de equipos
+reales) con cualquier algoritmo, sin cargar la traza entera en memoria.
+
+'LectorTraza' recorre el archivo con 'mmap' y lo interpreta por lotes, así
+que la memoria no depende del tamaño de la traza. Admite dos formatos:
+
+  - CSV con cabecera ('llegada' y 'tiempo_cpu' obligatorias; 'pid' y
+    'prioridad' opcionales, como en 'cargas.py'; el resto de columnas se
+    ignora).
+  - Binario de registros fijos (extensión '.trz'): la cabecera MAGIA_TRAZA
+    seguida de registros little-endian de FORMATO_REGISTRO
+    (pid, llegada, tiempo_cpu, prioridad), todos enteros de 64 bits.
+
+Los procesos se entregan ordenados por llegada (los empates, en el orden del
+archivo). Una traza grabada en varios equipos puede venir algo desordenada:
+se reordena con un montículo de 'ventana' registros, y un registro que
+llega más tarde de lo que cubre la ventana es un 'ErrorCarga'.
+
+'MotorTraza' es un 'MotorEventos' que admite los procesos a medida que los
+lee y reutiliza la fila de cada proceso terminado, así que la tabla solo
+crece hasta el máximo de procesos simultáneos en el sistema; los agregados
+(con percentiles exactos) se acumulan en un 'MetricasHistograma'. No
+depende de Qt:
+
+    python Codigos/cli.py reproducir traza.trz --algoritmos SRTF MLFQ
+"""
+import csv
+import heapq
+import itertools
+import mmap
+import os
+import struct
+from operator import itemgetter
+from time import perf_counter
+
+from cargas import MAXIMO_ENTERO, ErrorCarga, comprobar_horizonte, convertir_entero
+from core import ALGORITMOS, MotorEventos, TablaProcesos
+from estadisticas import MetricasHistograma
+
+MAGIA_TRAZA = b"PRFTRZ01"
+FORMATO_REGISTRO = struct.Struct("<qqqq")  # pid, llegada, tiempo_cpu, prioridad
+VENTANA_REORDEN = 4096  # Registros que se retienen para reordenar por llegada
+REGISTROS_POR_LOTE = 65536  # Registros interpretados de una vez
+
+
+class EstadisticasIngesta:
+    """Bytes y registros leídos de una traza y el tiempo dedicado a interpretarlos."""
+    def __init__(self, ruta, tamano):
+        self.ruta = ruta
+        self.tamano = tamano
+        self.bytes_leidos = 0
+        self.registros = 0
+        self.segundos = 0.0
+
+    @property
+    def registros_por_segundo(self):
+        return self.registros / self.segundos if self.segundos > 0 else 0.0
+
+    @property
+    def mb_por_segundo(self):
+        return self.bytes_leidos / 2**20 / self.segundos if self.segundos > 0 else 0.0
+
+    def como_dict(self):
+        return {
+            "traza": self.ruta,
+            "bytes": self.bytes_leidos,
+            "registros": self.registros,
+            "segundos": self.segundos,
+            "registros_por_segundo": self.registros_por_segundo,
+            "mb_por_segundo": self.mb_por_segundo,
+        }
+
+    def resumen(self):
+        return (f"{self.ruta}: {self.registros} registros, {self.bytes_leidos / 2**20:.1f} MiB en "
+                f"{self.segundos:.2f} s ({self.registros_por_segundo:,.0f} registros/s, {self.mb_por_segundo:.1f} MiB/s)")
+
+
+class LectorTraza:
+    """
+    Recorre una traza y genera (pid, llegada, tiempo_cpu, prioridad) por
+    orden de llegada. Se puede recorrer varias veces (una por algoritmo);
+    'ingesta' acumula las estadísticas de lectura del último recorrido.
+    """
+    def __init__(self, ruta, ventana=VENTANA_REORDEN):
+        if ventana < 0:
+            raise ValueError("La ventana de reordenación no puede ser negativa.")
+        self.ruta = ruta
+        self.ventana = ventana
+        self.binaria = os.path.splitext(ruta)[1].lower() == ".trz"
+        self.ingesta = EstadisticasIngesta(ruta, os.path.getsize(ruta))
+
+    def __iter__(self):
+        self.ingesta = EstadisticasIngesta(self.ruta, os.path.getsize(self.ruta))
+        if self.ingesta.tamano == 0:
+            if self.binaria:
+                raise ErrorCarga(f"{self.ruta}: falta la cabecera de la traza binaria.")
+            return
+        with open(self.ruta, "rb") as archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            if hasattr(mapa, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                # Lectura secuencial: el sistema lee por adelantado y libera las páginas ya usadas
+                mapa.madvise(mmap.MADV_SEQUENTIAL)
+            lotes = self._lotes_binarios(mapa) if self.binaria else self._lotes_csv(mapa)
+            yield from self._ordenar(lotes)
+
+    def _ordenar(self, lotes):
+        """Reordena por llegada con un montículo de 'ventana' registros y entrega los procesos por lotes."""
+        ingesta = self.ingesta
+        pendientes = []  # Montículo de (llegada, orden en el archivo, pid, tiempo_cpu, prioridad)
+        ultima = (-1, 0)
+        while True:
+            inicio = perf_counter()
+            lote = next(lotes, None)
+            if lote is None:
+                # Fin de la traza: se vacía la ventana
+                salida = [heapq.heappop(pendientes) for _ in range(len(pendientes))]
+            else:
+                salida = []
+                for registro in lote:
+                    if len(pendientes) < self.ventana:
+                        heapq.heappush(pendientes, registro)
+                    else:
+                        salida.append(heapq.heappushpop(pendientes, registro))
+            for registro in salida:
+                if registro[0] < ultima[0]:
+                    raise ErrorCarga(
+                        f"{self.ruta}: el registro {registro[1] + 1} (llegada {registro[0]}) está a más de "
+                        f"{self.ventana} registros de su posición por orden de llegada (ya se entregó la "
+                        f"llegada {ultima[0]}); aumenta la ventana de reordenación.")
+                ultima = registro
+            ingesta.segundos += perf_counter() - inicio
+            for llegada, _, pid, tiempo_cpu, prioridad in salida:
+                yield pid, llegada, tiempo_cpu, prioridad
+            if lote is None:
+                return
+
+    @staticmethod
+    def _comprobar_lote(lote, llegada_maxima, trabajo_total, ubicacion):
+        """Acumula la última llegada y el trabajo total tras un lote y aplica 'cargas.comprobar_horizonte'."""
+        if lote:
+            llegada_maxima = max(llegada_maxima, max(lote)[0])  # Los registros empiezan por la llegada
+            trabajo_total += sum(map(itemgetter(3), lote))
+            comprobar_horizonte(ubicacion, llegada_maxima, trabajo_total)
+        return llegada_maxima, trabajo_total
+
+    @staticmethod
+    def _rechazar_campos(campos, indices, ubicacion):
+        """Lanza el 'ErrorCarga' de 'cargas.convertir_entero' para una fila de CSV inválida."""
+        for campo, indice, minimo in zip(("llegada", "tiempo_cpu", "pid", "prioridad"), indices, (0, 1, 0, 0)):
+            if indice is None:
+                continue
+            if indice >= len(campos):
+                raise ErrorCarga(f"{ubicacion}: falta el campo '{campo}' (recibido {campos!r}).")
+            if campos[indice] or campo in ("llegada", "tiempo_cpu"):
+                convertir_entero(campos[indice], campo, ubicacion, minimo)
+        raise ErrorCarga(f"{ubicacion}: valores inválidos {campos!r}.")
+
+    def _lotes_binarios(self, mapa):
+        ruta, tam = self.ruta, FORMATO_REGISTRO.size
+        if mapa[:len(MAGIA_TRAZA)] != MAGIA_TRAZA:
+            raise ErrorCarga(f"{ruta}: no es una traza binaria (cabecera {MAGIA_TRAZA!r} ausente).")
+        if (len(mapa) - len(MAGIA_TRAZA)) % tam:
+            raise ErrorCarga(f"{ruta}: la traza está truncada (el último registro está incompleto).")
+        orden = llegada_maxima = trabajo_total = 0
+        for desde in range(len(MAGIA_TRAZA), len(mapa), tam * REGISTROS_POR_LOTE):
+            # Se copia un bloque acotado: el resto del archivo sigue solo en el mapa
+            bloque = mapa[desde:desde + tam * REGISTROS_POR_LOTE]
+            lote = []
+            for pid, llegada, tiempo_cpu, prioridad in FORMATO_REGISTRO.iter_unpack(bloque):
+                if pid < 0 or llegada < 0 or tiempo_cpu < 1 or prioridad < 0:
+                    raise ErrorCarga(f"{ruta}: registro {orden + 1} inválido (pid={pid}, llegada={llegada}, "
+                                     f"tiempo_cpu={tiempo_cpu}, prioridad={prioridad}).")
+                lote.append((llegada, orden, pid, tiempo_cpu, prioridad))
+                orden += 1
+            llegada_maxima, trabajo_total = self._comprobar_lote(lote, llegada_maxima, trabajo_total,
+                                                                 f"{ruta}: hasta el registro {orden}")
+            self.ingesta.bytes_leidos = desde + len(bloque)
+            self.ingesta.registros = orden
+            yield lote
+
+    def _lotes_csv(self, mapa):
+        try:
+            yield from self._lotes_csv_texto(mapa)
+        except UnicodeDecodeError as e:
+            raise ErrorCarga(f"{self.ruta}: el archivo no está codificado en UTF-8 ({e.reason}).") from None
+        except csv.Error as e:
+            raise ErrorCarga(f"{self.ruta}: CSV inválido ({e}).") from None
+
+    def _lotes_csv_texto(self, mapa):
+        ruta = self.ruta
+        lineas = (linea.decode("utf-8") for linea in iter(mapa.readline, b""))
+        lector = csv.reader(lineas)
+        cabecera = [nombre.strip() for nombre in next(lector, [])]
+        for campo in ("llegada", "tiempo_cpu"):
+            if campo not in cabecera:
+                raise ErrorCarga(f"{ruta}: falta la columna '{campo}' en la cabecera.")
+        c_llegada, c_cpu = cabecera.index("llegada"), cabecera.index("tiempo_cpu")
+        c_pid = cabecera.index("pid") if "pid" in cabecera else None
+        c_prioridad = cabecera.index("prioridad") if "prioridad" in cabecera else None
+        orden = llegada_maxima = trabajo_total = 0
+        while True:
+            filas = list(itertools.islice(lector, REGISTROS_POR_LOTE))
+            if not filas:
+                return
+            lote = []
+            for campos in filas:
+                if not campos:
+                    continue
+                orden += 1
+                try:
+                    llegada, tiempo_cpu = int(campos[c_llegada]), int(campos[c_cpu])
+                    pid = orden if c_pid is None or not campos[c_pid] else int(campos[c_pid])
+                    prioridad = 0 if c_prioridad is None or not campos[c_prioridad] else int(campos[c_prioridad])
+                    valido = (0 <= llegada <= MAXIMO_ENTERO and 1 <= tiempo_cpu <= MAXIMO_ENTERO
+                              and 0 <= pid <= MAXIMO_ENTERO and 0 <= prioridad <= MAXIMO_ENTERO)
+                except (ValueError, IndexError):
+                    valido = False
+                if not valido:
+                    # Camino lento solo para informar del error con las comprobaciones de 'cargas.py'
+                    self._rechazar_campos(campos, (c_llegada, c_cpu, c_pid, c_prioridad), f"{ruta}:{lector.line_num}")
+                lote.append((llegada, orden, pid, tiempo_cpu, prioridad))
+            llegada_maxima, trabajo_total = self._comprobar_lote(lote, llegada_maxima, trabajo_total,
+                                                                 f"{ruta}: hasta la línea {lector.line_num}")
+            self.ingesta.bytes_leidos = mapa.tell()
+            self.ingesta.registros = orden
+            yield lote
+
+
+def escribir_traza_binaria(ruta, procesos):
+    """
+    Escribe una traza binaria a partir de tuplas (pid, llegada, tiempo_cpu,
+    prioridad) y devuelve cuántos registros escribió. No retiene los
+    procesos, así que acepta un generador de cualquier tamaño.
+    """
+    empaquetar = FORMATO_REGISTRO.pack
+    procesos = iter(procesos)
+    cantidad = 0
+    with open(ruta, "wb") as archivo:
+        archivo.write(MAGIA_TRAZA)
+        for lote in iter(lambda: list(itertools.islice(procesos, REGISTROS_POR_LOTE)), []):
+            archivo.write(b"".join(empaquetar(*proceso) for proceso in lote))
+            cantidad += len(lote)
+    return cantidad
+
+
+class MotorTraza(MotorEventos):
+    """
+    'MotorEventos' que toma las llegadas de un iterable ordenado de
+    (pid, llegada, tiempo_cpu, prioridad), como 'LectorTraza', en lugar de
+    una tabla completa. La fila de un proceso que termina se reutiliza para
+    el siguiente que llega, y sus métricas se acumulan en 'metricas'.
+    """
+    def __init__(self, procesos, algoritmo, quantum=2, limite_tiempo=None):
+        super().__init__(TablaProcesos(), algoritmo, quantum, limite_tiempo)
+        self._procesos = iter(procesos)
+        self._proximo = next(self._procesos, None)
+        self._libres = []  # Filas de procesos ya terminados
+        self.metricas = MetricasHistograma()
+        self.admitidos = 0
+        self._trabajo_admitido = 0
+
+    def terminado(self):
+        if self.limite_tiempo is not None and self.tiempo > self.limite_tiempo:
+            return True
+        return self._proximo is None and not self.politica and self.proceso_en_cpu is None
+
+    def admitir(self):
+        tabla = self.tabla
+        while self._proximo is not None and self._proximo[1] <= self.tiempo:
+            pid, llegada, tiempo_cpu, prioridad = self._proximo
+            if self._libres:
+                i = self._libres.pop()
+                tabla.pids[i], tabla.llegadas[i], tabla.rafagas[i] = pid, llegada, tiempo_cpu
+                tabla.prioridades[i], tabla.restantes[i], tabla.finalizaciones[i] = prioridad, tiempo_cpu, 0
+            else:
+                i = len(tabla)
+                tabla.agregar(pid, None, tiempo_cpu, llegada, prioridad)
+            self.politica.admitir(i, self.tiempo)
+            self.admitidos += 1
+            self.trabajo_restante += tiempo_cpu
+            self._trabajo_admitido += tiempo_cpu
+            self._proximo = next(self._procesos, None)
+
+    def duracion_hasta_evento(self):
+        candidatos = []
+        if self._proximo is not None:
+            candidatos.append(self._proximo[1] - self.tiempo)
+        if self.proceso_en_cpu is not None:
+            candidatos.append(max(self.tabla.restantes[self.proceso_en_cpu], 1))
+            limite = self.politica.tiempo_hasta_desalojo(self.proceso_en_cpu, self.quantum_timer)
+            if limite is not None:
+                candidatos.append(max(limite, 1))
+        if self.limite_tiempo is not None:
+            candidatos.append(self.limite_tiempo + 1 - self.tiempo)
+        return max(min(candidatos), 1) if candidatos else 1
+
+    def ejecutar(self, duracion):
+        super().ejecutar(duracion)
+        if self.finalizados:
+            # El proceso terminó: sus métricas pasan a los agregados y su fila queda libre
+            i = self.finalizados.pop()
+            tabla = self.tabla
+            self.metricas.registrar(tabla.llegadas[i], tabla.rafagas[i], tabla.finalizaciones[i])
+            self._libres.append(i)
+
+    def agregados(self):
+        """Agregados hasta el instante actual, con las claves de 'EstadisticasColumnares.agregados'."""
+        return self.metricas.resumen(self.tiempo, self._trabajo_admitido - self.trabajo_restante)
+
+
+def reproducir_traza(lector, algoritmo, quantum=2, limite_tiempo=None):
+    """
+    Simula la traza de 'lector' con un algoritmo y devuelve (agregados,
+    procesos admitidos, segundos de simulación, incluida la lectura).
+    """
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"algoritmo desconocido: {algoritmo!r}")
+    inicio = perf_counter()
+    motor = MotorTraza(lector, algoritmo, quantum, limite_tiempo)
+    while not motor.terminado():
+        motor.avanzar()
+    return motor.agregados(), motor.admitidos, perf_counter() - inicio
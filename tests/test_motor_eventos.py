@@ -0,0 +1,134 @@
+"""
+El motor por eventos debe producir exactamente los mismos pasos y
+estadísticas que el bucle tick a tick original del simulador. La referencia
+de abajo es ese bucle, copiado sin cambios de fondo.
+"""
+from collections import deque
+import random
+
+import pytest
+
+from core import Planificador, Proceso
+
+
+class _ProcesoReferencia:
+    def __init__(self, pid, nombre, tiempo_cpu, llegada):
+        self.pid = pid
+        self.nombre = nombre
+        self.tiempo_cpu_total = tiempo_cpu
+        self.tiempo_restante_cpu = tiempo_cpu
+        self.instante_llegada = llegada
+
+
+def simular_por_ticks(procesos, algoritmo, quantum):
+    """Simulación original tick a tick: genera los pasos y devuelve las estadísticas."""
+    originales = sorted((_ProcesoReferencia(*p) for p in procesos), key=lambda p: p.instante_llegada)
+    tiempo_actual = 0
+    procesos_nuevos = deque(originales)
+    cola_listos = deque()
+    proceso_en_cpu = None
+    quantum_timer = 0
+    instantes_finalizacion = {}
+
+    while procesos_nuevos or cola_listos or proceso_en_cpu:
+        while procesos_nuevos and procesos_nuevos[0].instante_llegada <= tiempo_actual:
+            cola_listos.append(procesos_nuevos.popleft())
+
+        if proceso_en_cpu:
+            if algoritmo == "Round Robin" and quantum_timer >= quantum:
+                cola_listos.append(proceso_en_cpu)
+                proceso_en_cpu = None
+            if algoritmo == "SRTF" and cola_listos:
+                mas_corto = min(cola_listos, key=lambda p: p.tiempo_restante_cpu)
+                if proceso_en_cpu.tiempo_restante_cpu > mas_corto.tiempo_restante_cpu:
+                    cola_listos.append(proceso_en_cpu)
+                    proceso_en_cpu = None
+
+        if not proceso_en_cpu and cola_listos:
+            if algoritmo == "SJF":
+                cola_listos = deque(sorted(cola_listos, key=lambda p: p.tiempo_cpu_total))
+            elif algoritmo == "SRTF":
+                cola_listos = deque(sorted(cola_listos, key=lambda p: p.tiempo_restante_cpu))
+            proceso_en_cpu = cola_listos.popleft()
+            quantum_timer = 0
+
+        cola_visible = cola_listos
+        if algoritmo == "SJF":
+            cola_visible = sorted(cola_listos, key=lambda p: p.tiempo_cpu_total)
+        elif algoritmo == "SRTF":
+            cola_visible = sorted(cola_listos, key=lambda p: p.tiempo_restante_cpu)
+        posiciones = {p.pid: i for i, p in enumerate(cola_visible)}
+        estados = {}
+        for p in originales:
+            if p.pid in instantes_finalizacion or tiempo_actual < p.instante_llegada:
+                estados[p.pid] = ''
+            elif proceso_en_cpu and p.pid == proceso_en_cpu.pid:
+                estados[p.pid] = 'X'
+            elif p.pid in posiciones:
+                estados[p.pid] = str(posiciones[p.pid] + 1)
+            else:
+                estados[p.pid] = ' '
+        restante = ((proceso_en_cpu.tiempo_restante_cpu if proceso_en_cpu else 0)
+                    + sum(p.tiempo_restante_cpu for p in cola_listos)
+                    + sum(p.tiempo_restante_cpu for p in procesos_nuevos))
+        yield tiempo_actual, estados, restante
+
+        if proceso_en_cpu:
+            proceso_en_cpu.tiempo_restante_cpu -= 1
+            quantum_timer += 1
+            if proceso_en_cpu.tiempo_restante_cpu <= 0:
+                instantes_finalizacion[proceso_en_cpu.pid] = tiempo_actual + 1
+                proceso_en_cpu = None
+                quantum_timer = 0
+
+        tiempo_actual += 1
+        if tiempo_actual > 500:
+            break
+
+    estadisticas = {}
+    for p in originales:
+        ti, t = p.instante_llegada, p.tiempo_cpu_total
+        tf = instantes_finalizacion.get(p.pid, 0)
+        T = tf - ti
+        estadisticas[p.pid] = {"proceso": f"{p.nombre} (P{p.pid})", "ti": ti, "t": t, "tf": tf,
+                               "T": T, "Te": T - t, "I": round(t / T, 4) if T > 0 else 0}
+    return estadisticas
+
+
+def _recorrer(pasos):
+    """Lista de pasos y valor devuelto por un generador de simulación."""
+    lista = []
+    while True:
+        try:
+            lista.append(next(pasos))
+        except StopIteration as fin:
+            return lista, fin.value
+
+
+def _cargas(semilla, cantidad):
+    rng = random.Random(semilla)
+    for caso in range(cantidad):
+        larga = caso % 10 == 0  # Algunas cargas superan el límite de 500 instantes
+        procesos = [(i + 1, f"P{i}", rng.randint(1, 80 if larga else 8), rng.randint(0, 300 if larga else 20))
+                    for i in range(rng.randint(0, 12))]
+        rng.shuffle(procesos)
+        yield procesos
+
+
+CASOS = [("FCFS", 2), ("SJF", 2), ("SRTF", 2), ("Round Robin", 1), ("Round Robin", 2), ("Round Robin", 5)]
+
+
+@pytest.mark.parametrize("algoritmo,quantum", CASOS)
+def test_pasos_y_estadisticas_iguales_al_bucle_por_ticks(algoritmo, quantum):
+    for procesos in _cargas(semilla=1, cantidad=150):
+        esperado = _recorrer(simular_por_ticks(procesos, algoritmo, quantum))
+        planificador = Planificador([Proceso(*p) for p in procesos], algoritmo, quantum)
+        assert _recorrer(planificador.ejecutar_simulacion()) == esperado, (procesos, algoritmo, quantum)
+
+
+@pytest.mark.parametrize("algoritmo,quantum", CASOS)
+def test_ejecutar_completa_coincide_con_el_final_de_la_simulacion(algoritmo, quantum):
+    for procesos in _cargas(semilla=2, cantidad=60):
+        _, esperado = _recorrer(simular_por_ticks(procesos, algoritmo, quantum))
+        planificador = Planificador([Proceso(*p) for p in procesos], algoritmo, quantum)
+        assert planificador.ejecutar_completa() == esperado, (procesos, algoritmo, quantum)
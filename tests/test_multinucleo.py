@@ -0,0 +1,51 @@
+"""
+Simulación con varias CPU: con un solo núcleo debe coincidir con
+'Planificador', y con varios el robo de trabajo no puede perder ni duplicar
+tiempo de CPU de ningún proceso.
+"""
+from collections import defaultdict
+import random
+
+import pytest
+
+from core import ALGORITMOS, Planificador
+from multinucleo import PlanificadorMultinucleo
+
+
+def _cargas(semilla, cantidad):
+    rng = random.Random(semilla)
+    for _ in range(cantidad):
+        yield [(i + 1, None, rng.randint(1, 9), rng.randint(0, 40), rng.randint(0, 3))
+               for i in range(rng.randint(0, 15))]
+
+
+@pytest.mark.parametrize("algoritmo", ALGORITMOS)
+@pytest.mark.parametrize("quantum", [1, 3])
+def test_un_nucleo_coincide_con_planificador(algoritmo, quantum):
+    for procesos in _cargas(semilla=4, cantidad=80):
+        esperado = Planificador(procesos, algoritmo, quantum).ejecutar_completa()
+        multinucleo = PlanificadorMultinucleo(procesos, algoritmo, quantum, nucleos=1)
+        assert multinucleo.ejecutar_completa() == esperado, (procesos, algoritmo, quantum)
+
+
+@pytest.mark.parametrize("algoritmo", ALGORITMOS)
+def test_el_robo_de_trabajo_conserva_el_tiempo_de_cpu(algoritmo):
+    migraciones = 0
+    for procesos in _cargas(semilla=5, cantidad=80):
+        planificador = PlanificadorMultinucleo(procesos, algoritmo, 2, None, nucleos=3)
+        estadisticas = planificador.ejecutar_completa()
+
+        ejecutado = defaultdict(int)
+        for tramos in planificador.tramos_por_nucleo:
+            for (_, _, fin), (_, inicio, _) in zip(tramos, tramos[1:]):
+                assert fin <= inicio  # Un núcleo no ejecuta dos procesos a la vez
+            for pid, inicio, fin in tramos:
+                ejecutado[pid] += fin - inicio
+        assert ejecutado == {pid: datos["t"] for pid, datos in estadisticas.items()}
+        assert all(datos["tf"] > 0 for datos in estadisticas.values())
+
+        nucleos = planificador.estadisticas_nucleos
+        assert sum(n["migraciones_entrantes"] for n in nucleos) == sum(n["migraciones_salientes"] for n in nucleos)
+        assert sum(n["terminados"] for n in nucleos) == len(procesos)
+        migraciones += sum(n["migraciones_entrantes"] for n in nucleos)
+    assert migraciones > 0  # Las cargas ejercitan el robo de trabajo
@@ -0,0 +1,47 @@
+"""
+Comportamiento de las políticas con estado propio: los niveles de MLFQ y el
+envejecimiento de Prioridad. Se comprueban los tramos (pid, inicio, fin) que
+produce el motor por eventos en escenarios pequeños hechos a mano.
+"""
+from core import Planificador, Proceso, TablaProcesos
+from politicas import MLFQ
+
+
+def _tramos(procesos, algoritmo, quantum=2):
+    planificador = Planificador([Proceso(*p) for p in procesos], algoritmo, quantum, None)
+    return list(planificador.ejecutar_simulacion_eventos())
+
+
+def test_mlfq_baja_de_nivel_al_agotar_el_quantum():
+    # Quantum 2 en el nivel 0, 4 en el nivel 1 y FCFS en el último
+    tramos = _tramos([(1, "A", 10, 0), (2, "B", 10, 0)], "MLFQ")
+    assert tramos == [(1, 0, 2), (2, 2, 4), (1, 4, 8), (2, 8, 12), (1, 12, 16), (2, 16, 20)]
+
+
+def test_mlfq_desaloja_al_llegar_alguien_a_un_nivel_superior():
+    # A ya está en el último nivel cuando llega B al nivel 0: B entra enseguida
+    tramos = _tramos([(1, "A", 20, 0), (2, "B", 1, 7)], "MLFQ")
+    assert tramos == [(1, 0, 7), (2, 7, 8), (1, 8, 21)]
+
+
+def test_mlfq_conserva_el_nivel_si_lo_desalojan_antes_del_quantum():
+    tabla = TablaProcesos.desde_procesos([(1, None, 20, 0)])
+    politica = MLFQ(tabla, quantum=2)
+    politica.admitir(0, 0)
+    assert politica.elegir(0) == 0
+    politica.reencolar(0, 2, quantum_timer=2)  # Agotó el quantum del nivel 0
+    assert politica.elegir(2) == 0
+    politica.reencolar(0, 3, quantum_timer=1)  # Desalojado en el nivel 1 antes de agotar 4
+    assert politica.instantanea() == ([[], [0], []], {0: 1})
+
+
+def test_prioridad_sin_envejecimiento_suficiente_gana_la_mas_urgente():
+    # X ocupa la CPU hasta 20; B (prioridad 0) llega a tiempo de adelantar a A (prioridad 1)
+    tramos = _tramos([(1, "X", 20, 0), (2, "A", 3, 1, 1), (3, "B", 3, 10, 0)], "Prioridad")
+    assert tramos == [(1, 0, 20), (3, 20, 23), (2, 23, 26)]
+
+
+def test_prioridad_empate_por_envejecimiento_respeta_el_orden_de_llegada():
+    # A lleva 10 unidades esperando (ENVEJECIMIENTO): su prioridad efectiva iguala a la de B
+    tramos = _tramos([(1, "X", 20, 0), (2, "A", 3, 1, 1), (3, "B", 3, 11, 0)], "Prioridad")
+    assert tramos == [(1, 0, 20), (2, 20, 23), (3, 23, 26)]
@@ -0,0 +1,77 @@
+"""
+Puntos de control: reanudar 'ejecutar_simulacion' desde un punto heredado
+tras editar la carga debe producir lo mismo que una ejecución completa, y
+'SimulacionNavegable.estado_en' debe coincidir con el estado paso a paso.
+"""
+import random
+
+import pytest
+
+from core import ALGORITMOS, Planificador
+from navegacion import SimulacionNavegable
+
+
+def _carga(semilla):
+    rng = random.Random(semilla)
+    return [(i + 1, None, rng.randint(1, 9), rng.randint(0, 60), rng.randint(0, 3))
+            for i in range(15)]
+
+
+def _ejecutar(planificador, **opciones):
+    """Devuelve (pasos, estadísticas) de 'ejecutar_simulacion'."""
+    generador = planificador.ejecutar_simulacion(**opciones)
+    pasos = []
+    while True:
+        try:
+            pasos.append(next(generador))
+        except StopIteration as fin:
+            return pasos, fin.value
+
+
+def _planificador(procesos, algoritmo, intervalo):
+    planificador = Planificador(procesos, algoritmo, 2)
+    planificador.intervalo_puntos_control = intervalo
+    return planificador
+
+
+@pytest.mark.parametrize("algoritmo", ALGORITMOS)
+@pytest.mark.parametrize("modo_delta", [False, True])
+def test_reanudar_tras_editar_coincide_con_la_ejecucion_completa(algoritmo, modo_delta):
+    for semilla in range(10):
+        procesos = _carga(semilla)
+        anterior = _planificador(procesos, algoritmo, intervalo=8)
+        _ejecutar(anterior)
+
+        # Editamos el último proceso en llegar: lo anterior a su llegada no cambia
+        pid, nombre, cpu, instante, prioridad = max(procesos, key=lambda p: p[3])
+        nuevos = [p for p in procesos if p[0] != pid] + [(pid, nombre, cpu + 5, instante, prioridad)]
+
+        completo, esperado = _ejecutar(_planificador(nuevos, algoritmo, 8), modo_delta=modo_delta)
+        reanudado = _planificador(nuevos, algoritmo, 8)
+        punto = reanudado.heredar_puntos_control(anterior, instante)
+        assert punto is not None and 0 < punto.tiempo <= instante
+        pasos, estadisticas = _ejecutar(reanudado, modo_delta=modo_delta, desde=punto)
+
+        assert pasos == [paso for paso in completo if paso[0] >= punto.tiempo], (semilla, algoritmo)
+        assert estadisticas == esperado
+
+
+def test_heredar_con_otro_algoritmo_descarta_los_puntos():
+    procesos = _carga(0)
+    anterior = _planificador(procesos, "FCFS", intervalo=8)
+    _ejecutar(anterior)
+    nuevo = _planificador(procesos, "SJF", intervalo=8)
+    assert nuevo.heredar_puntos_control(anterior, 30) is None
+    assert nuevo.puntos_control == []
+
+
+@pytest.mark.parametrize("algoritmo", ALGORITMOS)
+def test_estado_en_coincide_con_el_estado_paso_a_paso(algoritmo):
+    for semilla in range(5):
+        procesos = _carga(semilla)
+        pasos, _ = _ejecutar(Planificador(procesos, algoritmo, 2))
+        navegable = SimulacionNavegable(Planificador(procesos, algoritmo, 2), intervalo=5)
+        # En orden inverso para que cada consulta tenga que volver atrás
+        for tiempo, estados, restante in reversed(pasos):
+            visibles = {pid: valor for pid, valor in estados.items() if valor}
+            assert navegable.estado_en(tiempo) == (visibles, restante), (semilla, algoritmo, tiempo)